@@ -0,0 +1,111 @@
+"""Benchmark decoding of Charge-Amps API responses.
+
+Compares dataclasses_json from_dict on json.loads output with the
+precompiled decoders on orjson.loads output, and checks that both produce
+equal models.
+
+    python benchmarks/decode.py [--sessions N]
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+import types
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import orjson
+
+COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "chargeamps"
+
+
+def load_client():
+    """Import the client module without importing Home Assistant."""
+    package = types.ModuleType("chargeamps")
+    package.__path__ = [str(COMPONENT_DIR)]
+    sys.modules["chargeamps"] = package
+    return importlib.import_module("chargeamps.client")
+
+
+def sessions_payload(count: int) -> list[dict]:
+    start = datetime(2020, 1, 1, tzinfo=UTC)
+    res = []
+    for i in range(count):
+        session_start = start + timedelta(hours=7 * i)
+        res.append(
+            {
+                "id": str(1000000 + i),
+                "chargePointId": "2012345678M",
+                "connectorId": 1 + i % 2,
+                "sessionType": "Free",
+                "totalConsumptionKwh": round(3 + (i % 40) * 0.731, 3),
+                "startTime": session_start.isoformat(),
+                "endTime": (session_start + timedelta(hours=3)).isoformat() if i < count - 1 else None,
+            }
+        )
+    return res
+
+
+def status_payload(connectors: int) -> dict:
+    return {
+        "id": "2012345678M",
+        "status": "Online",
+        "connectorStatuses": [
+            {
+                "chargePointId": "2012345678M",
+                "connectorId": c,
+                "totalConsumptionKwh": 12.5,
+                "status": "Charging",
+                "measurements": [{"phase": f"L{p}", "current": 15.8, "voltage": 231} for p in range(1, 4)],
+                "startTime": "2024-03-01T10:00:00Z",
+                "endTime": None,
+                "sessionId": "123",
+            }
+            for c in range(1, connectors + 1)
+        ],
+    }
+
+
+def bench(name: str, func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<40} {best * 1000:10.2f} ms")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = load_client()
+    cases = [
+        (
+            f"{args.sessions} charging sessions",
+            orjson.dumps(sessions_payload(args.sessions)),
+            lambda raw: [client.ChargingSession.from_dict(x) for x in json.loads(raw)],
+            lambda raw: [client.decode_charging_session(x) for x in orjson.loads(raw)],
+        ),
+        (
+            "1000 chargepoint statuses",
+            orjson.dumps([status_payload(2)] * 1000),
+            lambda raw: [client.ChargePointStatus.from_dict(x) for x in json.loads(raw)],
+            lambda raw: [client.decode_chargepoint_status(x) for x in orjson.loads(raw)],
+        ),
+    ]
+    for name, raw, baseline, fast in cases:
+        assert baseline(raw) == fast(raw), f"{name}: decoded models differ"
+        print(name)
+        old = bench("  json + dataclasses_json from_dict", lambda raw=raw, f=baseline: f(raw), args.repeat)
+        new = bench("  orjson + precompiled decoder", lambda raw=raw, f=fast: f(raw), args.repeat)
+        print(f"  speed-up {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
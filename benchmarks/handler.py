@@ -0,0 +1,129 @@
+"""End-to-end benchmark of ChargeampsHandler against the mock Charge-Amps API.
+
+Reports requests per scan cycle, wall time per cycle, entity update time,
+startup time and peak memory. Requires Home Assistant to be installed.
+
+    python benchmarks/handler.py --chargepoints 20 --connectors 2 --sessions 5000 --latency 0.05 --cycles 5
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from mock_api import MockChargeAmpsApi  # noqa: E402
+
+from custom_components.chargeamps import ChargeampsHandler  # noqa: E402
+from custom_components.chargeamps.client import DEFAULT_CACHE_TTL, ChargeAmpsClient  # noqa: E402
+from custom_components.chargeamps.const import DOMAIN_DATA  # noqa: E402
+from custom_components.chargeamps.sensor import (  # noqa: E402
+    ChargeampsPowerSensor,
+    ChargeampsSensor,
+    ChargeampsTotalEnergy,
+)
+from custom_components.chargeamps.switch import ChargeampsSwitch  # noqa: E402
+
+
+async def setup_handler(hass, client: ChargeAmpsClient, max_concurrent_requests: int) -> ChargeampsHandler:
+    """Set up the handler the same way async_setup does."""
+    hass.data[DOMAIN_DATA] = {}
+    chargepoints = await client.get_chargepoints()
+    clients = {cp.id: client for cp in chargepoints}
+    handler = ChargeampsHandler(hass, clients, False, timedelta(seconds=30), max_concurrent_requests)
+    hass.data[DOMAIN_DATA]["handler"] = handler
+    await handler.sessions.async_load()
+    await handler.update_info(chargepoints)
+    await handler.async_initial_refresh()
+    return handler
+
+
+def create_entities(hass, handler: ChargeampsHandler) -> list:
+    entities = []
+    for cp_id in handler.charge_point_ids:
+        entities.append(ChargeampsTotalEnergy(hass, f"{cp_id}_total_energy", cp_id))
+        for connector in handler.get_chargepoint_info(cp_id).connectors:
+            for entity_class in (ChargeampsSensor, ChargeampsPowerSensor, ChargeampsSwitch):
+                entities.append(entity_class(hass, f"{cp_id}_{connector.connector_id}", cp_id, connector.connector_id))
+    return entities
+
+
+def report(name: str, wall_time: float, requests: int, chargepoints: int, extra: str = "") -> None:
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    print(
+        f"{name:<12} {wall_time * 1000:10.1f} ms {requests:8d} requests "
+        f"{requests / chargepoints:8.2f} requests/chargepoint {peak:8.1f} MiB peak {extra}"
+    )
+    tracemalloc.reset_peak()
+
+
+async def run(args) -> None:
+    api = MockChargeAmpsApi(args.chargepoints, args.connectors, args.sessions, args.latency, args.error_rate)
+    url = await api.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        client = ChargeAmpsClient(
+            email="user@example.com",
+            password="password",
+            api_key="api_key",
+            api_base_url=url,
+            cache_ttl=DEFAULT_CACHE_TTL,
+            rate_limit=args.rate_limit,
+            rate_limit_burst=max(1, int(args.rate_limit)),
+        )
+        tracemalloc.start()
+
+        start = time.perf_counter()
+        handler = await setup_handler(hass, client, args.max_concurrent_requests)
+        report("startup", time.perf_counter() - start, api.total_requests, args.chargepoints)
+
+        entities = create_entities(hass, handler)
+        for cycle in range(1, args.cycles + 1):
+            requests = api.total_requests
+            start = time.perf_counter()
+            await asyncio.gather(*[handler.force_update_data(cp_id) for cp_id in handler.charge_point_ids])
+            wall_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for entity in entities:
+                entity._update_from_handler()
+            entity_time = time.perf_counter() - start
+            report(
+                f"cycle {cycle}",
+                wall_time,
+                api.total_requests - requests,
+                args.chargepoints,
+                f"{entity_time * 1000:.2f} ms updating {len(entities)} entities",
+            )
+
+        tracemalloc.stop()
+        print("Requests per endpoint:")
+        for endpoint, count in sorted(api.request_counts.items()):
+            print(f"  {count:8d} {endpoint}")
+        print(f"Bytes sent by API: {api.bytes_sent}")
+
+        await client.shutdown()
+        await hass.async_stop(force=True)
+    await api.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chargepoints", type=int, default=20)
+    parser.add_argument("--connectors", type=int, default=2)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--max-concurrent-requests", type=int, default=4)
+    parser.add_argument("--rate-limit", type=float, default=1000.0, help="client rate limit, requests per second")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Local stand-in for the Charge-Amps v5 API.
+
+Simulates a fleet of chargepoints with configurable size, session history,
+latency and error rate, and counts the requests it serves per endpoint.
+
+    python benchmarks/mock_api.py --chargepoints 20 --connectors 2 --sessions 5000 --latency 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+import jwt
+from aiohttp import web
+from ciso8601 import parse_datetime
+
+API_PREFIX = "/api/v5"
+TOKEN_LIFETIME = 3600
+TOKEN_SECRET = "mock-charge-amps-api-token-signing-secret"
+
+# Charging sessions are sent chunked, without a Content-Length
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def _naive_utc(value: str) -> datetime:
+    """Parse query time, naive times are UTC."""
+    parsed = parse_datetime(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+class MockChargeAmpsApi:
+    """Mock Charge-Amps API for a simulated fleet."""
+
+    def __init__(
+        self,
+        chargepoints: int = 1,
+        connectors: int = 2,
+        sessions: int = 100,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.request_counts: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.url: str | None = None
+
+        self.chargepoints = {}
+        self.settings = {}
+        self.connector_settings = {}
+        self.sessions = {}
+        # Like the real API, session times are naive UTC
+        start = datetime(2020, 1, 1)
+        for n in range(chargepoints):
+            cp_id = f"20{n:09d}M"
+            self.chargepoints[cp_id] = {
+                "id": cp_id,
+                "name": f"Chargepoint {n}",
+                "password": "00000000",
+                "type": "HALO",
+                "isLoadbalanced": False,
+                "firmwareVersion": "1.0.0",
+                "hardwareVersion": "1.0",
+                "connectors": [{"chargePointId": cp_id, "connectorId": c, "type": "Charger"} for c in range(1, connectors + 1)],
+            }
+            self.settings[cp_id] = {"id": cp_id, "dimmer": "Low", "downLight": False}
+            for c in range(1, connectors + 1):
+                self.connector_settings[(cp_id, c)] = {
+                    "chargePointId": cp_id,
+                    "connectorId": c,
+                    "mode": "On",
+                    "rfidLock": False,
+                    "cableLock": False,
+                    "maxCurrent": 16.0,
+                }
+            cp_sessions = []
+            for i in range(sessions):
+                session_start = start + timedelta(hours=7 * i)
+                cp_sessions.append(
+                    {
+                        "id": f"{cp_id}-{i}",
+                        "chargePointId": cp_id,
+                        "connectorId": 1 + i % connectors,
+                        "sessionType": "Free",
+                        "totalConsumptionKwh": round(3 + (i % 40) * 0.731, 3),
+                        "startTime": session_start.isoformat(),
+                        "endTime": (session_start + timedelta(hours=3)).isoformat(),
+                    }
+                )
+            self.sessions[cp_id] = cp_sessions
+
+        self.app = web.Application(middlewares=[self._middleware])
+        p = API_PREFIX
+        self.app.router.add_post(f"{p}/auth/login", self._login)
+        self.app.router.add_post(f"{p}/auth/refreshToken", self._login)
+        self.app.router.add_get(f"{p}/chargepoints/owned", self._get_chargepoints)
+        self.app.router.add_get(p + "/chargepoints/{cp_id}/status", self._get_status)
+        self.app.router.add_get(p + "/chargepoints/{cp_id}/settings", self._get_settings)
+        self.app.router.add_put(p + "/chargepoints/{cp_id}/settings", self._put_settings)
+        self.app.router.add_get(p + "/chargepoints/{cp_id}/connectors/{connector_id}/settings", self._get_connector_settings)
+        self.app.router.add_put(p + "/chargepoints/{cp_id}/connectors/{connector_id}/settings", self._put_connector_settings)
+        self.app.router.add_get(p + "/chargepoints/{cp_id}/chargingsessions", self._get_sessions)
+        self.app.router.add_get(p + "/chargepoints/{cp_id}/chargingsessions/{session_id}", self._get_session)
+        for command in ("remotestart", "remotestop"):
+            self.app.router.add_put(p + "/chargepoints/{cp_id}/connectors/{connector_id}/" + command, self._command)
+        self.app.router.add_put(p + "/chargepoints/{cp_id}/reboot", self._command)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.request_counts.values())
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        self.request_counts[f"{request.method} {route}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise web.HTTPServiceUnavailable()
+        response = await handler(request)
+        if isinstance(response, web.Response) and response.body is not None:
+            self.bytes_sent += len(response.body)
+        return response
+
+    def _chargepoint(self, request: web.Request) -> str:
+        cp_id = request.match_info["cp_id"]
+        if cp_id not in self.chargepoints:
+            raise web.HTTPNotFound()
+        return cp_id
+
+    async def _login(self, request: web.Request) -> web.Response:
+        token = jwt.encode({"exp": int(time.time()) + TOKEN_LIFETIME}, TOKEN_SECRET, algorithm="HS256")
+        return web.json_response({"token": token, "refreshToken": "refresh"})
+
+    async def _get_chargepoints(self, request: web.Request) -> web.Response:
+        return web.json_response(list(self.chargepoints.values()))
+
+    async def _get_status(self, request: web.Request) -> web.Response:
+        cp_id = self._chargepoint(request)
+        connector_statuses = []
+        for connector in self.chargepoints[cp_id]["connectors"]:
+            charging = connector["connectorId"] == 1
+            connector_statuses.append(
+                {
+                    "chargePointId": cp_id,
+                    "connectorId": connector["connectorId"],
+                    "totalConsumptionKwh": 4.2 if charging else 0,
+                    "status": "Charging" if charging else "Available",
+                    "measurements": [{"phase": f"L{p}", "current": 15.8, "voltage": 231} for p in range(1, 4)]
+                    if charging
+                    else None,
+                    "startTime": None,
+                    "endTime": None,
+                    "sessionId": None,
+                }
+            )
+        return web.json_response({"id": cp_id, "status": "Online", "connectorStatuses": connector_statuses})
+
+    async def _get_settings(self, request: web.Request) -> web.Response:
+        return web.json_response(self.settings[self._chargepoint(request)])
+
+    async def _put_settings(self, request: web.Request) -> web.Response:
+        self.settings[self._chargepoint(request)] = await request.json()
+        return web.Response()
+
+    def _connector(self, request: web.Request) -> tuple[str, int]:
+        key = (self._chargepoint(request), int(request.match_info["connector_id"]))
+        if key not in self.connector_settings:
+            raise web.HTTPNotFound()
+        return key
+
+    async def _get_connector_settings(self, request: web.Request) -> web.Response:
+        return web.json_response(self.connector_settings[self._connector(request)])
+
+    async def _put_connector_settings(self, request: web.Request) -> web.Response:
+        self.connector_settings[self._connector(request)] = await request.json()
+        return web.Response()
+
+    async def _get_sessions(self, request: web.Request) -> web.Response:
+        sessions = self.sessions[self._chargepoint(request)]
+        if "startTime" in request.query:
+            start_time = _naive_utc(request.query["startTime"])
+            sessions = [s for s in sessions if parse_datetime(s["startTime"]) >= start_time]
+        if "endTime" in request.query:
+            end_time = _naive_utc(request.query["endTime"])
+            sessions = [s for s in sessions if parse_datetime(s["startTime"]) < end_time]
+        body = json.dumps(sessions).encode()
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for i in range(0, len(body), STREAM_CHUNK_SIZE):
+            await response.write(body[i : i + STREAM_CHUNK_SIZE])
+        await response.write_eof()
+        self.bytes_sent += len(body)
+        return response
+
+    async def _get_session(self, request: web.Request) -> web.Response:
+        session_id = request.match_info["session_id"]
+        for session in self.sessions[self._chargepoint(request)]:
+            if session["id"] == session_id:
+                return web.json_response(session)
+        raise web.HTTPNotFound()
+
+    async def _command(self, request: web.Request) -> web.Response:
+        self._chargepoint(request)
+        return web.Response()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--chargepoints", type=int, default=1)
+    parser.add_argument("--connectors", type=int, default=2)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    api = MockChargeAmpsApi(args.chargepoints, args.connectors, args.sessions, args.latency, args.error_rate)
+    web.run_app(api.app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
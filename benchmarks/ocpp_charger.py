@@ -0,0 +1,131 @@
+"""Simulated OCPP 1.6J chargepoint for the local central system.
+
+Boots, starts a transaction, sends meter values while charging, stops the
+transaction and reports the round-trip time of every call.
+
+    python benchmarks/ocpp_charger.py ws://localhost:9000/ocpp/CHARGEPOINT_ID --meter-values 20 --interval 0.5
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import statistics
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+
+import orjson
+from aiohttp import ClientSession, WSMsgType
+
+CALL = 2
+CALLRESULT = 3
+CALLERROR = 4
+
+
+class SimulatedCharger:
+    """OCPP 1.6J chargepoint sending calls to a central system."""
+
+    def __init__(self, ws, connector_id: int = 1, phases: int = 3, current: float = 16.0, voltage: float = 230.0):
+        self.ws = ws
+        self.connector_id = connector_id
+        self.phases = phases
+        self.current = current
+        self.voltage = voltage
+        self.meter = 1_000_000.0
+        self.round_trips: dict[str, list[float]] = defaultdict(list)
+        self._unique_ids = itertools.count(1)
+
+    async def call(self, action: str, payload: dict) -> dict:
+        unique_id = str(next(self._unique_ids))
+        start = time.perf_counter()
+        await self.ws.send_str(orjson.dumps([CALL, unique_id, action, payload]).decode())
+        message = await self.ws.receive()
+        if message.type != WSMsgType.TEXT:
+            raise ConnectionError(f"Connection closed during {action}")
+        response = orjson.loads(message.data)
+        self.round_trips[action].append(time.perf_counter() - start)
+        if response[0] == CALLERROR:
+            raise RuntimeError(f"{action} failed: {response[2]} {response[3]}")
+        assert response[0] == CALLRESULT and response[1] == unique_id
+        return response[2]
+
+    @staticmethod
+    def now() -> str:
+        return datetime.now(UTC).isoformat()
+
+    async def status(self, status: str) -> None:
+        await self.call(
+            "StatusNotification",
+            {"connectorId": self.connector_id, "errorCode": "NoError", "status": status, "timestamp": self.now()},
+        )
+
+    async def meter_values(self, transaction_id: int, seconds: float) -> None:
+        self.meter += self.phases * self.current * self.voltage * seconds / 3600
+        sampled_values = [{"value": f"{self.meter:.1f}", "measurand": "Energy.Active.Import.Register", "unit": "Wh"}]
+        for phase in range(1, self.phases + 1):
+            sampled_values.append(
+                {"value": f"{self.current:.1f}", "measurand": "Current.Import", "phase": f"L{phase}", "unit": "A"}
+            )
+            sampled_values.append({"value": f"{self.voltage:.1f}", "measurand": "Voltage", "phase": f"L{phase}-N", "unit": "V"})
+        await self.call(
+            "MeterValues",
+            {
+                "connectorId": self.connector_id,
+                "transactionId": transaction_id,
+                "meterValue": [{"timestamp": self.now(), "sampledValue": sampled_values}],
+            },
+        )
+
+    async def run_session(self, meter_values: int, interval: float) -> None:
+        await self.call("BootNotification", {"chargePointVendor": "Simulator", "chargePointModel": "HALO"})
+        await self.status("Available")
+        await self.call("Heartbeat", {})
+        await self.status("Preparing")
+        result = await self.call(
+            "StartTransaction",
+            {"connectorId": self.connector_id, "idTag": "SIMULATOR", "meterStart": int(self.meter), "timestamp": self.now()},
+        )
+        transaction_id = result["transactionId"]
+        await self.status("Charging")
+        for _ in range(meter_values):
+            await asyncio.sleep(interval)
+            await self.meter_values(transaction_id, interval)
+        await self.call(
+            "StopTransaction",
+            {"transactionId": transaction_id, "meterStop": int(self.meter), "timestamp": self.now(), "reason": "Local"},
+        )
+        await self.status("Available")
+
+
+async def run(args) -> None:
+    headers = {}
+    if args.password:
+        charge_point_id = args.url.rstrip("/").rsplit("/", 1)[-1]
+        headers["Authorization"] = "Basic " + base64.b64encode(f"{charge_point_id}:{args.password}".encode()).decode()
+    async with ClientSession() as session, session.ws_connect(args.url, protocols=("ocpp1.6",), headers=headers) as ws:
+        charger = SimulatedCharger(ws, args.connector, args.phases, args.current)
+        await charger.run_session(args.meter_values, args.interval)
+    print(f"{'action':<20} {'calls':>6} {'mean ms':>9} {'max ms':>9}")
+    for action, round_trips in charger.round_trips.items():
+        print(f"{action:<20} {len(round_trips):6d} {statistics.mean(round_trips) * 1000:9.2f} {max(round_trips) * 1000:9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("url", help="central system URL, e.g. ws://localhost:9000/ocpp/CHARGEPOINT_ID")
+    parser.add_argument(
+        "--password",
+        default="00000000",
+        help="Basic auth password, sent with the chargepoint id as user (default: mock API chargepoint password)",
+    )
+    parser.add_argument("--connector", type=int, default=1)
+    parser.add_argument("--phases", type=int, default=3)
+    parser.add_argument("--current", type=float, default=16.0)
+    parser.add_argument("--meter-values", type=int, default=20, help="meter values sent during the session")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between meter values")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
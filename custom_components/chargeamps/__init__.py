@@ -5,65 +5,178 @@ For more details about this component, please refer to
 https://github.com/kirei/hass-chargeamps
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import Optional
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
+from aiohttp import ClientSession, TCPConnector
 from homeassistant.const import (
     CONF_API_KEY,
+    CONF_HOST,
     CONF_PASSWORD,
+    CONF_PORT,
     CONF_SCAN_INTERVAL,
     CONF_URL,
     CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
 )
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import discovery
-from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
 from homeassistant.util import Throttle
 
 from .client import (
+    DEFAULT_CACHE_TTL,
+    ENDPOINT_CHARGEPOINTS,
+    ENDPOINT_CHARGINGSESSIONS,
+    ENDPOINT_COMMANDS,
+    ENDPOINT_CONNECTOR_SETTINGS,
+    ENDPOINT_SETTINGS,
+    ENDPOINT_STATUS,
+    RATE_LIMIT,
+    RATE_LIMIT_BURST,
     ChargeAmpsClient,
     ChargePoint,
     ChargePointConnector,
     ChargePointConnectorSettings,
     ChargePointConnectorStatus,
     ChargePointStatus,
+    ChargingSession,
     StartAuth,
 )
 from .const import (
+    CONF_ACCEPT_ANY_ID_TAG,
+    CONF_ACCOUNTS,
     CONF_CHARGEPOINTS,
+    CONF_CONNECTION_LIMIT,
+    CONF_ENDPOINT_RATE_LIMITS,
+    CONF_ID_TAGS,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_OCPP,
+    CONF_OPTIMISTIC,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
     CONF_READONLY,
+    CONF_STATISTICS,
     CONFIGURATION_URL,
     DEFAULT_ICON,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_OCPP_HOST,
+    DEFAULT_OCPP_PORT,
     DIMMER_VALUES,
     DOMAIN,
     DOMAIN_DATA,
     ICON_MAP,
     MANUFACTURER,
+    OPTIMISTIC_TIMEOUT,
     PLATFORMS,
+    SETTINGS_MAX_AGE,
+    SETTINGS_SCAN_INTERVAL,
+    SIGNAL_ADD_CHARGEPOINT,
+    SIGNAL_ADD_CONNECTORS,
+    STATISTICS_INTERVAL,
+    WRITE_DEBOUNCE,
 )
+from .coordinator import ChargeampsCoordinator
+from .energy import EnergyAccumulator
+from .metrics import RefreshMetrics, RequestMetrics
+from .ratelimit import interactive_requests
+from .scheduler import FleetScheduler
+from .state import ChargePointSnapshot, ChargePointStateStore
+from .storage import ChargingSessionStore, MetadataStore
+from .writer import CoalescingWriter
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 MIN_SCAN_INTERVAL = timedelta(seconds=10)
 
-CONFIG_SCHEMA = vol.Schema(
+RATE_LIMIT_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.1))
+
+# Additional limits for endpoint classes, e.g. charging sessions, on top of the overall limit of an account
+ENDPOINT_RATE_LIMITS_SCHEMA = vol.Schema(
     {
-        DOMAIN: vol.Schema(
+        vol.In(
+            [
+                ENDPOINT_CHARGEPOINTS,
+                ENDPOINT_STATUS,
+                ENDPOINT_SETTINGS,
+                ENDPOINT_CONNECTOR_SETTINGS,
+                ENDPOINT_CHARGINGSESSIONS,
+                ENDPOINT_COMMANDS,
+            ]
+        ): vol.Schema(
             {
-                vol.Required(CONF_USERNAME): cv.string,
-                vol.Required(CONF_PASSWORD): cv.string,
-                vol.Required(CONF_API_KEY): cv.string,
-                vol.Optional(CONF_URL): cv.url,
-                vol.Optional(CONF_READONLY): cv.boolean,
-                vol.Optional(CONF_CHARGEPOINTS): vol.All(cv.ensure_list, [cv.string]),
-                vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): (
-                    vol.All(cv.time_period, vol.Clamp(min=MIN_SCAN_INTERVAL))
-                ),
+                vol.Required(CONF_RATE_LIMIT): RATE_LIMIT_VALIDATOR,
+                vol.Optional(CONF_RATE_LIMIT_BURST, default=RATE_LIMIT_BURST): cv.positive_int,
             }
         )
+    }
+)
+
+ACCOUNT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): cv.string,
+        vol.Required(CONF_PASSWORD): cv.string,
+        vol.Required(CONF_API_KEY): cv.string,
+        vol.Optional(CONF_URL): cv.url,
+        vol.Optional(CONF_CHARGEPOINTS): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_RATE_LIMIT): RATE_LIMIT_VALIDATOR,
+        vol.Optional(CONF_RATE_LIMIT_BURST): cv.positive_int,
+        vol.Optional(CONF_ENDPOINT_RATE_LIMITS): ENDPOINT_RATE_LIMITS_SCHEMA,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.All(
+            vol.Schema(
+                {
+                    vol.Inclusive(CONF_USERNAME, "account"): cv.string,
+                    vol.Inclusive(CONF_PASSWORD, "account"): cv.string,
+                    vol.Inclusive(CONF_API_KEY, "account"): cv.string,
+                    vol.Optional(CONF_URL): cv.url,
+                    vol.Optional(CONF_CHARGEPOINTS): vol.All(cv.ensure_list, [cv.string]),
+                    vol.Optional(CONF_ACCOUNTS): vol.All(cv.ensure_list, [ACCOUNT_SCHEMA]),
+                    vol.Optional(CONF_READONLY): cv.boolean,
+                    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): (
+                        vol.All(cv.time_period, vol.Clamp(min=MIN_SCAN_INTERVAL))
+                    ),
+                    vol.Optional(CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS): cv.positive_int,
+                    vol.Optional(CONF_OPTIMISTIC, default=True): cv.boolean,
+                    vol.Optional(CONF_RATE_LIMIT, default=RATE_LIMIT): RATE_LIMIT_VALIDATOR,
+                    vol.Optional(CONF_RATE_LIMIT_BURST, default=RATE_LIMIT_BURST): cv.positive_int,
+                    vol.Optional(CONF_ENDPOINT_RATE_LIMITS, default={}): ENDPOINT_RATE_LIMITS_SCHEMA,
+                    vol.Optional(CONF_CONNECTION_LIMIT): cv.positive_int,
+                    vol.Optional(CONF_KEEPALIVE_TIMEOUT): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(CONF_STATISTICS, default=False): cv.boolean,
+                    vol.Optional(CONF_OCPP): vol.Schema(
+                        {
+                            vol.Optional(CONF_HOST, default=DEFAULT_OCPP_HOST): cv.string,
+                            vol.Optional(CONF_PORT, default=DEFAULT_OCPP_PORT): cv.port,
+                            vol.Optional(CONF_PASSWORD): cv.string,
+                            vol.Optional(CONF_ID_TAGS): vol.All(cv.ensure_list, [cv.string]),
+                            vol.Optional(CONF_ACCEPT_ANY_ID_TAG, default=False): cv.boolean,
+                        }
+                    ),
+                }
+            ),
+            cv.has_at_least_one_key(CONF_USERNAME, CONF_ACCOUNTS),
+        )
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -90,46 +203,169 @@ async def async_setup(hass, config):
     hass.data[DOMAIN_DATA] = {}
 
     # Get "global" configuration.
-    username = config[DOMAIN].get(CONF_USERNAME)
-    password = config[DOMAIN].get(CONF_PASSWORD)
-    api_key = config[DOMAIN].get(CONF_API_KEY)
-    api_base_url = config[DOMAIN].get(CONF_URL)
-    charge_point_ids = config[DOMAIN].get(CONF_CHARGEPOINTS)
     readonly = config[DOMAIN].get(CONF_READONLY, False)
     scan_interval = config[DOMAIN].get(CONF_SCAN_INTERVAL)
+    max_concurrent_requests = config[DOMAIN].get(CONF_MAX_CONCURRENT_REQUESTS)
+    optimistic = config[DOMAIN].get(CONF_OPTIMISTIC)
 
-    # Configure the client.
-    client = ChargeAmpsClient(email=username, password=password, api_key=api_key, api_base_url=api_base_url)
+    accounts = list(config[DOMAIN].get(CONF_ACCOUNTS, []))
+    if CONF_USERNAME in config[DOMAIN]:
+        # Single account configured at the top level
+        account_keys = (CONF_USERNAME, CONF_PASSWORD, CONF_API_KEY, CONF_URL, CONF_CHARGEPOINTS)
+        accounts.insert(0, {key: config[DOMAIN][key] for key in account_keys if key in config[DOMAIN]})
 
-    # check all configured chargepoints or discover
-    if charge_point_ids is not None:
-        for cp_id in charge_point_ids:
-            try:
-                await client.get_chargepoint_status(cp_id)
-                _LOGGER.info("Adding chargepoint %s", cp_id)
-            except Exception:
-                _LOGGER.error("Error adding chargepoint %s", cp_id)
-        if len(charge_point_ids) == 0:
-            _LOGGER.error("No chargepoints found")
-            return False
+    # All accounts share the Home Assistant connection pool, or a dedicated one if tuned
+    connection_limit = config[DOMAIN].get(CONF_CONNECTION_LIMIT)
+    keepalive_timeout = config[DOMAIN].get(CONF_KEEPALIVE_TIMEOUT)
+    if connection_limit is None and keepalive_timeout is None:
+        session = async_get_clientsession(hass)
+        owns_session = False
     else:
-        charge_point_ids = []
-        for cp in await client.get_chargepoints():
-            _LOGGER.info("Discovered chargepoint %s", cp.id)
-            charge_point_ids.append(cp.id)
+        session = _create_session(connection_limit, keepalive_timeout)
+        owns_session = True
+    semaphore = asyncio.Semaphore(max_concurrent_requests)
 
-    handler = ChargeampsHandler(hass, client, charge_point_ids, readonly, scan_interval)
+    setup_start = time.monotonic()
+
+    account_clients = [
+        ChargeAmpsClient(
+            email=account[CONF_USERNAME],
+            password=account[CONF_PASSWORD],
+            api_key=account[CONF_API_KEY],
+            api_base_url=account.get(CONF_URL),
+            cache_ttl=DEFAULT_CACHE_TTL,
+            # Limits of an account default to the top level limits
+            rate_limit=account.get(CONF_RATE_LIMIT, config[DOMAIN][CONF_RATE_LIMIT]),
+            rate_limit_burst=account.get(CONF_RATE_LIMIT_BURST, config[DOMAIN][CONF_RATE_LIMIT_BURST]),
+            endpoint_rate_limits={
+                endpoint: (limits[CONF_RATE_LIMIT], limits[CONF_RATE_LIMIT_BURST])
+                for endpoint, limits in {
+                    **config[DOMAIN][CONF_ENDPOINT_RATE_LIMITS],
+                    **account.get(CONF_ENDPOINT_RATE_LIMITS, {}),
+                }.items()
+            },
+            session=session,
+        )
+        for account in accounts
+    ]
+
+    # Warm start from the chargepoints cached by the previous run, if all accounts are cached
+    metadata = MetadataStore(hass)
+    await metadata.async_load()
+    cached = [metadata.get_account_chargepoints(account[CONF_USERNAME], account.get(CONF_CHARGEPOINTS)) for account in accounts]
+    warm_start = all(account_chargepoints is not None for account_chargepoints in cached)
+    if warm_start:
+        results = [
+            (client, [cp.id for cp in account_chargepoints], account_chargepoints)
+            for client, account_chargepoints in zip(account_clients, cached, strict=True)
+        ]
+    else:
+        results = await asyncio.gather(
+            *[_async_setup_account(account, client, semaphore) for account, client in zip(accounts, account_clients, strict=True)]
+        )
+
+    # Map each chargepoint to the client of its account
+    clients = {}
+    chargepoints = []
+    for client, account_charge_point_ids, account_chargepoints in results:
+        for cp_id in account_charge_point_ids:
+            if cp_id in clients:
+                _LOGGER.warning("Chargepoint %s already added from another account", cp_id)
+                continue
+            clients[cp_id] = client
+        if account_chargepoints is None:
+            chargepoints = None
+        elif chargepoints is not None:
+            chargepoints.extend(cp for cp in account_chargepoints if clients.get(cp.id) is client)
+    if len(clients) == 0:
+        _LOGGER.error("No chargepoints found")
+        for client, _, _ in results:
+            await client.shutdown()
+        if owns_session:
+            await session.close()
+        return False
+    _LOGGER.info(
+        "Startup: %s %d chargepoints of %d accounts in %.2f s",
+        "restored cached" if warm_start else "checked",
+        len(clients),
+        len(accounts),
+        time.monotonic() - setup_start,
+    )
+
+    handler = ChargeampsHandler(
+        hass,
+        clients,
+        readonly,
+        scan_interval,
+        max_concurrent_requests,
+        optimistic,
+        metadata,
+    )
     hass.data[DOMAIN_DATA]["handler"] = handler
-    hass.data[DOMAIN_DATA]["chargepoint_info"] = {}
-    hass.data[DOMAIN_DATA]["chargepoint_status"] = {}
-    hass.data[DOMAIN_DATA]["chargepoint_settings"] = {}
-    hass.data[DOMAIN_DATA]["connector_info"] = {}
-    hass.data[DOMAIN_DATA]["connector_status"] = {}
-    hass.data[DOMAIN_DATA]["connector_settings"] = {}
-    hass.data[DOMAIN_DATA]["chargepoint_total_energy"] = {}
-    await handler.update_info()
-    for cp_id in charge_point_ids:
-        await handler.force_update_data(cp_id)
+    step_start = time.monotonic()
+    await handler.sessions.async_load()
+    _LOGGER.info("Startup: loaded session store in %.2f s", time.monotonic() - step_start)
+    if warm_start:
+        # Fresh info is fetched in the background and reconciled
+        handler.restore_info(chargepoints)
+    else:
+        step_start = time.monotonic()
+        await handler.update_info(chargepoints)
+        _LOGGER.info("Startup: updated chargepoint info in %.2f s", time.monotonic() - step_start)
+
+    @callback
+    def cache_accounts():
+        for account, client in zip(accounts, account_clients, strict=True):
+            account_charge_point_ids = [cp_id for cp_id, cp_client in handler.clients.items() if cp_client is client]
+            metadata.set_account_chargepoints(account[CONF_USERNAME], account_charge_point_ids)
+
+    cache_accounts()
+
+    async def async_shutdown(event):
+        await handler.async_shutdown()
+        if owns_session:
+            await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown)
+
+    ocpp_config = config[DOMAIN].get(CONF_OCPP)
+    if ocpp_config is not None:
+        from .ocpp import OcppCentralSystem
+
+        handler.ocpp = OcppCentralSystem(
+            handler,
+            ocpp_config[CONF_HOST],
+            ocpp_config[CONF_PORT],
+            password=ocpp_config.get(CONF_PASSWORD),
+            id_tags=ocpp_config.get(CONF_ID_TAGS),
+            accept_any_id_tag=ocpp_config[CONF_ACCEPT_ANY_ID_TAG],
+        )
+        await handler.ocpp.async_start()
+
+    importer = None
+    if config[DOMAIN].get(CONF_STATISTICS):
+        # Imported lazily, the recorder is only needed for statistics
+        from .statistics import StatisticsImporter
+
+        importer = StatisticsImporter(hass, handler)
+        async_track_time_interval(hass, importer.async_import_all, STATISTICS_INTERVAL)
+
+    async def async_start():
+        if warm_start:
+            step_start = time.monotonic()
+            discovering = [
+                client for account, client in zip(accounts, account_clients, strict=True) if CONF_CHARGEPOINTS not in account
+            ]
+            await handler.async_reconcile_info(discovering)
+            cache_accounts()
+            _LOGGER.info("Startup: reconciled chargepoint info in %.2f s", time.monotonic() - step_start)
+        await handler.async_initial_refresh()
+        if importer is not None:
+            # Backfill statistics as soon as sessions have been fetched
+            await importer.async_import_all()
+
+    # Entities are unavailable until the initial refresh has completed
+    hass.async_create_background_task(async_start(), f"{DOMAIN} initial refresh")
 
     # Register services to hass
     async def execute_service(call):
@@ -140,73 +376,257 @@ async def async_setup(hass, config):
     for service in _SERVICE_MAP:
         hass.services.async_register(DOMAIN, service, execute_service)
 
+    async def execute_diagnostics(call):
+        return handler.get_diagnostics()
+
+    hass.services.async_register(DOMAIN, "diagnostics", execute_diagnostics, supports_response=SupportsResponse.ONLY)
+
     # Load platforms
     for domain in PLATFORMS:
         hass.async_create_task(discovery.async_load_platform(hass, domain, DOMAIN, {}, config))
 
+    _LOGGER.info("Startup: setup finished in %.2f s", time.monotonic() - setup_start)
     return True
 
 
+def _create_session(connection_limit: int | None, keepalive_timeout: float | None) -> ClientSession:
+    """Create session with a dedicated connection pool."""
+    connector_kwargs = {}
+    if connection_limit is not None:
+        connector_kwargs["limit"] = connection_limit
+    if keepalive_timeout is not None:
+        connector_kwargs["keepalive_timeout"] = keepalive_timeout
+    return ClientSession(connector=TCPConnector(**connector_kwargs))
+
+
+async def _async_setup_account(account, client, semaphore) -> tuple[ChargeAmpsClient, list[str], list[ChargePoint] | None]:
+    """Check the configured chargepoints of an account or discover them."""
+    charge_point_ids = account.get(CONF_CHARGEPOINTS)
+    if charge_point_ids is not None:
+
+        async def check_chargepoint(cp_id):
+            async with semaphore:
+                try:
+                    await client.get_chargepoint_status(cp_id)
+                    _LOGGER.info("Adding chargepoint %s", cp_id)
+                except Exception:
+                    _LOGGER.error("Error adding chargepoint %s", cp_id)
+
+        await asyncio.gather(*[check_chargepoint(cp_id) for cp_id in charge_point_ids])
+        return client, charge_point_ids, None
+
+    try:
+        async with semaphore:
+            chargepoints = await client.get_chargepoints()
+    except Exception as error:  # pylint: disable=broad-except
+        _LOGGER.error("Error discovering chargepoints for %s - %s", account[CONF_USERNAME], error)
+        return client, [], []
+    for cp in chargepoints:
+        _LOGGER.info("Discovered chargepoint %s", cp.id)
+    return client, [cp.id for cp in chargepoints], chargepoints
+
+
 class ChargeampsHandler:
     """This class handle communication and stores the data."""
 
-    def __init__(self, hass, client, charge_point_ids, readonly, scan_interval):
-        """Initialize the class."""
+    def __init__(
+        self,
+        hass,
+        clients: dict[str, ChargeAmpsClient],
+        readonly,
+        scan_interval,
+        max_concurrent_requests=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        optimistic=True,
+        metadata: MetadataStore | None = None,
+    ):
+        """Initialize the class, clients maps each chargepoint to the client of its account."""
         self.hass = hass
-        self.client = client
-        self.charge_point_ids = charge_point_ids
-        self.default_charge_point_id = charge_point_ids[0]
+        self.clients = {}
+        self.charge_point_ids = []
         self.default_connector_id = 1
         self.readonly = readonly
+        self.optimistic = optimistic
         self.scan_interval = scan_interval
-        self.last_scanned = {id: datetime.fromtimestamp(0) for id in charge_point_ids}
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self.state = ChargePointStateStore()
+        self._chargepoint_writer = CoalescingWriter(self._write_chargepoint_settings, WRITE_DEBOUNCE.total_seconds())
+        self._connector_writer = CoalescingWriter(self._write_connector_settings, WRITE_DEBOUNCE.total_seconds())
+        # Last time settings were re-read on their own, by writer key
+        self._settings_read: dict[Hashable, datetime] = {}
+        self.refresh_metrics: dict[str, RefreshMetrics] = defaultdict(RefreshMetrics)
+        self.ocpp = None
+        self.sessions = ChargingSessionStore(hass)
+        self.energy = EnergyAccumulator(self.sessions)
+        self.metadata = metadata or MetadataStore(hass)
+        self.scheduler = FleetScheduler()
+        self.coordinators = {}
+        for cp_id, client in clients.items():
+            self._add_chargepoint(cp_id, client)
         if self.readonly:
             _LOGGER.warning("Running in read-only mode, chargepoint will never be updated")
         _LOGGER.debug("Scan interval %s", self.scan_interval)
         self.update_info = Throttle(self.scan_interval)(self.update_info)
 
+    def _add_chargepoint(self, charge_point_id, client: ChargeAmpsClient) -> None:
+        self.clients[charge_point_id] = client
+        self.charge_point_ids.append(charge_point_id)
+        self.scheduler.add(charge_point_id)
+        self.coordinators[charge_point_id] = ChargeampsCoordinator(
+            self.hass, charge_point_id, partial(self._update_data, charge_point_id), self.scan_interval, self.scheduler
+        )
+
+    async def _async_remove_chargepoint(self, charge_point_id) -> None:
+        """Stop polling a chargepoint and free its slot, its entities become unavailable."""
+        del self.clients[charge_point_id]
+        self.charge_point_ids.remove(charge_point_id)
+        self.scheduler.remove(charge_point_id)
+        # Settings changes not sent yet can no longer be written
+        error = HomeAssistantError(f"Chargepoint {charge_point_id} was removed")
+        self._chargepoint_writer.cancel(charge_point_id, error)
+        for connector_id in self.state.get(charge_point_id).connector_info:
+            self._connector_writer.cancel((charge_point_id, connector_id), error)
+        coordinator = self.coordinators.pop(charge_point_id)
+        await coordinator.async_shutdown()
+        coordinator.last_update_success = False
+        coordinator.async_update_listeners()
+
+    @property
+    def default_charge_point_id(self) -> str | None:
+        """Return chargepoint used by services if none is given."""
+        return self.charge_point_ids[0] if self.charge_point_ids else None
+
+    def _ensure_chargepoint(self, charge_point_id) -> None:
+        if charge_point_id not in self.coordinators:
+            raise HomeAssistantError(f"Chargepoint {charge_point_id} not found")
+
+    def _service_chargepoint(self, param) -> str:
+        """Return chargepoint of a service call, the default one unless given."""
+        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        if charge_point_id is None:
+            raise HomeAssistantError("No chargepoints available")
+        self._ensure_chargepoint(charge_point_id)
+        return charge_point_id
+
+    def _boost(self, charge_point_id) -> None:
+        """Poll a chargepoint more often after a change, unless it has been removed meanwhile."""
+        coordinator = self.coordinators.get(charge_point_id)
+        if coordinator is not None:
+            coordinator.boost()
+
+    @property
+    def accounts(self) -> list[ChargeAmpsClient]:
+        """Return the clients of all accounts."""
+        return list(dict.fromkeys(self.clients.values()))
+
+    def _client_for(self, charge_point_id) -> ChargeAmpsClient:
+        return self.clients[charge_point_id]
+
+    async def async_shutdown(self) -> None:
+        """Shut down the local central system and the clients of all accounts."""
+        if self.ocpp is not None:
+            await self.ocpp.async_stop()
+        await asyncio.gather(*[client.shutdown() for client in self.accounts])
+
+    def get_request_metrics(self) -> RequestMetrics:
+        """Return request metrics summed over all accounts."""
+        return RequestMetrics.combine([client.metrics for client in self.accounts])
+
+    def get_diagnostics(self) -> dict:
+        """Return request and refresh metrics of all accounts and chargepoints."""
+        return {
+            "requests": self.get_request_metrics().as_dict(),
+            "accounts": [
+                {
+                    "chargepoints": [cp_id for cp_id, cp_client in self.clients.items() if cp_client is client],
+                    "circuits": client.get_circuit_states(),
+                    "requests": client.metrics.as_dict(),
+                }
+                for client in self.accounts
+            ],
+            "chargepoints": {
+                cp_id: {
+                    "update_interval": coordinator.poll_interval.total_seconds(),
+                    "slot": round(self.scheduler.phase(cp_id), 3),
+                    "refresh": self.refresh_metrics[cp_id].as_dict(),
+                    "state": self._snapshot_diagnostics(cp_id),
+                }
+                for cp_id, coordinator in self.coordinators.items()
+            },
+        }
+
+    def _snapshot_diagnostics(self, charge_point_id: str) -> dict:
+        snapshot = self.state.get(charge_point_id)
+        return {
+            "version": snapshot.version,
+            "info_fetched": snapshot.info_fetched.isoformat() if snapshot.info_fetched else None,
+            "status_fetched": snapshot.status_fetched.isoformat() if snapshot.status_fetched else None,
+            "settings_fetched": snapshot.settings_fetched.isoformat() if snapshot.settings_fetched else None,
+        }
+
+    async def _limited(self, coro):
+        """Await coroutine, limited by the concurrent requests cap."""
+        async with self._request_semaphore:
+            return await coro
+
     async def get_chargepoint_statuses(self):
-        res = []
-        for cp_id in self.charge_point_ids:
-            res.append(await self.client.get_chargepoint_status(cp_id))
-        return res
+        return list(
+            await asyncio.gather(
+                *[self._limited(self._client_for(cp_id).get_chargepoint_status(cp_id)) for cp_id in self.charge_point_ids]
+            )
+        )
+
+    def get_snapshot(self, charge_point_id) -> ChargePointSnapshot:
+        return self.state.get(charge_point_id)
 
     def get_chargepoint_total_energy(self, charge_point_id) -> float:
-        return self.hass.data[DOMAIN_DATA]["chargepoint_total_energy"].get(charge_point_id)
+        return self.state.get(charge_point_id).total_energy
 
     def get_chargepoint_info(self, charge_point_id) -> ChargePoint:
-        return self.hass.data[DOMAIN_DATA]["chargepoint_info"].get(charge_point_id)
+        return self.state.get(charge_point_id).info
 
     def get_chargepoint_status(self, charge_point_id) -> ChargePointStatus:
-        return self.hass.data[DOMAIN_DATA]["chargepoint_status"].get(charge_point_id)
+        return self.state.get(charge_point_id).status
 
     def get_chargepoint_settings(self, charge_point_id):
-        return self.hass.data[DOMAIN_DATA]["chargepoint_settings"].get(charge_point_id)
+        return self.state.get(charge_point_id).settings
 
     def get_connector_info(self, charge_point_id, connector_id) -> ChargePointConnector:
-        key = (charge_point_id, connector_id)
-        return self.hass.data[DOMAIN_DATA]["connector_info"].get(key)
+        return self.state.get(charge_point_id).connector_info.get(connector_id)
 
     async def set_chargepoint_lights(self, charge_point_id, dimmer, downlight):
-        settings = await self.client.get_chargepoint_settings(charge_point_id)
+        changes = {}
         if dimmer is not None:
-            settings.dimmer = dimmer.capitalize()
+            changes["dimmer"] = dimmer.capitalize()
         if downlight is not None:
-            settings.down_light = downlight
+            changes["down_light"] = downlight
+        self._ensure_chargepoint(charge_point_id)
+        await self._chargepoint_writer.submit(charge_point_id, **changes)
+
+    def _settings_fresh(self, charge_point_id, key: Hashable) -> bool:
+        """Return whether cached settings are recent enough to base a full settings write on."""
+        read = [t for t in (self.state.get(charge_point_id).settings_fetched, self._settings_read.get(key)) if t is not None]
+        return bool(read) and datetime.now(UTC) - max(read) < SETTINGS_MAX_AGE
+
+    async def _write_chargepoint_settings(self, charge_point_id, changes):
+        """Write merged chargepoint settings changes through to the chargepoint and the stored data."""
+        if not self._settings_fresh(charge_point_id, charge_point_id):
+            # The whole settings object is written, base it on what the chargepoint has now
+            await self.async_refresh_settings(charge_point_id)
+        settings = replace(self.get_chargepoint_settings(charge_point_id), **changes)
         if self.readonly:
             _LOGGER.info("NOT setting chargepoint: %s", settings)
         else:
             _LOGGER.info("Setting chargepoint: %s", settings)
-            await self.client.set_chargepoint_settings(settings)
-        await self.force_update_data(charge_point_id)
+            await self._client_for(charge_point_id).set_chargepoint_settings(settings)
+            self.metadata.update(self.state.set_settings(charge_point_id, settings))
+            self._boost(charge_point_id)
+        await self.update_status(charge_point_id)
 
     def get_connector_status(self, charge_point_id, connector_id) -> Optional[ChargePointConnectorStatus]:
-        key = (charge_point_id, connector_id)
-        return self.hass.data[DOMAIN_DATA]["connector_status"].get(key)
+        return self.state.get(charge_point_id).connector_status.get(connector_id)
 
     def get_connector_settings(self, charge_point_id, connector_id) -> Optional[ChargePointConnectorSettings]:
-        key = (charge_point_id, connector_id)
-        return self.hass.data[DOMAIN_DATA]["connector_settings"].get(key)
+        return self.state.get(charge_point_id).connector_settings.get(connector_id)
 
     def get_connector_measurements(self, charge_point_id, connector_id):
         connector_status = self.get_connector_status(charge_point_id, connector_id)
@@ -215,89 +635,253 @@ class ChargeampsHandler:
         return None
 
     async def set_connector_mode(self, charge_point_id, connector_id, mode):
-        settings = await self.client.get_chargepoint_connector_settings(charge_point_id, connector_id)
-        settings.mode = mode
-        if self.readonly:
-            _LOGGER.info("NOT setting chargepoint connector: %s", settings)
-        else:
-            _LOGGER.info("Setting chargepoint connector: %s", settings)
-            await self.client.set_chargepoint_connector_settings(settings)
-        await self.force_update_data(charge_point_id)
+        self._ensure_chargepoint(charge_point_id)
+        await self._connector_writer.submit((charge_point_id, connector_id), mode=mode)
 
     async def set_connector_max_current(self, charge_point_id, connector_id, max_current):
-        settings = await self.client.get_chargepoint_connector_settings(charge_point_id, connector_id)
-        settings.max_current = max_current
-        if self.readonly:
-            _LOGGER.info("NOT setting chargepoint connector: %s", settings)
-        else:
-            _LOGGER.info("Setting chargepoint connector: %s", settings)
-            await self.client.set_chargepoint_connector_settings(settings)
-        await self.force_update_data(charge_point_id)
+        self._ensure_chargepoint(charge_point_id)
+        await self._connector_writer.submit((charge_point_id, connector_id), max_current=max_current)
 
     async def set_connector_cable_lock(self, charge_point_id, connector_id, cable_lock):
-        settings = await self.client.get_chargepoint_connector_settings(charge_point_id, connector_id)
-        settings.cable_lock = cable_lock
+        self._ensure_chargepoint(charge_point_id)
+        await self._connector_writer.submit((charge_point_id, connector_id), cable_lock=cable_lock)
+
+    async def _write_connector_settings(self, key, changes):
+        """Write merged connector settings changes through to the chargepoint and the stored data."""
+        charge_point_id, connector_id = key
+        if not self._settings_fresh(charge_point_id, key):
+            # The whole settings object is written, base it on what the chargepoint has now
+            await self.async_refresh_settings(charge_point_id, connector_id)
+        settings = replace(self.get_connector_settings(charge_point_id, connector_id), **changes)
         if self.readonly:
             _LOGGER.info("NOT setting chargepoint connector: %s", settings)
         else:
             _LOGGER.info("Setting chargepoint connector: %s", settings)
-            await self.client.set_chargepoint_connector_settings(settings)
-        await self.force_update_data(charge_point_id)
+            await self._client_for(charge_point_id).set_chargepoint_connector_settings(settings)
+            self.metadata.update(self.state.set_connector_settings(settings))
+            self._boost(charge_point_id)
+        await self.update_status(charge_point_id)
 
-    async def update_info(self):
-        for cp in await self.client.get_chargepoints():
-            if cp.id in self.charge_point_ids:
+    async def async_refresh_settings(self, charge_point_id, connector_id=None) -> None:
+        """Re-read chargepoint settings, or connector settings, from the cloud, bypassing the cache."""
+        self._ensure_chargepoint(charge_point_id)
+        client = self._client_for(charge_point_id)
+        with interactive_requests():
+            if connector_id is None:
+                settings = await client.get_chargepoint_settings(charge_point_id, fresh=True)
+                snapshot = self.state.set_settings(charge_point_id, settings)
+            else:
+                connector_settings = await client.get_chargepoint_connector_settings(charge_point_id, connector_id, fresh=True)
+                snapshot = self.state.set_connector_settings(connector_settings)
+        self._settings_read[charge_point_id if connector_id is None else (charge_point_id, connector_id)] = datetime.now(UTC)
+        self.metadata.update(snapshot)
+        coordinator = self.coordinators.get(charge_point_id)
+        if coordinator is not None:
+            # Let other entities of the chargepoint pick up the settings too
+            coordinator.async_update_listeners()
+
+    async def update_info(self, chargepoints: list[ChargePoint] | None = None):
+        if chargepoints is None:
+            results = await asyncio.gather(*[self._limited(client.get_chargepoints()) for client in self.accounts])
+            chargepoints = [cp for account_chargepoints in results for cp in account_chargepoints]
+        for cp in chargepoints:
+            if cp.id in self.clients:
                 _LOGGER.debug("CHARGEPOINT INFO = %s", cp)
-                self.hass.data[DOMAIN_DATA]["chargepoint_info"][cp.id] = cp
-                for c in cp.connectors:
-                    key = (c.charge_point_id, c.connector_id)
-                    self.hass.data[DOMAIN_DATA]["connector_info"][key] = c
-                _LOGGER.debug("CONNECTOR INFO = %s", c)
+                self.metadata.update(self.state.set_info(cp))
+                self.metadata.set_missing(cp.id, False)
                 _LOGGER.info("Update info for chargepoint %s", cp.id)
 
+    def restore_info(self, chargepoints: list[ChargePoint]) -> None:
+        """Restore cached info and settings, to create entities before the cloud has answered."""
+        for cp in chargepoints:
+            if cp.id in self.clients:
+                self.state.restore(cp, *self.metadata.get_settings(cp.id))
+                _LOGGER.info("Restored cached info for chargepoint %s", cp.id)
+
+    async def async_reconcile_info(self, discovering: list[ChargeAmpsClient]) -> None:
+        """Fetch info after a warm start and add chargepoints and connectors not in the cache.
+
+        New chargepoints are only added for accounts that discover their chargepoints.
+        Chargepoints of those accounts are removed once they were missing at two
+        consecutive starts.
+        """
+        accounts = self.accounts + [client for client in discovering if client not in self.accounts]
+        results = await asyncio.gather(*[self._limited(client.get_chargepoints()) for client in accounts], return_exceptions=True)
+        for client, chargepoints in zip(accounts, results, strict=True):
+            if isinstance(chargepoints, Exception):
+                _LOGGER.warning("Could not fetch chargepoints, keeping cached info - %s", chargepoints)
+                continue
+            if not chargepoints:
+                # More likely a transient API problem than an account without chargepoints
+                _LOGGER.warning("No chargepoints returned for the account, keeping cached info")
+                continue
+            for cp in chargepoints:
+                self.metadata.set_missing(cp.id, False)
+                if cp.id not in self.clients:
+                    if client not in discovering:
+                        continue
+                    _LOGGER.info("Discovered new chargepoint %s", cp.id)
+                    self._add_chargepoint(cp.id, client)
+                    self.metadata.update(self.state.set_info(cp))
+                    async_dispatcher_send(self.hass, SIGNAL_ADD_CHARGEPOINT, cp.id)
+                    continue
+                if self.clients[cp.id] is not client:
+                    continue
+                known_connectors = self.state.get(cp.id).connector_info
+                self.metadata.update(self.state.set_info(cp))
+                new_connectors = [c for c in cp.connectors if c.connector_id not in known_connectors]
+                if new_connectors:
+                    _LOGGER.info("Discovered %d new connectors of chargepoint %s", len(new_connectors), cp.id)
+                    async_dispatcher_send(self.hass, SIGNAL_ADD_CONNECTORS, cp.id, new_connectors)
+            fetched = {cp.id for cp in chargepoints}
+            for cp_id, cp_client in list(self.clients.items()):
+                if cp_client is not client or cp_id in fetched:
+                    continue
+                if client in discovering:
+                    if self.metadata.is_missing(cp_id):
+                        _LOGGER.warning("Chargepoint %s no longer found, no longer polled", cp_id)
+                        self.metadata.set_missing(cp_id, False)
+                        await self._async_remove_chargepoint(cp_id)
+                    else:
+                        # Only removed when missing at the next reconcile too
+                        _LOGGER.warning("Chargepoint %s not found, removed if still missing at the next start", cp_id)
+                        self.metadata.set_missing(cp_id, True)
+                else:
+                    _LOGGER.warning("Configured chargepoint %s not found in the account", cp_id)
+
     async def update_data(self, charge_point_id):
         _LOGGER.debug("Update data for chargepoint %s", charge_point_id)
-        await self._update_data(charge_point_id)
+        await self.coordinators[charge_point_id].async_request_refresh()
 
     async def force_update_data(self, charge_point_id):
         _LOGGER.debug("Force update data for chargepoint %s", charge_point_id)
-        await self._update_data(charge_point_id, force=True)
+        await self.coordinators[charge_point_id].async_refresh()
 
-    async def _update_data(self, charge_point_id, force: bool = False):
-        """Update data."""
-        if not force and datetime.now() - self.last_scanned[charge_point_id] < self.scan_interval:
-            _LOGGER.debug("Update throttled, last scan at %s", self.last_scanned[charge_point_id])
+    async def update_status(self, charge_point_id):
+        """Refresh only the chargepoint status and notify entities, e.g. after a command."""
+        _LOGGER.debug("Update status for chargepoint %s", charge_point_id)
+        coordinator = self.coordinators.get(charge_point_id)
+        if coordinator is None:
+            # Removed while the command was sent
+            return
+        if self.ocpp is not None and self.ocpp.is_connected(charge_point_id):
+            # Status is pushed by the chargepoint, the cloud status would overwrite it with a stale one
+            coordinator.async_set_updated_data(self.get_chargepoint_status(charge_point_id))
             return
-        else:
-            _LOGGER.debug("Update passed, forced=%s", force)
-            self.last_scanned[charge_point_id] = datetime.now()
         try:
-            status = await self.client.get_chargepoint_status(charge_point_id)
-            _LOGGER.debug("STATUS = %s", status)
-            self.hass.data[DOMAIN_DATA]["chargepoint_status"][charge_point_id] = status
-            for connector_status in status.connector_statuses:
-                _LOGGER.debug(
-                    "Update data for chargepoint %s connector %d",
-                    charge_point_id,
-                    connector_status.connector_id,
-                )
-                key = (charge_point_id, connector_status.connector_id)
-                self.hass.data[DOMAIN_DATA]["connector_status"][key] = connector_status
-                connector_settings = await self.client.get_chargepoint_connector_settings(
-                    charge_point_id, connector_status.connector_id
-                )
-                self.hass.data[DOMAIN_DATA]["connector_settings"][key] = connector_settings
-            total_energy = sum([v.total_consumption_kwh for v in await self.client.get_all_chargingsessions(charge_point_id)])
-            _LOGGER.debug(
-                "Total consumption for chargepoint %s: %f",
+            with interactive_requests():
+                status = await self._client_for(charge_point_id).get_chargepoint_status(charge_point_id)
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.error("Could not update status - %s", error)
+            return
+        self.state.commit(charge_point_id, status=status)
+        coordinator.async_set_updated_data(status)
+
+    @callback
+    def set_local_connected(self, charge_point_id, connected: bool) -> None:
+        """Switch chargepoint between local push updates and cloud polling."""
+        coordinator = self.coordinators.get(charge_point_id)
+        if coordinator is None:
+            return
+        coordinator.local = connected
+        if not connected:
+            # Pick up the cloud status right away
+            self.hass.async_create_task(coordinator.async_request_refresh())
+
+    @callback
+    def set_local_status(self, charge_point_id, status: ChargePointStatus, open_energy: float) -> None:
+        """Apply status pushed by a locally connected chargepoint."""
+        if charge_point_id not in self.coordinators:
+            return
+        total_energy = round(self.sessions.get_total_energy(charge_point_id) + open_energy, 2)
+        # Open sessions only known from the cloud, e.g. after a restart, are not in the local total
+        # until they are closed, keep the total increasing in the meantime
+        previous = self.get_chargepoint_total_energy(charge_point_id)
+        if previous is not None:
+            total_energy = max(total_energy, previous)
+        self.state.commit(charge_point_id, status=status, total_energy=total_energy)
+        self.coordinators[charge_point_id].async_set_updated_data(status)
+
+    @callback
+    def add_local_session(self, charge_point_id, session: ChargingSession) -> None:
+        """Store session closed by a locally connected chargepoint."""
+        if self.sessions.add_session(charge_point_id, session):
+            self.sessions.schedule_save()
+
+    async def async_initial_refresh(self):
+        """Refresh all chargepoints concurrently after startup."""
+        start = time.monotonic()
+        await asyncio.gather(*[self.force_update_data(cp_id) for cp_id in self.charge_point_ids])
+        _LOGGER.info(
+            "Startup: initial refresh of %d chargepoints in %.2f s",
+            len(self.charge_point_ids),
+            time.monotonic() - start,
+        )
+
+    async def _update_data(self, charge_point_id) -> ChargePointStatus:
+        """Update data, called by the chargepoint coordinator once per scan."""
+        metrics = self.refresh_metrics[charge_point_id]
+        started = metrics.start(self.coordinators[charge_point_id].poll_interval.total_seconds())
+        success = False
+        try:
+            status = await self._refresh_chargepoint(charge_point_id)
+            success = True
+            return status
+        finally:
+            metrics.finish(started, success)
+
+    async def _refresh_chargepoint(self, charge_point_id) -> ChargePointStatus:
+        _LOGGER.debug("Update data for chargepoint %s", charge_point_id)
+        if self.ocpp is not None and self.ocpp.is_connected(charge_point_id):
+            # Status is pushed by the chargepoint, the cloud has nothing newer
+            return self.get_chargepoint_status(charge_point_id)
+        client = self._client_for(charge_point_id)
+        if not client.is_available():
+            # Do not add to the load of a failing API, entities become unavailable
+            raise UpdateFailed("Charge-Amps API unavailable, circuit breaker open")
+        cp_info = self.get_chargepoint_info(charge_point_id)
+        connector_ids = [c.connector_id for c in cp_info.connectors] if cp_info else []
+        settings_fetched = self.state.get(charge_point_id).settings_fetched
+        refresh_settings = settings_fetched is None or datetime.now(UTC) - settings_fetched >= SETTINGS_SCAN_INTERVAL
+        requests = [
+            client.get_chargepoint_status(charge_point_id),
+            # Sessions are aggregated as they are streamed, never held in memory as a whole
+            self.energy.async_update(
                 charge_point_id,
-                total_energy,
+                client.iter_chargingsessions(charge_point_id, start_time=self.energy.query_start_time(charge_point_id)),
+            ),
+        ]
+        if refresh_settings:
+            requests.append(client.get_chargepoint_settings(charge_point_id))
+            requests.extend(
+                client.get_chargepoint_connector_settings(charge_point_id, connector_id) for connector_id in connector_ids
             )
-            self.hass.data[DOMAIN_DATA]["chargepoint_total_energy"][charge_point_id] = round(total_energy, 2)
-            settings = await self.client.get_chargepoint_settings(charge_point_id)
-            self.hass.data[DOMAIN_DATA]["chargepoint_settings"][charge_point_id] = settings
+        try:
+            # All requests of a cycle are independent, issue them concurrently
+            status, total_energy, *settings_results = await asyncio.gather(*[self._limited(request) for request in requests])
         except Exception as error:  # pylint: disable=broad-except
-            _LOGGER.error("Could not update data - %s", error)
+            raise UpdateFailed(f"Could not update data - {error}") from error
+        _LOGGER.debug("STATUS = %s", status)
+        _LOGGER.debug(
+            "Total consumption for chargepoint %s: %f",
+            charge_point_id,
+            total_energy,
+        )
+
+        # Commit results of the cycle together, as a single new snapshot
+        settings, connector_settings = None, None
+        if refresh_settings:
+            settings, *connector_settings = settings_results
+        snapshot = self.state.commit(
+            charge_point_id,
+            status=status,
+            total_energy=round(total_energy, 2),
+            settings=settings,
+            connector_settings=connector_settings,
+        )
+        if refresh_settings:
+            self.metadata.update(snapshot)
+        return status
 
     async def async_set_max_current(self, param):
         """Set current maximum in async way."""
@@ -306,13 +890,13 @@ class ChargeampsHandler:
         except (KeyError, ValueError) as ex:
             _LOGGER.warning("Current value is not correct. %s", ex)
             return
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         connector_id = param.get("connector", self.default_connector_id)
         await self.set_connector_max_current(charge_point_id, connector_id, max_current)
 
     async def async_set_light(self, param):
         """Set charge point lights in async way."""
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         dimmer = param.get("dimmer")
         if dimmer is not None and dimmer not in DIMMER_VALUES:
             _LOGGER.warning("Dimmer is not one of %s - got %s", DIMMER_VALUES, dimmer)
@@ -325,52 +909,56 @@ class ChargeampsHandler:
 
     async def async_enable_ev(self, param):
         """Enable EV in async way."""
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         connector_id = param.get("connector", self.default_connector_id)
         await self.set_connector_mode(charge_point_id, connector_id, "On")
 
     async def async_disable_ev(self, param=None):
         """Disable EV in async way."""
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         connector_id = param.get("connector", self.default_connector_id)
         await self.set_connector_mode(charge_point_id, connector_id, "Off")
 
     async def async_cable_lock(self, param):
         """Lock cable in async way."""
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         connector_id = param.get("connector", self.default_connector_id)
         await self.set_connector_cable_lock(charge_point_id, connector_id, True)
 
     async def async_cable_unlock(self, param=None):
         """Unlock cable in async way."""
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         connector_id = param.get("connector", self.default_connector_id)
         await self.set_connector_cable_lock(charge_point_id, connector_id, False)
 
     async def async_remote_start(self, param):
         """Remote start RFID in async way."""
 
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         connector_id = param.get("connector", self.default_connector_id)
         rfid_length = param.get("rfid_length", 4)
         rfid_format = param.get("rfid_format", "Dec")
         rfid = param.get("rfid")
         external_transaction_id = param.get("external_transaction_id", 0)
 
-        await self.client.remote_start(
+        await self._client_for(charge_point_id).remote_start(
             charge_point_id,
             connector_id,
             StartAuth(rfid_length, rfid_format, rfid, external_transaction_id),
         )
+        self._boost(charge_point_id)
+        await self.update_status(charge_point_id)
 
     async def async_remote_stop(self, param):
         """Remote stop RFID in async way."""
-        charge_point_id = param.get("chargepoint", self.default_charge_point_id)
+        charge_point_id = self._service_chargepoint(param)
         connector_id = param.get("connector", self.default_connector_id)
-        await self.client.remote_stop(charge_point_id, connector_id)
+        await self._client_for(charge_point_id).remote_stop(charge_point_id, connector_id)
+        self._boost(charge_point_id)
+        await self.update_status(charge_point_id)
 
 
-class ChargeampsEntity(Entity):
+class ChargeampsEntity(CoordinatorEntity):
     """Chargeamps Entity class."""
 
     def __init__(self, hass, name, charge_point_id, connector_id=None):
@@ -378,14 +966,91 @@ class ChargeampsEntity(Entity):
         self.charge_point_id = charge_point_id
         self.connector_id = connector_id
         self.handler = self.hass.data[DOMAIN_DATA]["handler"]
+        super().__init__(self.handler.coordinators[charge_point_id])
         self._name = name
         self._state = None
+        self._optimistic_pending = 0
+        self._written_snapshot = None
+        self._data_version = None
         self._attributes = {
             "charge_point_id": charge_point_id,
         }
         if connector_id is not None:
             self._attributes["connector_id"] = connector_id
 
+    async def async_added_to_hass(self):
+        """Subscribe to the coordinator and pick up already fetched data."""
+        await super().async_added_to_hass()
+        self._update_from_handler()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available, i.e. data has been fetched."""
+        return super().available and self.coordinator.data is not None
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from the coordinator."""
+        if self._optimistic_pending:
+            # Keep the optimistic state until the command has been acknowledged
+            return
+        data_version = self._get_data_version()
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._update_from_handler()
+        self._async_write_state_if_changed()
+
+    def _get_data_version(self):
+        """Return version of the data the entity is derived from."""
+        return self.handler.get_snapshot(self.charge_point_id).version
+
+    def _state_snapshot(self) -> tuple:
+        """Return everything the written state depends on."""
+        return (self.available, self.state, tuple(self._attributes.items()))
+
+    @callback
+    def _async_write_state_if_changed(self):
+        """Write state, unless nothing changed since the last write."""
+        snapshot = self._state_snapshot()
+        if snapshot == self._written_snapshot:
+            return
+        self._written_snapshot = snapshot
+        self.async_write_ha_state()
+
+    async def _async_command(self, command: Awaitable, apply_optimistic: Callable[[], None]):
+        """Run command, optimistically applying its result to the entity state first."""
+        if not self.handler.optimistic:
+            await command
+            return
+        apply_optimistic()
+        self._optimistic_pending += 1
+        self._async_write_state_if_changed()
+        self.hass.async_create_task(self._async_reconcile(command))
+
+    async def _async_reconcile(self, command: Awaitable):
+        """Wait for command and reconcile the optimistic state with the chargepoint data."""
+        try:
+            async with asyncio.timeout(OPTIMISTIC_TIMEOUT.total_seconds()):
+                await command
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Command for %s not acknowledged, rolling back - %s", self.name, error)
+        else:
+            # Roll back if the cloud reports something else than what was written
+            try:
+                async with asyncio.timeout(OPTIMISTIC_TIMEOUT.total_seconds()):
+                    await self.handler.async_refresh_settings(self.charge_point_id, self.connector_id)
+            except Exception as error:  # pylint: disable=broad-except
+                _LOGGER.warning("Could not verify command for %s - %s", self.name, error)
+        finally:
+            self._optimistic_pending -= 1
+        if not self._optimistic_pending:
+            self._update_from_handler()
+            self._async_write_state_if_changed()
+
+    @callback
+    def _update_from_handler(self):
+        """Update entity state from the latest handler data."""
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this entity."""
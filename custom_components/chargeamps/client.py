@@ -1,24 +1,73 @@
 """Charge-Amps API Client"""
 
+import asyncio
 import logging
 import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
 from urllib.parse import urljoin
 
 import jwt
-from aiohttp import ClientResponse, ClientSession
+import orjson
+from aiohttp import ClientConnectionError, ClientResponse, ClientResponseError, ClientSession
 from aiohttp.web import HTTPException
 from dataclasses_json import LetterCase, dataclass_json
 
-from .utils import datetime_field
+from .metrics import RequestMetrics
+from .ratelimit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, TokenBucketLimiter, request_priority
+from .resilience import CIRCUIT_OPEN, CircuitBreaker, CircuitOpenError, backoff_delay
+from .utils import as_utc, compile_decoder, datetime_field, iter_json_array
 
 API_BASE_URL = "https://eapi.charge.space"
 API_VERSION = "v5"
 
+# Renew tokens this many seconds before they expire
+TOKEN_RENEW_MARGIN = 60
+
+# Size of chunks read from streamed responses
+STREAM_CHUNK_SIZE = 16384
+
+# Endpoint classes
+ENDPOINT_CHARGEPOINTS = "chargepoints"
+ENDPOINT_STATUS = "status"
+ENDPOINT_SETTINGS = "settings"
+ENDPOINT_CONNECTOR_SETTINGS = "connector_settings"
+ENDPOINT_CHARGINGSESSIONS = "chargingsessions"
+ENDPOINT_COMMANDS = "commands"
+
+# Response cache time to live in seconds per endpoint class
+DEFAULT_CACHE_TTL = {
+    ENDPOINT_CHARGEPOINTS: 3600,
+    ENDPOINT_STATUS: 5,
+    ENDPOINT_SETTINGS: 300,
+    ENDPOINT_CONNECTOR_SETTINGS: 300,
+    ENDPOINT_CHARGINGSESSIONS: 0,
+}
+
+# Retries of idempotent requests, with exponential backoff in seconds
+RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 10
+
+# Circuit breakers per endpoint class and per account
+ENDPOINT_FAILURE_THRESHOLD = 5
+ACCOUNT_FAILURE_THRESHOLD = 10
+CIRCUIT_RESET_TIMEOUT = 60
+
+# Requests per second and burst size per account
+RATE_LIMIT = 2.0
+RATE_LIMIT_BURST = 10
+
+# Pause after HTTP 429 without Retry-After
+DEFAULT_RETRY_AFTER = 5
+
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChargePointConnector:
     charge_point_id: str
     connector_id: int
@@ -26,7 +75,7 @@ class ChargePointConnector:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChargePoint:
     id: str
     name: str
@@ -39,7 +88,7 @@ class ChargePoint:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChargePointMeasurement:
     phase: str
     current: float
@@ -47,7 +96,7 @@ class ChargePointMeasurement:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChargePointConnectorStatus:
     charge_point_id: str
     connector_id: int
@@ -60,7 +109,7 @@ class ChargePointConnectorStatus:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChargePointStatus:
     id: str
     status: str
@@ -68,7 +117,7 @@ class ChargePointStatus:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class ChargePointSettings:
     id: str
     dimmer: str
@@ -76,7 +125,7 @@ class ChargePointSettings:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class ChargePointConnectorSettings:
     charge_point_id: str
     connector_id: int
@@ -87,7 +136,7 @@ class ChargePointConnectorSettings:
 
 
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChargingSession:
     id: str
     charge_point_id: str
@@ -98,8 +147,33 @@ class ChargingSession:
     end_time: datetime | None = datetime_field()
 
 
+# Precompiled decoders, used instead of from_dict when decoding responses
+decode_chargepoint = compile_decoder(ChargePoint)
+decode_chargepoint_status = compile_decoder(ChargePointStatus)
+decode_chargepoint_settings = compile_decoder(ChargePointSettings)
+decode_connector_settings = compile_decoder(ChargePointConnectorSettings)
+decode_charging_session = compile_decoder(ChargingSession)
+
+
+def _query_time(value: datetime) -> str:
+    """Format time as the naive UTC timestamps used by the API."""
+    return as_utc(value).replace(tzinfo=None).isoformat()
+
+
+async def _read_json(response: ClientResponse) -> Any:
+    return orjson.loads(await response.read())
+
+
+@dataclass
+class _CacheEntry:
+    payload: Any
+    expires: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
 @dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartAuth:
     rfid_length: int
     rfid_format: str
@@ -114,26 +188,86 @@ class ChargeAmpsClient:
         password: str,
         api_key: str,
         api_base_url: str | None = None,
+        token_renew_margin: float = TOKEN_RENEW_MARGIN,
+        cache_ttl: dict[str, float] | None = None,
+        retries: int = RETRIES,
+        rate_limit: float = RATE_LIMIT,
+        rate_limit_burst: int = RATE_LIMIT_BURST,
+        endpoint_rate_limits: dict[str, tuple[float, int]] | None = None,
+        session: ClientSession | None = None,
     ):
         self._logger = logging.getLogger(__name__).getChild(self.__class__.__name__)
         self._email = email
         self._password = password
         self._api_key = api_key
-        self._session = ClientSession(raise_for_status=True)
+        # Share the caller's session (and its connection pool) if given
+        self._owns_session = session is None
+        self._session = session or ClientSession()
         self._headers = {}
         self._base_url = api_base_url or API_BASE_URL
         self._ssl = False
         self._token = None
         self._token_expire = 0
         self._refresh_token = None
+        self._token_renew_margin = token_renew_margin
+        self._token_task: asyncio.Task | None = None
+        self._token_renew_timer: asyncio.Task | None = None
+        self._cache_ttl = cache_ttl or {}
+        self._cache: dict[str, _CacheEntry] = {}
+        self._retries = retries
+        self._account_breaker = CircuitBreaker("account", ACCOUNT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+        self._endpoint_breakers: dict[str, CircuitBreaker] = defaultdict(
+            lambda: CircuitBreaker("endpoint", ENDPOINT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT)
+        )
+        self._rate_limiter = TokenBucketLimiter(rate_limit, rate_limit_burst)
+        self.metrics = RequestMetrics()
+        self._endpoint_rate_limiters = {
+            endpoint: TokenBucketLimiter(rate, burst) for endpoint, (rate, burst) in (endpoint_rate_limits or {}).items()
+        }
 
     async def shutdown(self) -> None:
-        await self._session.close()
+        if self._token_renew_timer is not None:
+            self._token_renew_timer.cancel()
+        if self._owns_session:
+            await self._session.close()
 
     async def _ensure_token(self) -> None:
         if self._token_expire > time.time():
             return
-
+        await self._renew_token_once()
+
+    async def _renew_token_once(self) -> None:
+        """Renew token, concurrent callers share a single renewal."""
+        if self._token_task is None:
+            self._token_task = asyncio.create_task(self._renew_token())
+            self._token_task.add_done_callback(self._renew_token_done)
+        # Shield the renewal so a cancelled caller does not cancel it for everyone else
+        await asyncio.shield(self._token_task)
+
+    def _renew_token_done(self, task: asyncio.Task) -> None:
+        self._token_task = None
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._token_renew_timer is not None:
+            self._token_renew_timer.cancel()
+            self._token_renew_timer = None
+        delay = self._token_expire - self._token_renew_margin - time.time()
+        if delay <= 0:
+            # Token lifetime unknown or too short for proactive renewal
+            return
+        self._token_renew_timer = asyncio.create_task(self._renew_token_later(delay))
+
+    async def _renew_token_later(self, delay: float) -> None:
+        """Proactively renew token before it expires."""
+        await asyncio.sleep(delay)
+        self._token_renew_timer = None
+        self._logger.debug("Proactive token renewal")
+        try:
+            await self._renew_token_once()
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.warning("Proactive token renewal failed: %s", exc)
+
+    async def _renew_token(self) -> None:
         if self._token is None:
             self._logger.info("Token not found")
         elif self._token_expire > 0:
@@ -148,10 +282,11 @@ class ChargeAmpsClient:
                     urljoin(self._base_url, f"/api/{API_VERSION}/auth/refreshToken"),
                     ssl=self._ssl,
                     headers={"apiKey": self._api_key},
+                    raise_for_status=True,
                     json={"token": self._token, "refreshToken": self._refresh_token},
                 )
                 self._logger.debug("Refresh successful")
-            except HTTPException:
+            except (ClientResponseError, HTTPException):
                 self._logger.warning("Token refresh failed")
                 self._token = None
                 self._refresh_token = None
@@ -165,10 +300,11 @@ class ChargeAmpsClient:
                     urljoin(self._base_url, f"/api/{API_VERSION}/auth/login"),
                     ssl=self._ssl,
                     headers={"apiKey": self._api_key},
+                    raise_for_status=True,
                     json={"email": self._email, "password": self._password},
                 )
                 self._logger.debug("Login successful")
-            except HTTPException as exc:
+            except (ClientResponseError, HTTPException) as exc:
                 self._logger.error("Login failed")
                 self._token = None
                 self._refresh_token = None
@@ -189,29 +325,182 @@ class ChargeAmpsClient:
 
         self._headers["Authorization"] = f"Bearer {self._token}"
 
-    async def _post(self, path, **kwargs) -> ClientResponse:
-        await self._ensure_token()
-        headers = kwargs.pop("headers", self._headers)
-        return await self._session.post(urljoin(self._base_url, path), ssl=self._ssl, headers=headers, **kwargs)
-
-    async def _get(self, path, **kwargs) -> ClientResponse:
-        await self._ensure_token()
-        headers = kwargs.pop("headers", self._headers)
-        return await self._session.get(urljoin(self._base_url, path), ssl=self._ssl, headers=headers, **kwargs)
+    def is_available(self, endpoint: str | None = None) -> bool:
+        """Return False if requests (to endpoint class) are blocked by an open circuit breaker."""
+        if not self._account_breaker.allow_request():
+            return False
+        return endpoint is None or self._endpoint_breakers[endpoint].allow_request()
+
+    def get_circuit_states(self) -> dict[str, str]:
+        """Return circuit breaker states for the account and each endpoint class."""
+        res = {"account": self._account_breaker.state}
+        for endpoint, breaker in self._endpoint_breakers.items():
+            res[endpoint] = breaker.state
+        return res
 
-    async def _put(self, path, **kwargs) -> ClientResponse:
-        await self._ensure_token()
-        headers = kwargs.pop("headers", self._headers)
-        return await self._session.put(urljoin(self._base_url, path), ssl=self._ssl, headers=headers, **kwargs)
+    @staticmethod
+    def _is_transient(exc: Exception) -> bool:
+        """Return True for errors caused by the network or the server rather than the request."""
+        if isinstance(exc, ClientResponseError):
+            return exc.status >= 500
+        return isinstance(exc, (ClientConnectionError, TimeoutError))
+
+    @staticmethod
+    def _get_retry_after(exc: Exception) -> float | None:
+        """Return seconds to wait if the server asked us to back off."""
+        if not isinstance(exc, ClientResponseError) or exc.status not in (429, 503):
+            return None
+        value = exc.headers.get("Retry-After") if exc.headers else None
+        if value is None:
+            return DEFAULT_RETRY_AFTER if exc.status == 429 else None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER
+
+    async def _acquire_rate_limit(self, method: str, endpoint: str) -> None:
+        priority = request_priority.get()
+        if priority is None:
+            priority = PRIORITY_BACKGROUND if method == "GET" else PRIORITY_INTERACTIVE
+        if endpoint in self._endpoint_rate_limiters:
+            await self._endpoint_rate_limiters[endpoint].acquire(priority)
+        await self._rate_limiter.acquire(priority)
+
+    async def _request(self, method: str, path, endpoint: str, **kwargs) -> ClientResponse:
+        """Send request and read the response body, metering both."""
+        response, started = await self._send(method, path, endpoint, **kwargs)
+        try:
+            body = await response.read()
+        except Exception:
+            self.metrics.record(endpoint, time.monotonic() - started, error=True)
+            raise
+        self.metrics.record(endpoint, time.monotonic() - started, len(body))
+        return response
+
+    async def _send(self, method: str, path, endpoint: str, **kwargs) -> tuple[ClientResponse, float]:
+        """Send request, retrying idempotent requests and guarded by circuit breakers.
+
+        Return the response, with the body not read yet, and the time it was sent.
+        The caller records metrics once the body has been read.
+        """
+        breakers = (self._account_breaker, self._endpoint_breakers[endpoint])
+        if not self.is_available(endpoint):
+            raise CircuitOpenError(f"Circuit open, not requesting {path}")
+        # Half open circuits let only this request through until it is done
+        trials = [breaker for breaker in breakers if breaker.begin_request()]
+        try:
+            return await self._request_attempts(method, path, endpoint, breakers, **kwargs)
+        finally:
+            for breaker in trials:
+                breaker.end_trial()
+
+    async def _request_attempts(
+        self, method: str, path, endpoint: str, breakers: tuple[CircuitBreaker, ...], **kwargs
+    ) -> tuple[ClientResponse, float]:
+        attempts = self._retries + 1 if method == "GET" else 1
+        extra_headers = kwargs.pop("headers", {})
+        for attempt in range(attempts):
+            try:
+                await self._acquire_rate_limit(method, endpoint)
+                await self._ensure_token()
+                headers = {**self._headers, **extra_headers}
+                started = time.monotonic()
+                try:
+                    response = await self._session.request(
+                        method, urljoin(self._base_url, path), ssl=self._ssl, headers=headers, raise_for_status=True, **kwargs
+                    )
+                except Exception:
+                    self.metrics.record(endpoint, time.monotonic() - started, error=True)
+                    raise
+            except Exception as exc:
+                retry_after = self._get_retry_after(exc)
+                if retry_after is not None:
+                    # The rate limiter holds back all requests of the account until then
+                    self._logger.warning("Rate limited by server, pausing requests for %.0f s", retry_after)
+                    self._rate_limiter.pause(retry_after)
+                elif self._is_transient(exc):
+                    for breaker in breakers:
+                        breaker.record_failure()
+                else:
+                    raise
+                if attempt + 1 >= attempts or any(breaker.state == CIRCUIT_OPEN for breaker in breakers):
+                    raise
+                if retry_after is None:
+                    delay = backoff_delay(attempt, RETRY_BACKOFF_BASE, RETRY_BACKOFF_CAP)
+                    self._logger.debug("Request %s %s failed (%s), retry in %.1f s", method, path, exc, delay)
+                    await asyncio.sleep(delay)
+            else:
+                for breaker in breakers:
+                    breaker.record_success()
+                return response, started
+
+    async def _post(self, path, endpoint: str = ENDPOINT_COMMANDS, **kwargs) -> ClientResponse:
+        return await self._request("POST", path, endpoint, **kwargs)
+
+    async def _get(self, path, endpoint: str, **kwargs) -> ClientResponse:
+        return await self._request("GET", path, endpoint, **kwargs)
+
+    async def _put(self, path, endpoint: str = ENDPOINT_COMMANDS, **kwargs) -> ClientResponse:
+        return await self._request("PUT", path, endpoint, **kwargs)
+
+    async def _get_json(self, path, endpoint: str, fresh: bool = False) -> Any:
+        """Get JSON payload, cached according to the endpoint class time to live.
+
+        If fresh, the cached payload is revalidated even if it has not expired.
+        """
+        ttl = self._cache_ttl.get(endpoint, 0)
+        if ttl <= 0:
+            response = await self._get(path, endpoint)
+            return await _read_json(response)
+
+        entry = self._cache.get(path)
+        if entry is not None and not fresh and entry.expires > time.monotonic():
+            self._logger.debug("Cache hit for %s", path)
+            self.metrics.record_cache_hit(endpoint)
+            return entry.payload
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        response = await self._get(path, endpoint, headers=headers)
+        if response.status == 304 and entry is not None:
+            # Return the connection to the pool, there is no body to read
+            async with response:
+                pass
+            self._logger.debug("Cache revalidated for %s", path)
+            self.metrics.record_cache_hit(endpoint)
+            entry.expires = time.monotonic() + ttl
+            return entry.payload
+
+        payload = await _read_json(response)
+        self._cache[path] = _CacheEntry(
+            payload=payload,
+            expires=time.monotonic() + ttl,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return payload
+
+    def _cache_update(self, path, endpoint: str, payload: Any) -> None:
+        """Update cached payload after a successful write."""
+        ttl = self._cache_ttl.get(endpoint, 0)
+        if ttl > 0:
+            self._cache[path] = _CacheEntry(payload=payload, expires=time.monotonic() + ttl)
+
+    def _cache_invalidate(self, path) -> None:
+        self._cache.pop(path, None)
 
     async def get_chargepoints(self) -> list[ChargePoint]:
         """Get all owned chargepoints"""
         request_uri = f"/api/{API_VERSION}/chargepoints/owned"
-        response = await self._get(request_uri)
-        res = []
-        for chargepoint in await response.json():
-            res.append(ChargePoint.from_dict(chargepoint))
-        return res
+        return [decode_chargepoint(chargepoint) for chargepoint in await self._get_json(request_uri, ENDPOINT_CHARGEPOINTS)]
 
     async def get_all_chargingsessions(
         self,
@@ -222,50 +511,83 @@ class ChargeAmpsClient:
         """Get all charging sessions"""
         query_params = {}
         if start_time:
-            query_params["startTime"] = start_time.isoformat()
+            query_params["startTime"] = _query_time(start_time)
         if end_time:
-            query_params["endTime"] = end_time.isoformat()
+            query_params["endTime"] = _query_time(end_time)
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/chargingsessions"
-        response = await self._get(request_uri, params=query_params)
-        res = []
-        for session in await response.json():
-            res.append(ChargingSession.from_dict(session))
-        return res
+        response = await self._get(request_uri, ENDPOINT_CHARGINGSESSIONS, params=query_params)
+        return [decode_charging_session(session) for session in await _read_json(response)]
+
+    async def iter_chargingsessions(
+        self,
+        charge_point_id: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> AsyncIterator[ChargingSession]:
+        """Get charging sessions, decoded one at a time as the response arrives"""
+        query_params = {}
+        if start_time:
+            query_params["startTime"] = _query_time(start_time)
+        if end_time:
+            query_params["endTime"] = _query_time(end_time)
+        request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/chargingsessions"
+        response, started = await self._send("GET", request_uri, ENDPOINT_CHARGINGSESSIONS, params=query_params)
+        size = 0
+        failed = False
+
+        async def chunks() -> AsyncIterator[bytes]:
+            nonlocal size
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                size += len(chunk)
+                yield chunk
+
+        try:
+            # Release the connection even if the caller stops iterating early
+            async with response:
+                async for session in iter_json_array(chunks()):
+                    yield decode_charging_session(session)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            # Metered once the body has been consumed, as far as the caller read it
+            self.metrics.record(ENDPOINT_CHARGINGSESSIONS, time.monotonic() - started, size, error=failed)
 
     async def get_chargingsession(self, charge_point_id: str, session: int) -> ChargingSession:
         """Get charging session"""
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/chargingsessions/{session}"
-        response = await self._get(request_uri)
-        payload = await response.json()
-        return ChargingSession.from_dict(payload)
+        response = await self._get(request_uri, ENDPOINT_CHARGINGSESSIONS)
+        payload = await _read_json(response)
+        return decode_charging_session(payload)
 
     async def get_chargepoint_status(self, charge_point_id: str) -> ChargePointStatus:
         """Get charge point status"""
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/status"
-        response = await self._get(request_uri)
-        payload = await response.json()
-        return ChargePointStatus.from_dict(payload)
+        payload = await self._get_json(request_uri, ENDPOINT_STATUS)
+        return decode_chargepoint_status(payload)
 
-    async def get_chargepoint_settings(self, charge_point_id: str) -> ChargePointSettings:
+    async def get_chargepoint_settings(self, charge_point_id: str, fresh: bool = False) -> ChargePointSettings:
         """Get chargepoint settings"""
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/settings"
-        response = await self._get(request_uri)
-        payload = await response.json()
-        return ChargePointSettings.from_dict(payload)
+        payload = await self._get_json(request_uri, ENDPOINT_SETTINGS, fresh=fresh)
+        return decode_chargepoint_settings(payload)
 
     async def set_chargepoint_settings(self, settings: ChargePointSettings) -> None:
         """Set chargepoint settings"""
         payload = settings.to_dict()
         charge_point_id = settings.id
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/settings"
-        await self._put(request_uri, json=payload)
+        await self._put(request_uri, ENDPOINT_SETTINGS, json=payload)
+        self._cache_update(request_uri, ENDPOINT_SETTINGS, payload)
+        self._cache_invalidate(f"/api/{API_VERSION}/chargepoints/{charge_point_id}/status")
 
-    async def get_chargepoint_connector_settings(self, charge_point_id: str, connector_id: int) -> ChargePointConnectorSettings:
+    async def get_chargepoint_connector_settings(
+        self, charge_point_id: str, connector_id: int, fresh: bool = False
+    ) -> ChargePointConnectorSettings:
         """Get all owned chargepoints"""
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/connectors/{connector_id}/settings"
-        response = await self._get(request_uri)
-        payload = await response.json()
-        return ChargePointConnectorSettings.from_dict(payload)
+        payload = await self._get_json(request_uri, ENDPOINT_CONNECTOR_SETTINGS, fresh=fresh)
+        return decode_connector_settings(payload)
 
     async def set_chargepoint_connector_settings(self, settings: ChargePointConnectorSettings) -> None:
         """Get all owned chargepoints"""
@@ -273,20 +595,25 @@ class ChargeAmpsClient:
         charge_point_id = settings.charge_point_id
         connector_id = settings.connector_id
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/connectors/{connector_id}/settings"
-        await self._put(request_uri, json=payload)
+        await self._put(request_uri, ENDPOINT_CONNECTOR_SETTINGS, json=payload)
+        self._cache_update(request_uri, ENDPOINT_CONNECTOR_SETTINGS, payload)
+        self._cache_invalidate(f"/api/{API_VERSION}/chargepoints/{charge_point_id}/status")
 
     async def remote_start(self, charge_point_id: str, connector_id: int, start_auth: StartAuth) -> None:
         """Remote start chargepoint"""
         payload = start_auth.to_dict()
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/connectors/{connector_id}/remotestart"
         await self._put(request_uri, json=payload)
+        self._cache_invalidate(f"/api/{API_VERSION}/chargepoints/{charge_point_id}/status")
 
     async def remote_stop(self, charge_point_id: str, connector_id: int) -> None:
         """Remote stop chargepoint"""
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/connectors/{connector_id}/remotestop"
         await self._put(request_uri, json="{}")
+        self._cache_invalidate(f"/api/{API_VERSION}/chargepoints/{charge_point_id}/status")
 
     async def reboot(self, charge_point_id) -> None:
         """Reboot chargepoint"""
         request_uri = f"/api/{API_VERSION}/chargepoints/{charge_point_id}/reboot"
         await self._put(request_uri, json="{}")
+        self._cache_invalidate(f"/api/{API_VERSION}/chargepoints/{charge_point_id}/status")
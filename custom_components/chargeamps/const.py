@@ -5,6 +5,10 @@ from datetime import timedelta
 # Base component constants
 DOMAIN = "chargeamps"
 DOMAIN_DATA = f"{DOMAIN}_data"
+
+# Dispatched when chargepoints or connectors are found after entities have been set up
+SIGNAL_ADD_CHARGEPOINT = f"{DOMAIN}_add_chargepoint"
+SIGNAL_ADD_CONNECTORS = f"{DOMAIN}_add_connectors"
 VERSION = "1.12.1"
 PLATFORMS = ["sensor", "switch", "light"]
 ISSUE_URL = "https://github.com/kirei/hass-chargeamps/issues"
@@ -19,11 +23,26 @@ ICON_MAP = {
 }
 
 # Configuration
+CONF_ACCOUNTS = "accounts"
 CONF_CHARGEPOINTS = "chargepoints"
 CONF_READONLY = "readonly"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_OPTIMISTIC = "optimistic"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+CONF_ENDPOINT_RATE_LIMITS = "endpoint_rate_limits"
+CONF_CONNECTION_LIMIT = "connection_limit"
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+CONF_STATISTICS = "statistics"
+CONF_OCPP = "ocpp"
+CONF_ID_TAGS = "id_tags"
+CONF_ACCEPT_ANY_ID_TAG = "accept_any_id_tag"
 
 # Defaults
 DEFAULT_NAME = DOMAIN
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_OCPP_HOST = "0.0.0.0"
+DEFAULT_OCPP_PORT = 9000
 
 # Possible dimmer values
 DIMMER_VALUES = ["off", "low", "medium", "high"]
@@ -31,5 +50,36 @@ DIMMER_VALUES = ["off", "low", "medium", "high"]
 # Overall scan interval
 SCAN_INTERVAL = timedelta(seconds=10)
 
+# Settings rarely change and are re-read less often than status
+SETTINGS_SCAN_INTERVAL = timedelta(minutes=15)
+
+# Settings changes within this window are merged into a single write
+WRITE_DEBOUNCE = timedelta(milliseconds=500)
+
+# Settings older than this are re-read before a write, so changes made elsewhere are not reverted
+SETTINGS_MAX_AGE = timedelta(seconds=30)
+
+# Optimistic state is rolled back if a command is not acknowledged in time
+OPTIMISTIC_TIMEOUT = timedelta(seconds=30)
+
+# Energy of closed sessions is imported into long-term statistics this often
+STATISTICS_INTERVAL = timedelta(hours=1)
+
 # Chargepoint online status
 CHARGEPOINT_ONLINE = "Online"
+
+# Connector status
+CONNECTOR_AVAILABLE = "Available"
+CONNECTOR_CHARGING = "Charging"
+
+# Adaptive polling, the configured scan interval is used for connected connectors
+FAST_SCAN_INTERVAL = timedelta(seconds=10)
+IDLE_SCAN_INTERVAL = timedelta(minutes=2)
+OFFLINE_SCAN_INTERVAL = timedelta(minutes=5)
+BOOST_DURATION = timedelta(minutes=1)
+
+# Chargepoints connected to the local OCPP central system push their status, the cloud is polled rarely
+LOCAL_SCAN_INTERVAL = timedelta(minutes=5)
+
+# Refreshes are spread evenly over the scan interval, each randomly moved by up to this fraction of its slot
+SCHEDULE_JITTER = 0.2
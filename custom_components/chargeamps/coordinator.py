@@ -0,0 +1,94 @@
+"""Data update coordinator for Chargeamps."""
+
+import logging
+import time
+from datetime import timedelta
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .client import ChargePointStatus
+from .const import (
+    BOOST_DURATION,
+    CHARGEPOINT_ONLINE,
+    CONNECTOR_AVAILABLE,
+    CONNECTOR_CHARGING,
+    DOMAIN,
+    FAST_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL,
+    LOCAL_SCAN_INTERVAL,
+    OFFLINE_SCAN_INTERVAL,
+)
+from .scheduler import FleetScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ChargeampsCoordinator(DataUpdateCoordinator):
+    """Coordinate refreshes of a single chargepoint, polling adapted to its state.
+
+    Charging chargepoints are polled fast, idle and offline ones slowly. After
+    a command or a status transition the chargepoint is polled fast for a
+    while to pick up the result quickly. Refreshes are placed in the
+    chargepoint's slot of the fleet scheduler.
+    """
+
+    def __init__(self, hass, charge_point_id, update_method, scan_interval: timedelta, scheduler: FleetScheduler):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} {charge_point_id}",
+            update_method=update_method,
+            update_interval=scan_interval,
+        )
+        self.charge_point_id = charge_point_id
+        self.scan_interval = scan_interval
+        self.poll_interval = scan_interval
+        self.scheduler = scheduler
+        self._boost_until = 0.0
+        self._last_state = None
+        self.local = False
+
+    def boost(self) -> None:
+        """Poll fast for a while, e.g. after a command."""
+        self._boost_until = time.monotonic() + BOOST_DURATION.total_seconds()
+
+    def _adapt_update_interval(self, status: ChargePointStatus | None) -> None:
+        if status is not None:
+            self._adapt_poll_interval(status)
+        # Wait for the next slot rather than a whole interval from now
+        self.update_interval = self.scheduler.next_delay(self.charge_point_id, self.poll_interval)
+
+    def _adapt_poll_interval(self, status: ChargePointStatus) -> None:
+        state = (status.status, tuple(c.status for c in status.connector_statuses))
+        if self._last_state is not None and state != self._last_state:
+            _LOGGER.debug("Chargepoint %s changed state to %s", self.charge_point_id, state)
+            self.boost()
+        self._last_state = state
+
+        connector_statuses = state[1]
+        if self.local:
+            interval = LOCAL_SCAN_INTERVAL
+        elif time.monotonic() < self._boost_until or CONNECTOR_CHARGING in connector_statuses:
+            interval = FAST_SCAN_INTERVAL
+        elif status.status != CHARGEPOINT_ONLINE:
+            interval = OFFLINE_SCAN_INTERVAL
+        elif all(s == CONNECTOR_AVAILABLE for s in connector_statuses):
+            interval = max(IDLE_SCAN_INTERVAL, self.scan_interval)
+        else:
+            interval = self.scan_interval
+        if interval != self.poll_interval:
+            _LOGGER.debug("Chargepoint %s scan interval %s", self.charge_point_id, interval)
+            self.poll_interval = interval
+
+    async def _async_update_data(self) -> ChargePointStatus:
+        status = None
+        try:
+            status = await super()._async_update_data()
+            return status
+        finally:
+            # Failed refreshes are retried in the next slot too
+            self._adapt_update_interval(status)
+
+    def async_set_updated_data(self, data: ChargePointStatus) -> None:
+        self._adapt_update_interval(data)
+        super().async_set_updated_data(data)
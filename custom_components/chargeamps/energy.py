@@ -0,0 +1,77 @@
+"""Incremental total energy accounting for Chargeamps."""
+
+import logging
+from collections.abc import AsyncIterable
+from datetime import UTC, datetime, timedelta
+
+from .client import ChargingSession
+from .sessions import ChargingSessionIndex
+from .utils import as_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sessions are queried with some overlap below the high-water mark, sessions
+# already stored are recognized by their key and skipped.
+QUERY_OVERLAP = timedelta(minutes=5)
+
+
+class EnergyAccumulator:
+    """Keep a running total of consumed energy per chargepoint.
+
+    Closed sessions are appended to the session store exactly once. The
+    high-water mark is the start time of the oldest open session, or of the
+    newest stored session if nothing is open, so only sessions from that point
+    on need to be fetched. Open sessions contribute their live consumption on
+    top of the stored total.
+    """
+
+    def __init__(self, store: ChargingSessionIndex):
+        self._store = store
+        self._settled_until: dict[str, datetime] = {}
+
+    def query_start_time(self, charge_point_id: str) -> datetime | None:
+        """Return start time for the next session query, None for full history."""
+        high_water_mark = self._store.get_high_water_mark(charge_point_id)
+        if high_water_mark is None:
+            return None
+        return high_water_mark - QUERY_OVERLAP
+
+    def get_settled_until(self, charge_point_id: str) -> datetime | None:
+        """Return time before which all sessions are closed and stored, None before the first update."""
+        return self._settled_until.get(charge_point_id)
+
+    async def async_update(self, charge_point_id: str, sessions: AsyncIterable[ChargingSession]) -> float:
+        """Account sessions streamed from the query start time and return the total energy.
+
+        Sessions are consumed one at a time, so memory use does not depend on
+        the length of the history.
+        """
+        # Sessions starting after the query was sent are not known to be closed
+        queried = datetime.now(UTC)
+        added = 0
+        open_total = 0.0
+        oldest_open: datetime | None = None
+        async for session in sessions:
+            if session.end_time is None:
+                open_total += session.total_consumption_kwh
+                start_time = as_utc(session.start_time)
+                if start_time is not None and (oldest_open is None or start_time < oldest_open):
+                    oldest_open = start_time
+            elif self._store.add_session(charge_point_id, session):
+                added += 1
+        if added:
+            _LOGGER.debug("Stored %d new sessions for chargepoint %s", added, charge_point_id)
+            self._store.schedule_save()
+        high_water_mark = oldest_open if oldest_open is not None else self._store.get_last_start_time(charge_point_id)
+        self._store.set_high_water_mark(charge_point_id, high_water_mark)
+        self._settled_until[charge_point_id] = oldest_open if oldest_open is not None else queried
+
+        closed_total = self._store.get_total_energy(charge_point_id)
+        _LOGGER.debug(
+            "Chargepoint %s closed sessions %f kWh, open sessions %f kWh, high-water mark %s",
+            charge_point_id,
+            closed_total,
+            open_total,
+            high_water_mark,
+        )
+        return closed_total + open_total
@@ -1,40 +1,70 @@
 """Light platform for Chargeamps."""
 
 import logging
+from dataclasses import replace
 
 from homeassistant.components.light import (
     ColorMode,
     LightEntity,
     filter_supported_color_modes,
 )
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from . import ChargeampsEntity
-from .const import DOMAIN, DOMAIN_DATA, SCAN_INTERVAL  # noqa
+from .const import DOMAIN, DOMAIN_DATA, SCAN_INTERVAL, SIGNAL_ADD_CHARGEPOINT  # noqa
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):  # pylint: disable=unused-argument
     """Setup light platform."""
-    lights = []
     handler = hass.data[DOMAIN_DATA]["handler"]
+
+    @callback
+    def _async_add_chargepoint(cp_id):
+        if handler.get_chargepoint_settings(cp_id) is None:
+            # Available lights are known from the settings, wait for the initial refresh
+            _async_add_lights_when_ready(hass, handler, cp_id, async_add_entities)
+        else:
+            async_add_entities(_create_lights(hass, handler, cp_id))
+
     for cp_id in handler.charge_point_ids:
-        cp_info = handler.get_chargepoint_info(cp_id)
-        cp_settings = handler.get_chargepoint_settings(cp_id)
-        _LOGGER.debug("%s", cp_settings)
-        _type_to_snake = {
-                "dimmer": "dimmer",
-                "downlight":"down_light"}
-        for _type in ("dimmer", "downlight"):
-            val = getattr(cp_settings, _type_to_snake[_type], None) if cp_settings else None
-            if val is not None:
-                lights.append(ChargeampsLight(hass, f"{cp_info.name}_{cp_id}_{_type}", cp_id, _type))
-                _LOGGER.info(
-                    "Adding chargepoint %s light %s",
-                    cp_id,
-                    _type,
-                )
-    async_add_entities(lights, True)
+        _async_add_chargepoint(cp_id)
+    async_dispatcher_connect(hass, SIGNAL_ADD_CHARGEPOINT, _async_add_chargepoint)
+
+
+@callback
+def _async_add_lights_when_ready(hass, handler, cp_id, async_add_entities):
+    """Add lights for chargepoint once its settings have been fetched."""
+    coordinator = handler.coordinators[cp_id]
+
+    @callback
+    def _handle_coordinator_update():
+        if handler.get_chargepoint_settings(cp_id) is None:
+            return
+        unsubscribe()
+        async_add_entities(_create_lights(hass, handler, cp_id))
+
+    unsubscribe = coordinator.async_add_listener(_handle_coordinator_update)
+
+
+def _create_lights(hass, handler, cp_id):
+    lights = []
+    cp_info = handler.get_chargepoint_info(cp_id)
+    cp_settings = handler.get_chargepoint_settings(cp_id)
+    _LOGGER.debug("%s", cp_settings)
+    _type_to_snake = {"dimmer": "dimmer", "downlight": "down_light"}
+    for _type in ("dimmer", "downlight"):
+        val = getattr(cp_settings, _type_to_snake[_type], None) if cp_settings else None
+        if val is not None:
+            lights.append(ChargeampsLight(hass, f"{cp_info.name}_{cp_id}_{_type}", cp_id, _type))
+            _LOGGER.info(
+                "Adding chargepoint %s light %s",
+                cp_id,
+                _type,
+            )
+    return lights
 
 
 class ChargeampsLight(LightEntity, ChargeampsEntity):
@@ -52,6 +82,25 @@ class ChargeampsLight(LightEntity, ChargeampsEntity):
         supported_color_modes = filter_supported_color_modes(supported_color_modes)
         self._attr_supported_color_modes = supported_color_modes
         self._attr_color_mode = next(iter(self._attr_supported_color_modes))
+        self._optimistic_settings = None
+
+    @callback
+    def _update_from_handler(self):
+        """Update the light."""
+        self._optimistic_settings = None
+
+    def _state_snapshot(self) -> tuple:
+        return (*super()._state_snapshot(), self.brightness)
+
+    @property
+    def _settings(self):
+        return self._optimistic_settings or self.handler.get_chargepoint_settings(self.charge_point_id)
+
+    def _apply_optimistic(self, value):
+        if self._light_type == "downlight":
+            self._optimistic_settings = replace(self._settings, down_light=value)
+        else:
+            self._optimistic_settings = replace(self._settings, dimmer=value.capitalize())
 
     @property
     def unique_id(self):
@@ -60,7 +109,7 @@ class ChargeampsLight(LightEntity, ChargeampsEntity):
 
     @property
     def is_on(self):
-        settings = self.handler.get_chargepoint_settings(self.charge_point_id)
+        settings = self._settings
         if self._light_type == "downlight":
             status = settings.down_light
         elif self._light_type == "dimmer":
@@ -79,18 +128,20 @@ class ChargeampsLight(LightEntity, ChargeampsEntity):
                 brightness = "high"
         else:
             brightness = True if self._light_type == "downlight" else "high"
-        await self.handler.async_set_light({"chargepoint": self.charge_point_id, self._light_type: brightness})
+        await self._async_command(
+            self.handler.async_set_light({"chargepoint": self.charge_point_id, self._light_type: brightness}),
+            lambda: self._apply_optimistic(brightness),
+        )
 
     async def async_turn_off(self):
-        await self.handler.async_set_light(
-            {
-                "chargepoint": self.charge_point_id,
-                self._light_type: False if self._light_type == "downlight" else "off",
-            }
+        value = False if self._light_type == "downlight" else "off"
+        await self._async_command(
+            self.handler.async_set_light({"chargepoint": self.charge_point_id, self._light_type: value}),
+            lambda: self._apply_optimistic(value),
         )
 
     @property
     def brightness(self):
         """Return the brightness of this light between 0..255."""
         brightness = {"Off": 0, "Low": 85, "Medium": 170, "High": 255}
-        return brightness.get(self.handler.get_chargepoint_settings(self.charge_point_id).dimmer)
+        return brightness.get(self._settings.dimmer)
@@ -0,0 +1,144 @@
+"""Request and refresh metrics for Chargeamps"""
+
+import bisect
+import math
+import time
+from collections import defaultdict
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+# A refresh is late if it starts this much later than its update interval
+LATE_TOLERANCE = 1.5
+
+
+class EndpointMetrics:
+    """Counters and latency histogram for requests to an endpoint class."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.bytes_received = 0
+        self.latency_total = 0.0
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+
+    def record(self, latency: float, size: int = 0, error: bool = False) -> None:
+        self.requests += 1
+        if error:
+            self.errors += 1
+        self.bytes_received += size
+        self.latency_total += latency
+        self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def merge(self, other: "EndpointMetrics") -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.cache_hits += other.cache_hits
+        self.bytes_received += other.bytes_received
+        self.latency_total += other.latency_total
+        self.latency_buckets = [a + b for a, b in zip(self.latency_buckets, other.latency_buckets, strict=True)]
+
+    @property
+    def latency_mean(self) -> float | None:
+        return self.latency_total / self.requests if self.requests else None
+
+    def latency_quantile(self, q: float) -> float | None:
+        """Return upper bound of the histogram bucket holding quantile q."""
+        if not self.requests:
+            return None
+        rank = q * self.requests
+        count = 0
+        for bound, bucket in zip(LATENCY_BUCKETS, self.latency_buckets, strict=True):
+            count += bucket
+            if count >= rank:
+                return bound
+        return math.inf
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "bytes_received": self.bytes_received,
+            "latency_total": round(self.latency_total, 3),
+            "latency_mean": round(self.latency_mean, 3) if self.requests else None,
+            "latency_p95": self.latency_quantile(0.95),
+            "latency_histogram": {
+                ("+Inf" if math.isinf(bound) else str(bound)): count
+                for bound, count in zip(LATENCY_BUCKETS, self.latency_buckets, strict=True)
+            },
+        }
+
+
+class RequestMetrics:
+    """Request metrics of an API client, per endpoint class."""
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointMetrics] = defaultdict(EndpointMetrics)
+
+    def record(self, endpoint: str, latency: float, size: int = 0, error: bool = False) -> None:
+        self.endpoints[endpoint].record(latency, size, error)
+
+    def record_cache_hit(self, endpoint: str) -> None:
+        self.endpoints[endpoint].cache_hits += 1
+
+    @classmethod
+    def combine(cls, metrics: list["RequestMetrics"]) -> "RequestMetrics":
+        """Return metrics summed over several clients."""
+        res = cls()
+        for client_metrics in metrics:
+            for endpoint, endpoint_metrics in client_metrics.endpoints.items():
+                res.endpoints[endpoint].merge(endpoint_metrics)
+        return res
+
+    def as_dict(self) -> dict:
+        return {endpoint: metrics.as_dict() for endpoint, metrics in self.endpoints.items()}
+
+
+class RefreshMetrics:
+    """Durations of the refresh cycles of a chargepoint and how well they keep the update interval."""
+
+    def __init__(self):
+        self.cycles = 0
+        self.failures = 0
+        self.late = 0
+        self.last_duration: float | None = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+        self.last_interval: float | None = None
+        self._last_start: float | None = None
+
+    def start(self, update_interval: float | None) -> float:
+        """Record start of a cycle, return start time."""
+        now = time.monotonic()
+        if self._last_start is not None:
+            self.last_interval = now - self._last_start
+            if update_interval and self.last_interval > update_interval * LATE_TOLERANCE:
+                self.late += 1
+        self._last_start = now
+        return now
+
+    def finish(self, started: float, success: bool) -> None:
+        duration = time.monotonic() - started
+        self.cycles += 1
+        if not success:
+            self.failures += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+    @property
+    def mean_duration(self) -> float | None:
+        return self.total_duration / self.cycles if self.cycles else None
+
+    def as_dict(self) -> dict:
+        return {
+            "cycles": self.cycles,
+            "failures": self.failures,
+            "late": self.late,
+            "last_duration": round(self.last_duration, 3) if self.last_duration is not None else None,
+            "mean_duration": round(self.mean_duration, 3) if self.cycles else None,
+            "max_duration": round(self.max_duration, 3),
+            "last_interval": round(self.last_interval, 1) if self.last_interval is not None else None,
+        }
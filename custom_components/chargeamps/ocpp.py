@@ -0,0 +1,374 @@
+"""Local OCPP 1.6J central system for Chargeamps."""
+
+import base64
+import binascii
+import hmac
+import itertools
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import orjson
+from aiohttp import WSMsgType, web
+from ciso8601 import parse_datetime
+
+from .client import ChargePointConnectorStatus, ChargePointMeasurement, ChargePointStatus, ChargingSession
+from .const import CHARGEPOINT_ONLINE, CONNECTOR_AVAILABLE
+from .utils import as_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+OCPP_SUBPROTOCOL = "ocpp1.6"
+OCPP_PATH = "/ocpp"
+
+# OCPP-J message types
+CALL = 2
+CALLRESULT = 3
+CALLERROR = 4
+
+# Heartbeat interval requested from chargepoints, in seconds
+HEARTBEAT_INTERVAL = 300
+
+# Used for power if a chargepoint only reports currents
+NOMINAL_VOLTAGE = 230.0
+
+MEASURAND_ENERGY = "Energy.Active.Import.Register"
+MEASURAND_CURRENT = "Current.Import"
+MEASURAND_VOLTAGE = "Voltage"
+
+# OCPP connector status to Charge-Amps connector status
+STATUS_MAP = {
+    "Available": "Available",
+    "Preparing": "Connected",
+    "Charging": "Charging",
+    "SuspendedEV": "Connected",
+    "SuspendedEVSE": "Connected",
+    "Finishing": "Connected",
+    "Reserved": "Available",
+    "Unavailable": "Disabled",
+    "Faulted": "Error",
+}
+
+
+@dataclass(slots=True)
+class _LocalConnector:
+    status: str = CONNECTOR_AVAILABLE
+    measurements: list[ChargePointMeasurement] | None = None
+    transaction_id: int | None = None
+    meter_start: float | None = None
+    meter: float | None = None
+    start_time: datetime | None = None
+    id_tag: str | None = None
+
+    @property
+    def session_energy(self) -> float:
+        """Return energy of the open transaction in kWh."""
+        if self.transaction_id is None or self.meter is None or self.meter_start is None:
+            return 0.0
+        return max(0.0, self.meter - self.meter_start) / 1000
+
+
+class _LocalChargePoint:
+    """State of a chargepoint connected to the local central system."""
+
+    def __init__(self, charge_point_id: str, connectors: dict[int, _LocalConnector]):
+        self.charge_point_id = charge_point_id
+        self.connectors = connectors
+
+    def connector(self, connector_id: int) -> _LocalConnector:
+        return self.connectors.setdefault(connector_id, _LocalConnector())
+
+    def find_transaction(self, transaction_id: int) -> tuple[int, _LocalConnector] | None:
+        for connector_id, connector in self.connectors.items():
+            if connector.transaction_id == transaction_id:
+                return connector_id, connector
+        return None
+
+    @property
+    def open_energy(self) -> float:
+        return sum(connector.session_energy for connector in self.connectors.values())
+
+    def to_status(self) -> ChargePointStatus:
+        return ChargePointStatus(
+            id=self.charge_point_id,
+            status=CHARGEPOINT_ONLINE,
+            connector_statuses=[
+                ChargePointConnectorStatus(
+                    charge_point_id=self.charge_point_id,
+                    connector_id=connector_id,
+                    total_consumption_kwh=connector.session_energy,
+                    status=connector.status,
+                    measurements=connector.measurements,
+                    start_time=connector.start_time,
+                    session_id=str(connector.transaction_id) if connector.transaction_id is not None else None,
+                )
+                for connector_id, connector in sorted(self.connectors.items())
+            ],
+        )
+
+
+class OcppCentralSystem:
+    """OCPP 1.6J central system, chargepoints push their state over a websocket.
+
+    Chargepoints connect to ws://<host>:<port>/ocpp/<chargepoint id>. Pushed
+    status, meter values and transactions are mapped onto the same models the
+    cloud API provides and handed to the handler, which stops polling the
+    cloud for status while a chargepoint is connected.
+
+    Chargepoints must authenticate using HTTP Basic auth with their chargepoint
+    id as user (OCPP security profile 1). The password is the configured one,
+    or else the chargepoint password known from the account. Only RFID tags in
+    id_tags are authorized, unless accept_any_id_tag is set.
+    """
+
+    def __init__(
+        self,
+        handler,
+        host: str,
+        port: int,
+        password: str | None = None,
+        id_tags: list[str] | None = None,
+        accept_any_id_tag: bool = False,
+    ):
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self._password = password
+        self._id_tags = frozenset(id_tags or ())
+        self._accept_any_id_tag = accept_any_id_tag
+        self.app = web.Application()
+        self.app.router.add_get(OCPP_PATH + "/{charge_point_id}", self._websocket)
+        self._runner: web.AppRunner | None = None
+        self._chargepoints: dict[str, _LocalChargePoint] = {}
+        self._websockets: dict[str, web.WebSocketResponse] = {}
+        self._transaction_ids = itertools.count(int(time.time()))
+        self._actions: dict[str, Callable[[_LocalChargePoint, dict], dict]] = {
+            "Authorize": self._authorize,
+            "BootNotification": self._boot_notification,
+            "DiagnosticsStatusNotification": self._notification,
+            "FirmwareStatusNotification": self._notification,
+            "Heartbeat": self._heartbeat,
+            "MeterValues": self._meter_values,
+            "StartTransaction": self._start_transaction,
+            "StatusNotification": self._status_notification,
+            "StopTransaction": self._stop_transaction,
+        }
+
+    async def async_start(self) -> None:
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        _LOGGER.info("OCPP central system listening on %s:%d", self.host, self.port)
+        if self._accept_any_id_tag:
+            _LOGGER.warning("OCPP central system authorizes every RFID tag, set id_tags to restrict charging")
+        elif not self._id_tags:
+            _LOGGER.warning("OCPP central system rejects every RFID tag, set id_tags to allow charging with a tag")
+
+    async def async_stop(self) -> None:
+        for ws in list(self._websockets.values()):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def is_connected(self, charge_point_id: str) -> bool:
+        return charge_point_id in self._chargepoints
+
+    async def _websocket(self, request: web.Request) -> web.StreamResponse:
+        charge_point_id = request.match_info["charge_point_id"]
+        if charge_point_id not in self.handler.charge_point_ids:
+            _LOGGER.warning("Rejected OCPP connection from unknown chargepoint %s", charge_point_id)
+            raise web.HTTPNotFound()
+        if not self._authenticated(request, charge_point_id):
+            _LOGGER.warning("Rejected OCPP connection from chargepoint %s, authentication failed", charge_point_id)
+            raise web.HTTPUnauthorized(headers={"WWW-Authenticate": 'Basic realm="OCPP"'})
+        ws = web.WebSocketResponse(protocols=(OCPP_SUBPROTOCOL,))
+        await ws.prepare(request)
+        if ws.ws_protocol != OCPP_SUBPROTOCOL:
+            _LOGGER.warning("Chargepoint %s did not negotiate %s", charge_point_id, OCPP_SUBPROTOCOL)
+
+        previous = self._websockets.get(charge_point_id)
+        self._websockets[charge_point_id] = ws
+        chargepoint = self._chargepoints[charge_point_id] = self._create_chargepoint(charge_point_id)
+        if previous is not None:
+            # The chargepoint reconnected, the old connection is stale
+            await previous.close()
+        _LOGGER.info("Chargepoint %s connected locally", charge_point_id)
+        self.handler.set_local_connected(charge_point_id, True)
+        self._push(chargepoint)
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                response = self._handle_message(chargepoint, message.data)
+                if response is not None:
+                    await ws.send_str(response)
+        finally:
+            if self._websockets.get(charge_point_id) is ws:
+                del self._websockets[charge_point_id]
+                del self._chargepoints[charge_point_id]
+                _LOGGER.info("Chargepoint %s disconnected", charge_point_id)
+                self.handler.set_local_connected(charge_point_id, False)
+        return ws
+
+    def _authenticated(self, request: web.Request, charge_point_id: str) -> bool:
+        expected = self._password
+        if expected is None:
+            cp_info = self.handler.get_chargepoint_info(charge_point_id)
+            expected = cp_info.password if cp_info else None
+        if not expected:
+            return False
+        scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "basic":
+            return False
+        try:
+            login, _, password = base64.b64decode(credentials, validate=True).decode().partition(":")
+        except (binascii.Error, UnicodeDecodeError):
+            return False
+        return login == charge_point_id and hmac.compare_digest(password.encode(), expected.encode())
+
+    def _id_tag_info(self, id_tag: str | None) -> dict:
+        if self._accept_any_id_tag or id_tag in self._id_tags:
+            return {"status": "Accepted"}
+        _LOGGER.warning("Rejected unknown RFID tag %s", id_tag)
+        return {"status": "Invalid"}
+
+    def _create_chargepoint(self, charge_point_id: str) -> _LocalChargePoint:
+        """Create local state, starting from the last known connector statuses."""
+        connectors = {}
+        cp_info = self.handler.get_chargepoint_info(charge_point_id)
+        for connector in cp_info.connectors if cp_info else []:
+            known = self.handler.get_connector_status(charge_point_id, connector.connector_id)
+            connectors[connector.connector_id] = _LocalConnector(status=known.status if known else CONNECTOR_AVAILABLE)
+        return _LocalChargePoint(charge_point_id, connectors)
+
+    def _push(self, chargepoint: _LocalChargePoint) -> None:
+        self.handler.set_local_status(chargepoint.charge_point_id, chargepoint.to_status(), chargepoint.open_energy)
+
+    def _handle_message(self, chargepoint: _LocalChargePoint, data: str) -> str | None:
+        """Handle an OCPP-J message, return the response to send."""
+        try:
+            message = orjson.loads(data)
+            message_type, unique_id = message[0], message[1]
+        except (orjson.JSONDecodeError, IndexError, KeyError, TypeError):
+            _LOGGER.warning("Invalid OCPP message from %s: %s", chargepoint.charge_point_id, data)
+            return None
+        if message_type != CALL:
+            # The central system does not send calls, so there are no results to handle
+            return None
+        try:
+            action, payload = message[2], message[3]
+        except IndexError:
+            return self._error(unique_id, "ProtocolError", "Incomplete call")
+        _LOGGER.debug("OCPP %s from %s: %s", action, chargepoint.charge_point_id, payload)
+        handle_action = self._actions.get(action)
+        if handle_action is None:
+            return self._error(unique_id, "NotImplemented", f"{action} not supported")
+        try:
+            result = handle_action(chargepoint, payload)
+        except (KeyError, TypeError, ValueError) as error:
+            _LOGGER.warning("Invalid OCPP %s from %s - %s", action, chargepoint.charge_point_id, error)
+            return self._error(unique_id, "FormationViolation", str(error))
+        return orjson.dumps([CALLRESULT, unique_id, result]).decode()
+
+    @staticmethod
+    def _error(unique_id: str, code: str, description: str) -> str:
+        return orjson.dumps([CALLERROR, unique_id, code, description, {}]).decode()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(UTC).isoformat()
+
+    def _boot_notification(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        _LOGGER.info(
+            "Chargepoint %s booted, %s %s firmware %s",
+            chargepoint.charge_point_id,
+            payload["chargePointVendor"],
+            payload["chargePointModel"],
+            payload.get("firmwareVersion"),
+        )
+        return {"status": "Accepted", "currentTime": self._now(), "interval": HEARTBEAT_INTERVAL}
+
+    def _heartbeat(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        return {"currentTime": self._now()}
+
+    def _authorize(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        return {"idTagInfo": self._id_tag_info(payload.get("idTag"))}
+
+    def _notification(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        return {}
+
+    def _status_notification(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        connector_id = int(payload["connectorId"])
+        status = payload["status"]
+        if connector_id == 0:
+            # Status of the chargepoint as a whole, connectors report their own
+            _LOGGER.debug("Chargepoint %s status %s", chargepoint.charge_point_id, status)
+            return {}
+        chargepoint.connector(connector_id).status = STATUS_MAP.get(status, status)
+        self._push(chargepoint)
+        return {}
+
+    def _meter_values(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        connector_id = int(payload["connectorId"])
+        if connector_id == 0:
+            # Main meter of the chargepoint
+            return {}
+        connector = chargepoint.connector(connector_id)
+        for meter_value in payload["meterValue"]:
+            currents: dict[str, float] = {}
+            voltages: dict[str, float] = {}
+            for sampled_value in meter_value["sampledValue"]:
+                measurand = sampled_value.get("measurand", MEASURAND_ENERGY)
+                phase = sampled_value.get("phase")
+                value = float(sampled_value["value"])
+                if measurand == MEASURAND_ENERGY and phase is None:
+                    connector.meter = value * 1000 if sampled_value.get("unit") == "kWh" else value
+                elif measurand == MEASURAND_CURRENT and phase:
+                    currents[phase[:2]] = value
+                elif measurand == MEASURAND_VOLTAGE and phase:
+                    # Phase to neutral voltage, e.g. L1-N
+                    voltages[phase[:2]] = value
+            if currents:
+                connector.measurements = [
+                    ChargePointMeasurement(phase=phase, current=current, voltage=voltages.get(phase, NOMINAL_VOLTAGE))
+                    for phase, current in sorted(currents.items())
+                ]
+        self._push(chargepoint)
+        return {}
+
+    def _start_transaction(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        connector = chargepoint.connector(int(payload["connectorId"]))
+        connector.transaction_id = next(self._transaction_ids)
+        connector.meter_start = connector.meter = float(payload["meterStart"])
+        connector.start_time = as_utc(parse_datetime(payload["timestamp"]))
+        connector.id_tag = payload.get("idTag")
+        self._push(chargepoint)
+        # A rejected tag still gets a transaction, the chargepoint stops it right away
+        return {"transactionId": connector.transaction_id, "idTagInfo": self._id_tag_info(connector.id_tag)}
+
+    def _stop_transaction(self, chargepoint: _LocalChargePoint, payload: dict) -> dict:
+        transaction_id = int(payload["transactionId"])
+        found = chargepoint.find_transaction(transaction_id)
+        if found is None:
+            # E.g. started before a restart. Sessions are not fetched from the cloud while the chargepoint is
+            # connected locally, its energy is picked up from the cloud history once polling resumes
+            _LOGGER.warning("Chargepoint %s stopped unknown transaction %d", chargepoint.charge_point_id, transaction_id)
+            return {"idTagInfo": {"status": "Accepted"}}
+        connector_id, connector = found
+        connector.meter = float(payload["meterStop"])
+        session = ChargingSession(
+            id=str(transaction_id),
+            charge_point_id=chargepoint.charge_point_id,
+            connector_id=connector_id,
+            session_type="RFID" if connector.id_tag else "Free",
+            total_consumption_kwh=connector.session_energy,
+            start_time=connector.start_time,
+            end_time=as_utc(parse_datetime(payload["timestamp"])),
+        )
+        connector.transaction_id = connector.meter_start = connector.start_time = connector.id_tag = None
+        connector.measurements = None
+        self.handler.add_local_session(chargepoint.charge_point_id, session)
+        self._push(chargepoint)
+        return {"idTagInfo": {"status": "Accepted"}}
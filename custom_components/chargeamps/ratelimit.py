@@ -0,0 +1,88 @@
+"""Rate limiting for the Charge-Amps API Client"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Priority of requests sent from the current context, None to derive it from the request method
+request_priority: ContextVar[int | None] = ContextVar("request_priority", default=None)
+
+
+@contextmanager
+def interactive_requests() -> Iterator[None]:
+    """Send all requests from this context with interactive priority."""
+    token = request_priority.set(PRIORITY_INTERACTIVE)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class TokenBucketLimiter:
+    """Token bucket rate limiter.
+
+    Requests that have to wait are served by priority, and in arrival order
+    within the same priority. The limiter can be paused, e.g. when the server
+    asks to retry after some time.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    async def acquire(self, priority: int = PRIORITY_BACKGROUND) -> None:
+        """Wait until a request may be sent."""
+        if not self._waiters and self._try_take():
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._serve()
+        await future
+
+    def pause(self, seconds: float) -> None:
+        """Do not let any request through for the given number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._serve()
+
+    def _try_take(self) -> bool:
+        now = time.monotonic()
+        if now < self._paused_until:
+            return False
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _serve(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # Waiter was cancelled
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_take():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if self._waiters:
+            now = time.monotonic()
+            delay = max(self._paused_until - now, (1 - self._tokens) / self._rate, 0)
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._serve)
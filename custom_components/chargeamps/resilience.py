@@ -0,0 +1,74 @@
+"""Retry and circuit breaker helpers for the Charge-Amps API Client"""
+
+import random
+import time
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Request not sent since the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stop sending requests for a while after repeated failures.
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests are refused for reset_timeout seconds. Then the circuit is half
+    open and a single trial request is let through, others are refused until
+    it is done: its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CIRCUIT_CLOSED
+        if time.monotonic() - self._opened_at < self._reset_timeout:
+            return CIRCUIT_OPEN
+        return CIRCUIT_HALF_OPEN
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent now, without sending it."""
+        state = self.state
+        return state == CIRCUIT_CLOSED or (state == CIRCUIT_HALF_OPEN and not self._trial_in_flight)
+
+    def begin_request(self) -> bool:
+        """Start an allowed request, return True if it is the trial request of a half open circuit."""
+        if self.state != CIRCUIT_HALF_OPEN:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def end_trial(self) -> None:
+        """Let the next request through as trial, also if the trial ended without success or failure."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self._failures += 1
+        if self._failures >= self._failure_threshold or self._opened_at is not None:
+            self._opened_at = time.monotonic()
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return exponential backoff delay with full jitter for retry attempt (0-based)."""
+    return random.uniform(0, min(cap, base * 2**attempt))
@@ -0,0 +1,56 @@
+"""Staggered refresh scheduling for Chargeamps."""
+
+import math
+import random
+import time
+from datetime import timedelta
+
+from .const import SCHEDULE_JITTER
+
+# Never schedule a refresh closer than this fraction of the interval to the previous one
+MIN_DELAY = 0.25
+
+
+class FleetScheduler:
+    """Spread refreshes of all chargepoints evenly over the scan interval.
+
+    Chargepoint number i of N is refreshed at offset i/N of every interval,
+    moved randomly by a fraction of its slot, instead of all chargepoints
+    refreshing together. Slots are recomputed as chargepoints are added or
+    removed.
+    """
+
+    def __init__(self, jitter: float = SCHEDULE_JITTER):
+        self._jitter = jitter
+        self._charge_point_ids: list[str] = []
+
+    def add(self, charge_point_id: str) -> None:
+        if charge_point_id not in self._charge_point_ids:
+            self._charge_point_ids.append(charge_point_id)
+
+    def remove(self, charge_point_id: str) -> None:
+        if charge_point_id in self._charge_point_ids:
+            self._charge_point_ids.remove(charge_point_id)
+
+    def __len__(self) -> int:
+        return len(self._charge_point_ids)
+
+    def phase(self, charge_point_id: str) -> float:
+        """Return offset of the chargepoint's slot as a fraction of the interval."""
+        try:
+            return self._charge_point_ids.index(charge_point_id) / len(self._charge_point_ids)
+        except ValueError:
+            return 0.0
+
+    def next_delay(self, charge_point_id: str, interval: timedelta, now: float | None = None) -> timedelta:
+        """Return delay until the next slot of the chargepoint."""
+        interval_s = interval.total_seconds()
+        if interval_s <= 0:
+            return interval
+        now = time.monotonic() if now is None else now
+        slot = interval_s / max(len(self._charge_point_ids), 1)
+        offset = self.phase(charge_point_id) * interval_s + random.uniform(-self._jitter, self._jitter) * slot
+        delay = math.ceil((now - offset) / interval_s) * interval_s + offset - now
+        if delay < interval_s * MIN_DELAY:
+            delay += interval_s
+        return timedelta(seconds=delay)
@@ -7,50 +7,99 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import STATE_UNAVAILABLE, UnitOfEnergy, UnitOfPower
+from homeassistant.const import STATE_UNAVAILABLE, EntityCategory, UnitOfEnergy, UnitOfPower, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from . import ChargeampsEntity
-from .const import CHARGEPOINT_ONLINE, DOMAIN_DATA, SCAN_INTERVAL  # noqa
+from .client import (
+    ENDPOINT_CHARGEPOINTS,
+    ENDPOINT_CHARGINGSESSIONS,
+    ENDPOINT_COMMANDS,
+    ENDPOINT_CONNECTOR_SETTINGS,
+    ENDPOINT_SETTINGS,
+    ENDPOINT_STATUS,
+)
+from .const import CHARGEPOINT_ONLINE, DOMAIN, DOMAIN_DATA, SCAN_INTERVAL, SIGNAL_ADD_CHARGEPOINT, SIGNAL_ADD_CONNECTORS  # noqa
 
 _LOGGER = logging.getLogger(__name__)
 
+PHASES = ("l1", "l2", "l3")
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):  # pylint: disable=unused-argument
     """Setup sensor platform."""
     sensors = []
     handler = hass.data[DOMAIN_DATA]["handler"]
     for cp_id in handler.charge_point_ids:
+        sensors.extend(_create_chargepoint_sensors(hass, handler, cp_id))
+    for endpoint in (
+        ENDPOINT_CHARGEPOINTS,
+        ENDPOINT_STATUS,
+        ENDPOINT_SETTINGS,
+        ENDPOINT_CONNECTOR_SETTINGS,
+        ENDPOINT_CHARGINGSESSIONS,
+        ENDPOINT_COMMANDS,
+    ):
+        sensors.append(ChargeampsRequestSensor(handler, endpoint))
+    async_add_entities(sensors)
+
+    @callback
+    def _async_add_chargepoint(cp_id):
+        async_add_entities(_create_chargepoint_sensors(hass, handler, cp_id))
+
+    @callback
+    def _async_add_connectors(cp_id, connectors):
         cp_info = handler.get_chargepoint_info(cp_id)
+        async_add_entities(_create_connector_sensors(hass, cp_info, connectors))
+
+    async_dispatcher_connect(hass, SIGNAL_ADD_CHARGEPOINT, _async_add_chargepoint)
+    async_dispatcher_connect(hass, SIGNAL_ADD_CONNECTORS, _async_add_connectors)
+
+
+def _create_chargepoint_sensors(hass, handler, cp_id):
+    cp_info = handler.get_chargepoint_info(cp_id)
+    sensors = [
+        ChargeampsTotalEnergy(
+            hass,
+            f"{cp_info.name}_{cp_id}_total_energy",
+            cp_id,
+        ),
+        ChargeampsRefreshSensor(
+            hass,
+            f"{cp_info.name} {cp_id} Refresh duration",
+            cp_id,
+        ),
+    ]
+    sensors.extend(_create_connector_sensors(hass, cp_info, cp_info.connectors))
+    return sensors
+
+
+def _create_connector_sensors(hass, cp_info, connectors):
+    sensors = []
+    for connector in connectors:
         sensors.append(
-            ChargeampsTotalEnergy(
+            ChargeampsSensor(
                 hass,
-                f"{cp_info.name}_{cp_id}_total_energy",
-                cp_id,
+                f"{cp_info.name}_{connector.charge_point_id}_{connector.connector_id}",
+                connector.charge_point_id,
+                connector.connector_id,
             )
         )
-        for connector in cp_info.connectors:
-            sensors.append(
-                ChargeampsSensor(
-                    hass,
-                    f"{cp_info.name}_{connector.charge_point_id}_{connector.connector_id}",
-                    connector.charge_point_id,
-                    connector.connector_id,
-                )
-            )
-            sensors.append(
-                ChargeampsPowerSensor(
-                    hass,
-                    f"{cp_info.name} {connector.charge_point_id} {connector.connector_id} Power",
-                    connector.charge_point_id,
-                    connector.connector_id,
-                )
-            )
-            _LOGGER.info(
-                "Adding chargepoint %s connector %s",
+        sensors.append(
+            ChargeampsPowerSensor(
+                hass,
+                f"{cp_info.name} {connector.charge_point_id} {connector.connector_id} Power",
                 connector.charge_point_id,
                 connector.connector_id,
             )
-    async_add_entities(sensors, True)
+        )
+        _LOGGER.info(
+            "Adding chargepoint %s connector %s",
+            connector.charge_point_id,
+            connector.connector_id,
+        )
+    return sensors
 
 
 class ChargeampsSensor(ChargeampsEntity, SensorEntity):
@@ -59,27 +108,21 @@ class ChargeampsSensor(ChargeampsEntity, SensorEntity):
     def __init__(self, hass, name, charge_point_id, connector_id):
         super().__init__(hass, name, charge_point_id, connector_id)
         self._interviewed = False
+        # Same attributes on every update, also before the interview
+        self._attributes["chargepoint_type"] = None
+        self._attributes["connector_type"] = None
+        self._attributes["total_consumption_kwh"] = None
 
-    async def interview(self):
+    def interview(self):
         chargepoint_info = self.handler.get_chargepoint_info(self.charge_point_id)
         connector_info = self.handler.get_connector_info(self.charge_point_id, self.connector_id)
         self._attributes["chargepoint_type"] = chargepoint_info.type
         self._attributes["connector_type"] = connector_info.type
         self._interviewed = True
 
-    async def async_update(self):
+    @callback
+    def _update_from_handler(self):
         """Update the sensor."""
-        _LOGGER.debug(
-            "Update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
-        await self.handler.update_data(self.charge_point_id)
-        _LOGGER.debug(
-            "Finished update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
         cp_status = self.handler.get_chargepoint_status(self.charge_point_id)
         status = self.handler.get_connector_status(self.charge_point_id, self.connector_id)
         if status is None:
@@ -90,7 +133,7 @@ class ChargeampsSensor(ChargeampsEntity, SensorEntity):
             self._state = status.status
         self._attributes["total_consumption_kwh"] = round(status.total_consumption_kwh, 3)
         if not self._interviewed:
-            await self.interview()
+            self.interview()
 
 
 class ChargeampsTotalEnergy(ChargeampsEntity, SensorEntity):
@@ -100,18 +143,10 @@ class ChargeampsTotalEnergy(ChargeampsEntity, SensorEntity):
         super().__init__(hass, name, charge_point_id, "total_energy")
         del self._attributes["connector_id"]
 
-    async def async_update(self):
+    @callback
+    def _update_from_handler(self):
         """Update the sensor."""
-        _LOGGER.debug(
-            "Update chargepoint %s",
-            self.charge_point_id,
-        )
-        await self.handler.update_data(self.charge_point_id)
         self._state = self.handler.get_chargepoint_total_energy(self.charge_point_id)
-        _LOGGER.debug(
-            "Finished update chargepoint %s",
-            self.charge_point_id,
-        )
 
     @property
     def device_class(self):
@@ -132,32 +167,25 @@ class ChargeampsTotalEnergy(ChargeampsEntity, SensorEntity):
 class ChargeampsPowerSensor(ChargeampsEntity, SensorEntity):
     """Chargeamps Power Sensor class."""
 
-    async def async_update(self):
+    def __init__(self, hass, name, charge_point_id, connector_id):
+        super().__init__(hass, name, charge_point_id, connector_id)
+        # Same attributes whether the connector is charging or not
+        self._attributes["active_phase"] = ""
+        for phase in PHASES:
+            self._attributes[f"{phase}_power"] = 0
+            self._attributes[f"{phase}_current"] = 0
+
+    @callback
+    def _update_from_handler(self):
         """Update the sensor."""
-        _LOGGER.debug(
-            "Update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
-        await self.handler.update_data(self.charge_point_id)
-        _LOGGER.debug(
-            "Finished update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
-        measurements = self.handler.get_connector_measurements(self.charge_point_id, self.connector_id)
-        if measurements:
-            self._state = round(sum([phase.current * phase.voltage for phase in measurements]), 0)
-            self._attributes["active_phase"] = " ".join([i.phase for i in measurements if i.current > 0])
-            for measure in measurements:
-                self._attributes[f"{measure.phase.lower()}_power"] = round(measure.voltage * measure.current, 0)
-                self._attributes[f"{measure.phase.lower()}_current"] = round(measure.current, 1)
-        else:
-            self._attributes["active_phase"] = ""
-            for phase in range(1, 4):
-                for measure in ("power", "current"):
-                    self._attributes[f"l{phase}_{measure}"] = 0
-            self._state = 0
+        measurements = self.handler.get_connector_measurements(self.charge_point_id, self.connector_id) or []
+        by_phase = {measure.phase.lower(): measure for measure in measurements}
+        self._state = round(sum([phase.current * phase.voltage for phase in measurements]), 0)
+        self._attributes["active_phase"] = " ".join([i.phase for i in measurements if i.current > 0])
+        for phase in PHASES:
+            measure = by_phase.get(phase)
+            self._attributes[f"{phase}_power"] = round(measure.voltage * measure.current, 0) if measure else 0
+            self._attributes[f"{phase}_current"] = round(measure.current, 1) if measure else 0
 
     @property
     def unique_id(self):
@@ -178,3 +206,77 @@ class ChargeampsPowerSensor(ChargeampsEntity, SensorEntity):
     def unit_of_measurement(self):
         """Return the unit of measurement."""
         return UnitOfPower.WATT
+
+
+class ChargeampsRefreshSensor(ChargeampsEntity, SensorEntity):
+    """Chargeamps Refresh Duration class, diagnostics of the refresh cycles of a chargepoint.
+
+    Changes with every refresh, so it is disabled by default and its metrics are not recorded.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset(
+        {"cycles", "failures", "late", "last_duration", "mean_duration", "max_duration", "last_interval", "update_interval"}
+    )
+
+    def __init__(self, hass, name, charge_point_id):
+        super().__init__(hass, name, charge_point_id, "refresh")
+        del self._attributes["connector_id"]
+
+    def _get_data_version(self):
+        # Failed refreshes do not change the chargepoint data, but the metrics
+        return self.handler.refresh_metrics[self.charge_point_id].cycles
+
+    @callback
+    def _update_from_handler(self):
+        """Update the sensor."""
+        metrics = self.handler.refresh_metrics[self.charge_point_id]
+        self._state = round(metrics.last_duration, 3) if metrics.last_duration is not None else None
+        self._attributes.update(metrics.as_dict())
+        self._attributes["update_interval"] = self.coordinator.poll_interval.total_seconds()
+
+    @property
+    def available(self) -> bool:
+        """Return True, failed refreshes are part of the diagnostics."""
+        return True
+
+    @property
+    def state_class(self):
+        """Return the state class of the sensor."""
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement."""
+        return UnitOfTime.SECONDS
+
+
+class ChargeampsRequestSensor(SensorEntity):
+    """Chargeamps API Requests class, diagnostics of the requests to an endpoint class of all accounts.
+
+    Disabled by default, the latency histogram is only part of the diagnostics service response.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _unrecorded_attributes = frozenset({"errors", "cache_hits", "bytes_received", "latency_total", "latency_mean", "latency_p95"})
+
+    def __init__(self, handler, endpoint):
+        self.handler = handler
+        self.endpoint = endpoint
+        self._attr_name = f"Chargeamps API {endpoint} requests"
+        self._attr_unique_id = f"{DOMAIN}_api_{endpoint}_requests"
+        self._attr_native_value = 0
+        self._attr_extra_state_attributes = {}
+
+    async def async_update(self):
+        """Update the sensor from the client metrics."""
+        metrics = self.handler.get_request_metrics().endpoints.get(self.endpoint)
+        if metrics is None:
+            return
+        attributes = metrics.as_dict()
+        del attributes["latency_histogram"]
+        self._attr_native_value = attributes.pop("requests")
+        self._attr_extra_state_attributes = attributes
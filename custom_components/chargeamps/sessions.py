@@ -0,0 +1,136 @@
+"""In-memory index of closed charging sessions for Chargeamps."""
+
+import bisect
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+from .client import ChargingSession
+from .utils import as_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = timedelta(hours=1)
+
+
+class _ChargePointSessions:
+    """Closed sessions for a single chargepoint, ordered by start time."""
+
+    def __init__(self):
+        self.sessions: list[ChargingSession] = []
+        self.start_times: list[datetime] = []
+        self.keys: set[tuple[int, datetime]] = set()
+        self.total_energy = 0.0
+        self.high_water_mark: datetime | None = None
+
+    def add(self, session: ChargingSession) -> bool:
+        key = (session.connector_id, session.start_time)
+        if key in self.keys:
+            return False
+        index = bisect.bisect_right(self.start_times, session.start_time)
+        self.start_times.insert(index, session.start_time)
+        self.sessions.insert(index, session)
+        self.keys.add(key)
+        self.total_energy += session.total_consumption_kwh
+        return True
+
+
+class ChargingSessionIndex:
+    """Append-only index of closed charging sessions.
+
+    Sessions are keyed by chargepoint, connector and start time and indexed by
+    start time, so totals and history lookups never need the cloud. Times are
+    kept as aware UTC.
+    """
+
+    def __init__(self):
+        self._chargepoints: dict[str, _ChargePointSessions] = defaultdict(_ChargePointSessions)
+
+    def add_sessions(self, charge_point_id: str, sessions: list[ChargingSession]) -> list[ChargingSession]:
+        """Add closed sessions not already stored, return the new ones."""
+        added = [session for session in sessions if self.add_session(charge_point_id, session)]
+        if added:
+            _LOGGER.debug("Stored %d new sessions for chargepoint %s", len(added), charge_point_id)
+            self.schedule_save()
+        return added
+
+    def add_session(self, charge_point_id: str, session: ChargingSession) -> bool:
+        """Add closed session if not already stored, without saving."""
+        if session.end_time is None or session.start_time is None:
+            return False
+        # Times are compared and indexed as aware UTC, whatever the source
+        session = replace(session, start_time=as_utc(session.start_time), end_time=as_utc(session.end_time))
+        return self._chargepoints[charge_point_id].add(session)
+
+    def schedule_save(self) -> None:
+        """Persist changes, nothing to do for sessions only kept in memory."""
+
+    def get_high_water_mark(self, charge_point_id: str) -> datetime | None:
+        """Return the point in time from which sessions may still change."""
+        return self._chargepoints[charge_point_id].high_water_mark
+
+    def set_high_water_mark(self, charge_point_id: str, high_water_mark: datetime | None) -> None:
+        cp_sessions = self._chargepoints[charge_point_id]
+        high_water_mark = as_utc(high_water_mark)
+        if cp_sessions.high_water_mark != high_water_mark:
+            cp_sessions.high_water_mark = high_water_mark
+            self.schedule_save()
+
+    def get_last_start_time(self, charge_point_id: str) -> datetime | None:
+        """Return start time of the most recent stored session."""
+        start_times = self._chargepoints[charge_point_id].start_times
+        return start_times[-1] if start_times else None
+
+    def get_total_energy(self, charge_point_id: str) -> float:
+        """Return total energy of all stored sessions."""
+        return self._chargepoints[charge_point_id].total_energy
+
+    def get_sessions(
+        self,
+        charge_point_id: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> list[ChargingSession]:
+        """Return stored sessions started within [start_time, end_time)."""
+        cp_sessions = self._chargepoints[charge_point_id]
+        start_time, end_time = as_utc(start_time), as_utc(end_time)
+        lo = bisect.bisect_left(cp_sessions.start_times, start_time) if start_time is not None else 0
+        hi = bisect.bisect_left(cp_sessions.start_times, end_time) if end_time is not None else len(cp_sessions.start_times)
+        return cp_sessions.sessions[lo:hi]
+
+    def get_daily_energy(
+        self,
+        charge_point_id: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> dict[date, float]:
+        """Return energy per day of session start."""
+        res: dict[date, float] = defaultdict(float)
+        for session in self.get_sessions(charge_point_id, start_time, end_time):
+            res[session.start_time.date()] += session.total_consumption_kwh
+        return dict(res)
+
+
+def start_of_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def hourly_energy(sessions: Iterable[ChargingSession]) -> dict[datetime, float]:
+    """Return energy per hour, each session spread evenly over its duration."""
+    res: dict[datetime, float] = defaultdict(float)
+    for session in sessions:
+        start = as_utc(session.start_time)
+        end = as_utc(session.end_time)
+        energy = session.total_consumption_kwh
+        if end <= start:
+            res[start_of_hour(start)] += energy
+            continue
+        duration = (end - start).total_seconds()
+        hour = start_of_hour(start)
+        while hour < end:
+            overlap = min(end, hour + HOUR) - max(start, hour)
+            res[hour] += energy * overlap.total_seconds() / duration
+            hour += HOUR
+    return dict(res)
@@ -0,0 +1,120 @@
+"""In-memory chargepoint state for Chargeamps."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from types import MappingProxyType
+
+from .client import (
+    ChargePoint,
+    ChargePointConnector,
+    ChargePointConnectorSettings,
+    ChargePointConnectorStatus,
+    ChargePointSettings,
+    ChargePointStatus,
+)
+
+_EMPTY: Mapping = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class ChargePointSnapshot:
+    """Immutable state of a chargepoint, replaced as a whole on every change.
+
+    The version is incremented with every replacement, so readers can tell
+    whether anything changed by comparing versions.
+    """
+
+    charge_point_id: str
+    version: int = 0
+    info: ChargePoint | None = None
+    status: ChargePointStatus | None = None
+    settings: ChargePointSettings | None = None
+    total_energy: float | None = None
+    connector_info: Mapping[int, ChargePointConnector] = field(default_factory=lambda: _EMPTY)
+    connector_status: Mapping[int, ChargePointConnectorStatus] = field(default_factory=lambda: _EMPTY)
+    connector_settings: Mapping[int, ChargePointConnectorSettings] = field(default_factory=lambda: _EMPTY)
+    info_fetched: datetime | None = None
+    status_fetched: datetime | None = None
+    settings_fetched: datetime | None = None
+
+
+_EMPTY_SNAPSHOT = ChargePointSnapshot(charge_point_id="")
+
+
+class ChargePointStateStore:
+    """Current snapshot of every chargepoint.
+
+    Each update builds a new snapshot and swaps it in with a single
+    assignment, so a reader always sees the results of one whole refresh.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[str, ChargePointSnapshot] = {}
+
+    def get(self, charge_point_id: str) -> ChargePointSnapshot:
+        """Return current snapshot, an empty one for unknown chargepoints."""
+        return self._snapshots.get(charge_point_id, _EMPTY_SNAPSHOT)
+
+    def _replace(self, charge_point_id: str, **changes) -> ChargePointSnapshot:
+        snapshot = self._snapshots.get(charge_point_id) or ChargePointSnapshot(charge_point_id=charge_point_id)
+        snapshot = self._snapshots[charge_point_id] = replace(snapshot, version=snapshot.version + 1, **changes)
+        return snapshot
+
+    def set_info(self, info: ChargePoint) -> ChargePointSnapshot:
+        """Store chargepoint and connector info."""
+        return self._replace(
+            info.id,
+            info=info,
+            connector_info=MappingProxyType({connector.connector_id: connector for connector in info.connectors}),
+            info_fetched=datetime.now(UTC),
+        )
+
+    def restore(
+        self,
+        info: ChargePoint,
+        settings: ChargePointSettings | None,
+        connector_settings: list[ChargePointConnectorSettings],
+    ) -> ChargePointSnapshot:
+        """Restore cached metadata, without fetch times so it is refreshed as soon as possible."""
+        return self._replace(
+            info.id,
+            info=info,
+            connector_info=MappingProxyType({connector.connector_id: connector for connector in info.connectors}),
+            settings=settings,
+            connector_settings=MappingProxyType({c.connector_id: c for c in connector_settings}),
+        )
+
+    def commit(
+        self,
+        charge_point_id: str,
+        status: ChargePointStatus | None = None,
+        total_energy: float | None = None,
+        settings: ChargePointSettings | None = None,
+        connector_settings: list[ChargePointConnectorSettings] | None = None,
+    ) -> ChargePointSnapshot:
+        """Commit results fetched by a refresh, arguments left as None are kept."""
+        now = datetime.now(UTC)
+        changes = {}
+        if status is not None:
+            changes["status"] = status
+            changes["connector_status"] = MappingProxyType({c.connector_id: c for c in status.connector_statuses})
+            changes["status_fetched"] = now
+        if total_energy is not None:
+            changes["total_energy"] = total_energy
+        if settings is not None:
+            changes["settings"] = settings
+            changes["settings_fetched"] = now
+        if connector_settings is not None:
+            changes["connector_settings"] = MappingProxyType({c.connector_id: c for c in connector_settings})
+        return self._replace(charge_point_id, **changes)
+
+    def set_settings(self, charge_point_id: str, settings: ChargePointSettings) -> ChargePointSnapshot:
+        """Write through settings sent to the chargepoint."""
+        return self._replace(charge_point_id, settings=settings)
+
+    def set_connector_settings(self, settings: ChargePointConnectorSettings) -> ChargePointSnapshot:
+        """Write through connector settings sent to the chargepoint."""
+        snapshot = self.get(settings.charge_point_id)
+        connector_settings = MappingProxyType({**snapshot.connector_settings, settings.connector_id: settings})
+        return self._replace(settings.charge_point_id, connector_settings=connector_settings)
@@ -0,0 +1,122 @@
+"""Long-term energy statistics for Chargeamps."""
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics, get_last_statistics
+from homeassistant.const import UnitOfEnergy
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .sessions import hourly_energy, start_of_hour
+from .utils import as_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hours of statistics per recorder import
+STATISTICS_BATCH_SIZE = 1000
+
+# Sessions starting this long before the last imported hour may still add to later hours
+SESSION_LOOKBACK = timedelta(days=7)
+
+
+class StatisticsImporter:
+    """Import hourly energy of stored charging sessions into long-term statistics.
+
+    There is one external statistic per chargepoint and one per connector. The
+    full history is imported the first time, after that only hours following
+    the last imported one. Hours are only imported once no open session can
+    add to them.
+    """
+
+    def __init__(self, hass, handler):
+        self.hass = hass
+        self.handler = handler
+        self._lock = asyncio.Lock()
+
+    async def async_import_all(self, now=None) -> None:
+        """Import new statistics for all chargepoints."""
+        if self._lock.locked():
+            return
+        async with self._lock:
+            for charge_point_id in self.handler.charge_point_ids:
+                try:
+                    await self.async_import(charge_point_id)
+                except Exception as error:  # pylint: disable=broad-except
+                    _LOGGER.warning("Could not import statistics for chargepoint %s - %s", charge_point_id, error)
+
+    async def async_import(self, charge_point_id: str) -> None:
+        """Import new statistics for a chargepoint."""
+        settled_until = self.handler.energy.get_settled_until(charge_point_id)
+        if settled_until is None:
+            _LOGGER.debug("Sessions of chargepoint %s not fetched yet, not importing statistics", charge_point_id)
+            return
+        end = start_of_hour(as_utc(settled_until))
+        cp_info = self.handler.get_chargepoint_info(charge_point_id)
+        name = cp_info.name if cp_info else charge_point_id
+
+        await self._async_import_statistic(
+            f"{DOMAIN}:{slugify(f'energy_{charge_point_id}')}",
+            f"{name} energy",
+            charge_point_id,
+            None,
+            end,
+        )
+        for connector in cp_info.connectors if cp_info else []:
+            await self._async_import_statistic(
+                f"{DOMAIN}:{slugify(f'energy_{charge_point_id}_{connector.connector_id}')}",
+                f"{name} connector {connector.connector_id} energy",
+                charge_point_id,
+                connector.connector_id,
+                end,
+            )
+
+    async def _async_import_statistic(
+        self,
+        statistic_id: str,
+        name: str,
+        charge_point_id: str,
+        connector_id: int | None,
+        end: datetime,
+    ) -> None:
+        last_stats = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
+        )
+        if last_stats.get(statistic_id):
+            last = last_stats[statistic_id][0]
+            last_hour = datetime.fromtimestamp(last["start"], tz=UTC)
+            total = last["sum"] or 0.0
+            sessions = self.handler.sessions.get_sessions(charge_point_id, start_time=last_hour - SESSION_LOOKBACK)
+        else:
+            # Backfill the full history
+            last_hour = None
+            total = 0.0
+            sessions = self.handler.sessions.get_sessions(charge_point_id)
+        if connector_id is not None:
+            sessions = [session for session in sessions if session.connector_id == connector_id]
+
+        statistics = []
+        for hour, energy in sorted(hourly_energy(sessions).items()):
+            if hour >= end:
+                break
+            if last_hour is not None and hour <= last_hour:
+                continue
+            total += energy
+            statistics.append(StatisticData(start=hour, state=round(total, 3), sum=round(total, 3)))
+        if not statistics:
+            return
+
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+        for index in range(0, len(statistics), STATISTICS_BATCH_SIZE):
+            async_add_external_statistics(self.hass, metadata, statistics[index : index + STATISTICS_BATCH_SIZE])
+        _LOGGER.debug("Imported %d hours of statistics for %s", len(statistics), statistic_id)
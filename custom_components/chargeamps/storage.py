@@ -0,0 +1,159 @@
+"""Local storage for Chargeamps."""
+
+import logging
+from datetime import datetime
+
+from homeassistant.helpers.storage import Store
+
+from .client import (
+    ChargePoint,
+    ChargePointConnectorSettings,
+    ChargePointSettings,
+    decode_chargepoint,
+    decode_chargepoint_settings,
+    decode_charging_session,
+    decode_connector_settings,
+)
+from .const import DOMAIN
+from .sessions import ChargingSessionIndex
+from .state import ChargePointSnapshot
+from .utils import as_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+SESSIONS_STORAGE_KEY = f"{DOMAIN}.sessions"
+SESSIONS_STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+METADATA_STORAGE_KEY = f"{DOMAIN}.metadata"
+METADATA_STORAGE_VERSION = 1
+
+
+class ChargingSessionStore(ChargingSessionIndex):
+    """Index of closed charging sessions, kept in HA storage."""
+
+    def __init__(self, hass):
+        super().__init__()
+        self._store = Store(hass, SESSIONS_STORAGE_VERSION, SESSIONS_STORAGE_KEY)
+
+    async def async_load(self) -> None:
+        """Load stored sessions."""
+        data = await self._store.async_load() or {}
+        for charge_point_id, cp_data in data.get("chargepoints", {}).items():
+            cp_sessions = self._chargepoints[charge_point_id]
+            for session in cp_data["sessions"]:
+                # Sessions stored by earlier versions may have naive times
+                self.add_session(charge_point_id, decode_charging_session(session))
+            if cp_data.get("high_water_mark"):
+                cp_sessions.high_water_mark = as_utc(datetime.fromisoformat(cp_data["high_water_mark"]))
+            _LOGGER.debug("Loaded %d sessions for chargepoint %s", len(cp_sessions.sessions), charge_point_id)
+
+    def _data_to_save(self) -> dict:
+        return {
+            "chargepoints": {
+                charge_point_id: {
+                    "high_water_mark": cp_sessions.high_water_mark.isoformat() if cp_sessions.high_water_mark else None,
+                    "sessions": [session.to_dict() for session in cp_sessions.sessions],
+                }
+                for charge_point_id, cp_sessions in self._chargepoints.items()
+            }
+        }
+
+    def schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+
+class MetadataStore:
+    """Last known chargepoints of every account, with info and settings, kept in HA storage.
+
+    Lets entities be created at startup from the cache, before the cloud has
+    answered. The cache is refreshed whenever newer metadata is fetched.
+    """
+
+    def __init__(self, hass):
+        self._store = Store(hass, METADATA_STORAGE_VERSION, METADATA_STORAGE_KEY)
+        self._accounts: dict[str, list[str]] = {}
+        self._info: dict[str, ChargePoint] = {}
+        self._settings: dict[str, ChargePointSettings | None] = {}
+        self._connector_settings: dict[str, list[ChargePointConnectorSettings]] = {}
+        self._missing: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load stored metadata."""
+        data = await self._store.async_load() or {}
+        self._accounts = data.get("accounts", {})
+        self._missing = set(data.get("missing", []))
+        for charge_point_id, cp_data in data.get("chargepoints", {}).items():
+            self._info[charge_point_id] = decode_chargepoint(cp_data["info"])
+            settings = cp_data.get("settings")
+            self._settings[charge_point_id] = decode_chargepoint_settings(settings) if settings else None
+            self._connector_settings[charge_point_id] = [
+                decode_connector_settings(connector_settings) for connector_settings in cp_data.get("connector_settings", [])
+            ]
+        _LOGGER.debug("Loaded metadata of %d chargepoints", len(self._info))
+
+    def _data_to_save(self) -> dict:
+        return {
+            "accounts": self._accounts,
+            "missing": sorted(self._missing),
+            "chargepoints": {
+                charge_point_id: {
+                    "info": info.to_dict(),
+                    "settings": self._settings[charge_point_id].to_dict() if self._settings.get(charge_point_id) else None,
+                    "connector_settings": [
+                        connector_settings.to_dict() for connector_settings in self._connector_settings.get(charge_point_id, [])
+                    ],
+                }
+                for charge_point_id, info in self._info.items()
+            },
+        }
+
+    def schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def get_account_chargepoints(self, username: str, charge_point_ids: list[str] | None = None) -> list[ChargePoint] | None:
+        """Return cached chargepoints of an account, None unless all of them are cached."""
+        if charge_point_ids is None:
+            charge_point_ids = self._accounts.get(username)
+        if not charge_point_ids or any(cp_id not in self._info for cp_id in charge_point_ids):
+            return None
+        return [self._info[cp_id] for cp_id in charge_point_ids]
+
+    def set_account_chargepoints(self, username: str, charge_point_ids: list[str]) -> None:
+        if self._accounts.get(username) != charge_point_ids:
+            self._accounts[username] = charge_point_ids
+            self.schedule_save()
+
+    def is_missing(self, charge_point_id: str) -> bool:
+        """Return whether the chargepoint was missing from its account when last checked."""
+        return charge_point_id in self._missing
+
+    def set_missing(self, charge_point_id: str, missing: bool) -> None:
+        if missing == (charge_point_id in self._missing):
+            return
+        if missing:
+            self._missing.add(charge_point_id)
+        else:
+            self._missing.discard(charge_point_id)
+        self.schedule_save()
+
+    def get_settings(self, charge_point_id: str) -> tuple[ChargePointSettings | None, list[ChargePointConnectorSettings]]:
+        """Return cached chargepoint and connector settings."""
+        return self._settings.get(charge_point_id), self._connector_settings.get(charge_point_id, [])
+
+    def update(self, snapshot: ChargePointSnapshot) -> None:
+        """Cache info and settings of a snapshot, saving only if anything changed."""
+        if snapshot.info is None:
+            return
+        charge_point_id = snapshot.charge_point_id
+        connector_settings = list(snapshot.connector_settings.values())
+        if (
+            self._info.get(charge_point_id) == snapshot.info
+            and self._settings.get(charge_point_id) == snapshot.settings
+            and self._connector_settings.get(charge_point_id) == connector_settings
+        ):
+            return
+        self._info[charge_point_id] = snapshot.info
+        self._settings[charge_point_id] = snapshot.settings
+        self._connector_settings[charge_point_id] = connector_settings
+        self.schedule_save()
@@ -3,9 +3,11 @@
 import logging
 
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from . import ChargeampsEntity
-from .const import DOMAIN_DATA, SCAN_INTERVAL  # noqa
+from .const import DOMAIN_DATA, SCAN_INTERVAL, SIGNAL_ADD_CHARGEPOINT, SIGNAL_ADD_CONNECTORS  # noqa
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,21 +18,39 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     handler = hass.data[DOMAIN_DATA]["handler"]
     for cp_id in handler.charge_point_ids:
         cp_info = handler.get_chargepoint_info(cp_id)
-        for connector in cp_info.connectors:
-            switches.append(
-                ChargeampsSwitch(
-                    hass,
-                    f"{cp_info.name}_{connector.charge_point_id}_{connector.connector_id}",
-                    connector.charge_point_id,
-                    connector.connector_id,
-                )
-            )
-            _LOGGER.info(
-                "Adding chargepoint %s connector %s",
+        switches.extend(_create_switches(hass, cp_info, cp_info.connectors))
+    async_add_entities(switches)
+
+    @callback
+    def _async_add_chargepoint(cp_id):
+        cp_info = handler.get_chargepoint_info(cp_id)
+        async_add_entities(_create_switches(hass, cp_info, cp_info.connectors))
+
+    @callback
+    def _async_add_connectors(cp_id, connectors):
+        async_add_entities(_create_switches(hass, handler.get_chargepoint_info(cp_id), connectors))
+
+    async_dispatcher_connect(hass, SIGNAL_ADD_CHARGEPOINT, _async_add_chargepoint)
+    async_dispatcher_connect(hass, SIGNAL_ADD_CONNECTORS, _async_add_connectors)
+
+
+def _create_switches(hass, cp_info, connectors):
+    switches = []
+    for connector in connectors:
+        switches.append(
+            ChargeampsSwitch(
+                hass,
+                f"{cp_info.name}_{connector.charge_point_id}_{connector.connector_id}",
                 connector.charge_point_id,
                 connector.connector_id,
             )
-    async_add_entities(switches, True)
+        )
+        _LOGGER.info(
+            "Adding chargepoint %s connector %s",
+            connector.charge_point_id,
+            connector.connector_id,
+        )
+    return switches
 
 
 class ChargeampsSwitch(SwitchEntity, ChargeampsEntity):
@@ -40,20 +60,13 @@ class ChargeampsSwitch(SwitchEntity, ChargeampsEntity):
         super().__init__(hass, name, charge_point_id, connector_id)
         self._current_power_w = 0
         self._status = None
+        # Same attributes on every update, also before settings are known
+        self._attributes["cable_lock"] = None
+        self._attributes["max_current"] = None
 
-    async def async_update(self):
+    @callback
+    def _update_from_handler(self):
         """Update the switch."""
-        _LOGGER.debug(
-            "Update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
-        await self.handler.update_data(self.charge_point_id)
-        _LOGGER.debug(
-            "Finished update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
         settings = self.handler.get_connector_settings(self.charge_point_id, self.connector_id)
         if settings is None:
             return
@@ -73,11 +86,17 @@ class ChargeampsSwitch(SwitchEntity, ChargeampsEntity):
 
     async def async_turn_on(self, **kwargs):  # pylint: disable=unused-argument
         """Turn on the switch."""
-        await self.handler.set_connector_mode(self.charge_point_id, self.connector_id, "On")
+        await self._async_command(
+            self.handler.set_connector_mode(self.charge_point_id, self.connector_id, "On"),
+            lambda: setattr(self, "_status", True),
+        )
 
     async def async_turn_off(self, **kwargs):  # pylint: disable=unused-argument
         """Turn off the switch."""
-        await self.handler.set_connector_mode(self.charge_point_id, self.connector_id, "Off")
+        await self._async_command(
+            self.handler.set_connector_mode(self.charge_point_id, self.connector_id, "Off"),
+            lambda: setattr(self, "_status", False),
+        )
 
     @property
     def is_on(self):
@@ -1,7 +1,12 @@
+import dataclasses
+import re
+from collections.abc import AsyncIterator, Callable
 from dataclasses import field
-from datetime import datetime
-from typing import Optional
+from datetime import UTC, datetime
+from types import UnionType
+from typing import Any, Optional, Union, get_args, get_origin, get_type_hints
 
+import orjson
 from ciso8601 import parse_datetime
 from dataclasses_json import config
 from marshmallow import fields
@@ -24,3 +29,157 @@ def datetime_field():
             mm_field=fields.DateTime(format="iso"),
         ),
     )
+
+
+def as_utc(value: datetime | None) -> datetime | None:
+    """Return value as aware UTC datetime, naive API timestamps are UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def camel_case(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(part.capitalize() for part in rest)
+
+
+_decoders: dict[type, Callable[[dict], Any]] = {}
+
+
+def compile_decoder(cls: type) -> Callable[[dict], Any]:
+    """Compile a decoder from a camelCase dict into dataclass cls.
+
+    The result matches dataclasses_json from_dict for the types used by the
+    models, without reflection on every call.
+    """
+    if cls in _decoders:
+        return _decoders[cls]
+
+    namespace: dict[str, Any] = {"cls": cls, "parse_datetime": parse_datetime}
+    lines = ["def decode(d):"]
+    args = []
+    type_hints = get_type_hints(cls)
+    for index, f in enumerate(dataclasses.fields(cls)):
+        if not f.init:
+            continue
+        key = camel_case(f.name)
+        if f.default is not dataclasses.MISSING:
+            namespace[f"default_{index}"] = f.default
+            lines.append(f"    v{index} = d.get({key!r}, default_{index})")
+        else:
+            lines.append(f"    v{index} = d[{key!r}]")
+        expression = _convert_expression(type_hints[f.name], f"v{index}", namespace)
+        if expression != f"v{index}":
+            lines.append(f"    if v{index} is not None:")
+            lines.append(f"        v{index} = {expression}")
+        args.append(f"{f.name}=v{index}")
+    lines.append(f"    return cls({', '.join(args)})")
+    # The source is built only from dataclass field names, never from API data
+    exec("\n".join(lines), namespace)
+    decoder = _decoders[cls] = namespace["decode"]
+    return decoder
+
+
+def _convert_expression(field_type, value: str, namespace: dict[str, Any]) -> str:
+    """Return expression converting a non-None JSON value to field_type."""
+    origin = get_origin(field_type)
+    if origin in (Union, UnionType):
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(args) != 1:
+            return value
+        field_type = args[0]
+        origin = get_origin(field_type)
+    if origin is list:
+        (item_type,) = get_args(field_type)
+        item_expression = _convert_expression(item_type, "x", namespace)
+        if item_expression == "x":
+            return f"list({value})"
+        return f"[None if x is None else {item_expression} for x in {value}]"
+    if dataclasses.is_dataclass(field_type):
+        name = f"decode_{field_type.__name__}"
+        namespace[name] = compile_decoder(field_type)
+        return f"{name}({value})"
+    if field_type is datetime:
+        return f"parse_datetime({value})"
+    if field_type in (int, float, str, bool):
+        name = field_type.__name__
+        return f"{value} if isinstance({value}, {name}) else {name}({value})"
+    return value
+
+
+# Bytes that may change the nesting or string state of a JSON document
+_JSON_STRUCTURAL = re.compile(rb'[\[\]{}",\\]')
+
+
+class JsonArraySplitter:
+    """Split a JSON array into the encoded elements as its bytes arrive.
+
+    Only the element currently being received is buffered, so arrays of any
+    length are processed in constant memory.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scan = 0
+        self._start: int | None = None
+        self._depth = 0
+        self._in_string = False
+        self.done = False
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Add data, return the elements completed by it."""
+        buffer = self._buffer
+        buffer += data
+        elements = []
+        skip = self._scan
+        for match in _JSON_STRUCTURAL.finditer(buffer, self._scan):
+            index = match.start()
+            if index < skip or self.done:
+                continue
+            char = buffer[index]
+            if self._in_string:
+                if char == 0x5C:
+                    # Backslash escapes the next byte
+                    skip = index + 2
+                elif char == 0x22:
+                    self._in_string = False
+            elif char == 0x22:
+                self._in_string = True
+            elif char in b"[{":
+                if self._depth == 0:
+                    if char != 0x5B:
+                        raise ValueError("JSON document is not an array")
+                    self._start = index + 1
+                self._depth += 1
+            elif char in b"]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._append_element(elements, index)
+                    self.done = True
+            elif char == 0x2C and self._depth == 1:
+                self._append_element(elements, index)
+                self._start = index + 1
+        self._scan = max(skip, len(buffer))
+        if self._start:
+            # Drop everything before the current element
+            del buffer[: self._start]
+            self._scan -= self._start
+            self._start = 0
+        return elements
+
+    def _append_element(self, elements: list[bytes], end: int) -> None:
+        element = bytes(self._buffer[self._start : end]).strip()
+        if element:
+            elements.append(element)
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Decode the elements of a JSON array one at a time from a stream of chunks."""
+    splitter = JsonArraySplitter()
+    async for chunk in chunks:
+        for element in splitter.feed(chunk):
+            yield orjson.loads(element)
+    if not splitter.done:
+        raise ValueError("Truncated JSON array")
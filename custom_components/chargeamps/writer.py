@@ -0,0 +1,78 @@
+"""Coalescing settings writer for Chargeamps."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingWrite:
+    changes: dict[str, Any] = field(default_factory=dict)
+    futures: list[asyncio.Future] = field(default_factory=list)
+    handle: asyncio.TimerHandle | None = None
+
+
+class CoalescingWriter:
+    """Merge field changes submitted within a short window into a single write.
+
+    The window starts with the first change for a key. Writes for the same key
+    are serialized, changes arriving while a write is in flight go into the
+    next write.
+    """
+
+    def __init__(self, write: Callable[[Hashable, dict[str, Any]], Awaitable[None]], delay: float):
+        self._write = write
+        self._delay = delay
+        self._pending: dict[Hashable, _PendingWrite] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, key: Hashable, **changes) -> asyncio.Future:
+        """Queue changes for key, return a future resolved when the merged write is done."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingWrite()
+            pending.handle = loop.call_later(self._delay, self._flush, key)
+        pending.changes.update(changes)
+        future = loop.create_future()
+        pending.futures.append(future)
+        return future
+
+    def cancel(self, key: Hashable, error: Exception) -> None:
+        """Drop changes for key not written yet, their futures fail with error.
+
+        A write already in flight is not interrupted.
+        """
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        pending.handle.cancel()
+        for future in pending.futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _flush(self, key: Hashable) -> None:
+        pending = self._pending.pop(key)
+        task = asyncio.create_task(self._run(key, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, pending: _PendingWrite) -> None:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            _LOGGER.debug("Writing %s for %s (%d merged)", pending.changes, key, len(pending.futures))
+            try:
+                await self._write(key, pending.changes)
+            except Exception as exc:  # pylint: disable=broad-except
+                for future in pending.futures:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+        for future in pending.futures:
+            if not future.done():
+                future.set_result(None)
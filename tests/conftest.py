@@ -0,0 +1,16 @@
+"""Import the integration modules without setting up Home Assistant."""
+
+import sys
+import types
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+COMPONENT_DIR = ROOT_DIR / "custom_components" / "chargeamps"
+
+# Register the package without running its __init__, which needs Home Assistant
+package = types.ModuleType("chargeamps")
+package.__path__ = [str(COMPONENT_DIR)]
+sys.modules.setdefault("chargeamps", package)
+
+# The mock Charge-Amps API lives with the benchmarks
+sys.path.insert(0, str(ROOT_DIR / "benchmarks"))
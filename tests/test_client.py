@@ -0,0 +1,31 @@
+import asyncio
+
+from mock_api import MockChargeAmpsApi
+
+from chargeamps.client import ENDPOINT_CHARGINGSESSIONS, ENDPOINT_STATUS, ChargeAmpsClient
+
+
+def test_metrics_count_bytes_read():
+    async def run():
+        api = MockChargeAmpsApi(chargepoints=1, sessions=500)
+        url = await api.start()
+        client = ChargeAmpsClient(email="user@example.com", password="password", api_key="api_key", api_base_url=url)
+        try:
+            (cp_id,) = api.chargepoints
+            await client.get_chargepoint_status(cp_id)
+            status_bytes = api.bytes_sent
+            sessions = [session async for session in client.iter_chargingsessions(cp_id)]
+            sessions_bytes = api.bytes_sent - status_bytes
+            return len(sessions), status_bytes, sessions_bytes, client.metrics.endpoints
+        finally:
+            await client.shutdown()
+            await api.stop()
+
+    # The first response also includes the login
+    sessions, status_bytes, sessions_bytes, endpoints = asyncio.run(run())
+    assert sessions == 500
+    assert 0 < endpoints[ENDPOINT_STATUS].bytes_received < status_bytes
+    # Streamed without a Content-Length
+    assert endpoints[ENDPOINT_CHARGINGSESSIONS].bytes_received == sessions_bytes
+    assert endpoints[ENDPOINT_CHARGINGSESSIONS].requests == 1
+    assert endpoints[ENDPOINT_CHARGINGSESSIONS].errors == 0
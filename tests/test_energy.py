@@ -0,0 +1,92 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from mock_api import MockChargeAmpsApi
+
+from chargeamps.client import ChargeAmpsClient, ChargingSession
+from chargeamps.energy import QUERY_OVERLAP, EnergyAccumulator
+from chargeamps.sessions import ChargingSessionIndex
+
+CP = "2012345678M"
+
+
+def session(start: datetime, end: datetime | None, energy: float) -> ChargingSession:
+    return ChargingSession(
+        id=start.isoformat(),
+        charge_point_id=CP,
+        connector_id=1,
+        session_type="Private",
+        total_consumption_kwh=energy,
+        start_time=start,
+        end_time=end,
+    )
+
+
+def update(accumulator: EnergyAccumulator, sessions: list[ChargingSession]) -> float:
+    async def stream():
+        for s in sessions:
+            yield s
+
+    return asyncio.run(accumulator.async_update(CP, stream()))
+
+
+def test_closed_sessions_are_counted_once():
+    accumulator = EnergyAccumulator(ChargingSessionIndex())
+    assert accumulator.query_start_time(CP) is None
+    assert accumulator.get_settled_until(CP) is None
+
+    first = session(datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 12), 5.0)
+    second = session(datetime(2024, 1, 2, 10), datetime(2024, 1, 2, 11), 3.0)
+    assert update(accumulator, [first, second]) == 8.0
+    # The overlapping query returns the newest session again
+    assert update(accumulator, [second]) == 8.0
+
+    high_water_mark = datetime(2024, 1, 2, 10, tzinfo=UTC)
+    assert accumulator.query_start_time(CP) == high_water_mark - QUERY_OVERLAP
+    assert accumulator.get_settled_until(CP) > high_water_mark
+
+
+def test_open_session_holds_high_water_mark():
+    index = ChargingSessionIndex()
+    accumulator = EnergyAccumulator(index)
+    closed = session(datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 12), 5.0)
+    start = datetime(2024, 1, 2, 10)
+    assert update(accumulator, [closed, session(start, None, 1.5)]) == 6.5
+    assert index.get_high_water_mark(CP) == start.replace(tzinfo=UTC)
+    assert accumulator.get_settled_until(CP) == start.replace(tzinfo=UTC)
+
+    # The session closes, its live energy moves into the stored total
+    assert update(accumulator, [session(start, start + timedelta(hours=3), 4.0)]) == 9.0
+    assert index.get_high_water_mark(CP) == start.replace(tzinfo=UTC)
+    assert index.get_total_energy(CP) == 9.0
+
+
+def test_incremental_cycles_against_mock_api():
+    async def run():
+        api = MockChargeAmpsApi(chargepoints=1, sessions=50)
+        url = await api.start()
+        client = ChargeAmpsClient(email="user@example.com", password="password", api_key="api_key", api_base_url=url)
+        try:
+            (cp_id,) = api.chargepoints
+            accumulator = EnergyAccumulator(ChargingSessionIndex())
+            expected = sum(s["totalConsumptionKwh"] for s in api.sessions[cp_id])
+            totals = []
+            for cycle in range(3):
+                if cycle == 2:
+                    # A session closed since the previous cycle
+                    last = api.sessions[cp_id][-1]
+                    api.sessions[cp_id].append(
+                        {**last, "id": "new", "startTime": "2030-01-01T10:00:00", "endTime": "2030-01-01T12:00:00"}
+                    )
+                    expected += last["totalConsumptionKwh"]
+                start_time = accumulator.query_start_time(cp_id)
+                assert (start_time is None) == (cycle == 0)
+                totals.append(await accumulator.async_update(cp_id, client.iter_chargingsessions(cp_id, start_time)))
+            return totals, expected
+        finally:
+            await client.shutdown()
+            await api.stop()
+
+    totals, expected = asyncio.run(run())
+    assert totals[0] == totals[1]
+    assert totals[2] == expected
@@ -0,0 +1,87 @@
+import asyncio
+import base64
+
+import orjson
+from aiohttp import WSServerHandshakeError
+from aiohttp.test_utils import TestClient, TestServer
+
+from chargeamps.client import ChargePoint, ChargePointConnector
+from chargeamps.ocpp import CALL, OcppCentralSystem
+
+CP = "2012345678M"
+
+
+class Handler:
+    """Handler methods used by the central system."""
+
+    charge_point_ids = [CP]
+
+    def get_chargepoint_info(self, charge_point_id):
+        return ChargePoint(
+            id=CP,
+            name="Garage",
+            password="account-password",
+            type="HALO",
+            is_loadbalanced=False,
+            firmware_version="1.2",
+            hardware_version="1.0",
+            connectors=[ChargePointConnector(charge_point_id=CP, connector_id=1, type="Type2")],
+        )
+
+    def get_connector_status(self, charge_point_id, connector_id):
+        return None
+
+    def set_local_connected(self, charge_point_id, connected):
+        pass
+
+    def set_local_status(self, charge_point_id, status, open_energy):
+        pass
+
+
+def basic_auth(login: str, password: str) -> dict[str, str]:
+    return {"Authorization": "Basic " + base64.b64encode(f"{login}:{password}".encode()).decode()}
+
+
+def connect(central_system: OcppCentralSystem, *attempts: tuple[dict[str, str], str | None]) -> list:
+    """Connect as chargepoint for every attempt, return the HTTP status or the Authorize result of each."""
+
+    async def run():
+        results = []
+        async with TestClient(TestServer(central_system.app)) as client:
+            for headers, id_tag in attempts:
+                try:
+                    ws = await client.ws_connect(f"/ocpp/{CP}", protocols=("ocpp1.6",), headers=headers)
+                except WSServerHandshakeError as error:
+                    results.append(error.status)
+                    continue
+                async with ws:
+                    await ws.send_str(orjson.dumps([CALL, "1", "Authorize", {"idTag": id_tag}]).decode())
+                    results.append(orjson.loads(await ws.receive_str())[2]["idTagInfo"]["status"])
+        return results
+
+    return asyncio.run(run())
+
+
+def test_authentication_is_required():
+    central_system = OcppCentralSystem(Handler(), "127.0.0.1", 0)
+    attempts = [({}, None), (basic_auth(CP, "wrong"), None), (basic_auth("other", "account-password"), None)]
+    assert connect(central_system, *attempts) == [401, 401, 401]
+
+
+def test_account_password_is_default():
+    central_system = OcppCentralSystem(Handler(), "127.0.0.1", 0)
+    assert connect(central_system, (basic_auth(CP, "account-password"), "TAG")) == ["Invalid"]
+
+
+def test_configured_password():
+    central_system = OcppCentralSystem(Handler(), "127.0.0.1", 0, password="local")
+    attempts = [(basic_auth(CP, "account-password"), None), (basic_auth(CP, "local"), "TAG")]
+    assert connect(central_system, *attempts) == [401, "Invalid"]
+
+
+def test_id_tags():
+    central_system = OcppCentralSystem(Handler(), "127.0.0.1", 0, password="local", id_tags=["TAG"])
+    attempts = [(basic_auth(CP, "local"), "TAG"), (basic_auth(CP, "local"), "OTHER")]
+    assert connect(central_system, *attempts) == ["Accepted", "Invalid"]
+    central_system = OcppCentralSystem(Handler(), "127.0.0.1", 0, password="local", accept_any_id_tag=True)
+    assert connect(central_system, (basic_auth(CP, "local"), "OTHER")) == ["Accepted"]
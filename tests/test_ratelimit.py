@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+from chargeamps.ratelimit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, TokenBucketLimiter
+
+
+def test_burst_is_served_immediately():
+    async def run():
+        limiter = TokenBucketLimiter(rate=1, burst=3)
+        for _ in range(3):
+            await asyncio.wait_for(limiter.acquire(), 0.05)
+        try:
+            await asyncio.wait_for(limiter.acquire(), 0.05)
+        except TimeoutError:
+            return True
+        return False
+
+    assert asyncio.run(run())
+
+
+def test_rate_is_kept():
+    async def run():
+        limiter = TokenBucketLimiter(rate=100, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    # The first token is available right away, the next five take 10 ms each
+    assert asyncio.run(run()) >= 0.045
+
+
+def test_interactive_requests_go_first():
+    async def run():
+        limiter = TokenBucketLimiter(rate=50, burst=1)
+        await limiter.acquire()
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire(priority)
+            order.append(name)
+
+        tasks = [
+            asyncio.create_task(request("background 1", PRIORITY_BACKGROUND)),
+            asyncio.create_task(request("background 2", PRIORITY_BACKGROUND)),
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("interactive", PRIORITY_INTERACTIVE)))
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["interactive", "background 1", "background 2"]
+
+
+def test_pause():
+    async def run():
+        limiter = TokenBucketLimiter(rate=1000, burst=10)
+        limiter.pause(0.05)
+        start = time.monotonic()
+        await limiter.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.04
+
+
+def test_cancelled_waiter_is_skipped():
+    async def run():
+        limiter = TokenBucketLimiter(rate=50, burst=1)
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(limiter.acquire(), 0.2)
+
+    asyncio.run(run())
@@ -0,0 +1,117 @@
+import asyncio
+import types
+
+import pytest
+from mock_api import MockChargeAmpsApi
+
+from chargeamps import resilience
+from chargeamps.client import ENDPOINT_STATUS, ChargeAmpsClient
+from chargeamps.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    backoff_delay,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(resilience, "time", types.SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_opens_after_threshold(clock):
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_CLOSED
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failures(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.failures == 1
+
+
+def test_half_open_after_timeout(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert breaker.allow_request()
+
+    # A single failure while half open opens the circuit again
+    breaker.record_failure()
+    assert breaker.state == CIRCUIT_OPEN
+
+    clock.now += 30
+    breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+def test_half_open_admits_a_single_trial(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.allow_request()
+    assert breaker.begin_request()
+    # Other callers are refused while the trial is in flight
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.allow_request()
+    assert not breaker.begin_request()
+
+
+def test_trial_without_outcome_is_released(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    assert breaker.begin_request()
+    breaker.end_trial()
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_concurrent_requests_while_half_open(clock):
+    async def request(client, cp_id):
+        try:
+            await client.get_chargepoint_status(cp_id)
+        except CircuitOpenError:
+            return False
+        return True
+
+    async def run():
+        api = MockChargeAmpsApi(chargepoints=1, sessions=0, latency=0.05)
+        url = await api.start()
+        client = ChargeAmpsClient(email="user@example.com", password="password", api_key="api_key", api_base_url=url)
+        try:
+            (cp_id,) = api.chargepoints
+            breaker = client._endpoint_breakers[ENDPOINT_STATUS]
+            while breaker.state != CIRCUIT_OPEN:
+                breaker.record_failure()
+            clock.now += 3600
+            results = await asyncio.gather(*[request(client, cp_id) for _ in range(5)])
+            status_requests = sum(count for route, count in api.request_counts.items() if route.endswith("/status"))
+            return results, status_requests, breaker.state
+        finally:
+            await client.shutdown()
+            await api.stop()
+
+    results, status_requests, state = asyncio.run(run())
+    assert sorted(results) == [False, False, False, False, True]
+    assert status_requests == 1
+    assert state == CIRCUIT_CLOSED
+
+
+def test_backoff_delay_is_capped():
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, base=0.5, cap=4) <= min(4, 0.5 * 2**attempt)
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+import pytest
+
+from chargeamps.scheduler import MIN_DELAY, FleetScheduler
+
+INTERVAL = timedelta(seconds=60)
+
+
+def test_phases_are_evenly_spaced():
+    scheduler = FleetScheduler()
+    for charge_point_id in ("a", "b", "c", "d"):
+        scheduler.add(charge_point_id)
+    scheduler.add("a")
+    assert len(scheduler) == 4
+    assert [scheduler.phase(cp) for cp in ("a", "b", "c", "d")] == [0.0, 0.25, 0.5, 0.75]
+    assert scheduler.phase("unknown") == 0.0
+
+
+def test_remove_reassigns_slots():
+    scheduler = FleetScheduler()
+    for charge_point_id in ("a", "b", "c"):
+        scheduler.add(charge_point_id)
+    scheduler.remove("b")
+    scheduler.remove("unknown")
+    assert len(scheduler) == 2
+    assert scheduler.phase("c") == 0.5
+
+
+def test_next_delay_without_jitter():
+    scheduler = FleetScheduler(jitter=0)
+    scheduler.add("a")
+    scheduler.add("b")
+    # Slot of b is at 30 s of every minute
+    assert scheduler.next_delay("b", INTERVAL, now=600) == timedelta(seconds=30)
+    assert scheduler.next_delay("b", INTERVAL, now=620) == timedelta(seconds=70)
+    assert scheduler.next_delay("a", INTERVAL, now=610) == timedelta(seconds=50)
+
+
+@pytest.mark.parametrize("now", [0, 17.5, 1234.5])
+def test_next_delay_bounds(now):
+    scheduler = FleetScheduler()
+    for charge_point_id in range(10):
+        scheduler.add(str(charge_point_id))
+    for charge_point_id in range(10):
+        delay = scheduler.next_delay(str(charge_point_id), INTERVAL, now=now).total_seconds()
+        assert INTERVAL.total_seconds() * MIN_DELAY <= delay <= INTERVAL.total_seconds() * (1 + MIN_DELAY) + 1
+
+
+def test_refreshes_are_spread():
+    scheduler = FleetScheduler()
+    for charge_point_id in range(6):
+        scheduler.add(str(charge_point_id))
+    slot = INTERVAL.total_seconds() / 6
+    due = sorted(
+        (1000 + scheduler.next_delay(str(charge_point_id), INTERVAL, now=1000).total_seconds()) % INTERVAL.total_seconds()
+        for charge_point_id in range(6)
+    )
+    gaps = [b - a for a, b in zip(due, due[1:], strict=False)]
+    # Jitter moves each refresh by at most a fifth of its slot
+    assert min(gaps) >= slot * 0.6 - 1e-9
+
+
+def test_zero_interval():
+    scheduler = FleetScheduler()
+    scheduler.add("a")
+    assert scheduler.next_delay("a", timedelta(0)) == timedelta(0)
@@ -0,0 +1,102 @@
+from datetime import UTC, date, datetime, timedelta, timezone
+
+import pytest
+
+from chargeamps.client import ChargingSession
+from chargeamps.sessions import ChargingSessionIndex, hourly_energy
+
+CP = "2012345678M"
+
+
+def session(start: datetime, end: datetime | None, energy: float, connector_id: int = 1) -> ChargingSession:
+    return ChargingSession(
+        id=f"{connector_id}-{start.isoformat()}",
+        charge_point_id=CP,
+        connector_id=connector_id,
+        session_type="Private",
+        total_consumption_kwh=energy,
+        start_time=start,
+        end_time=end,
+    )
+
+
+def test_sessions_are_deduplicated():
+    index = ChargingSessionIndex()
+    start = datetime(2024, 1, 1, 10, tzinfo=UTC)
+    assert index.add_session(CP, session(start, start + timedelta(hours=1), 5.0))
+    assert not index.add_session(CP, session(start, start + timedelta(hours=1), 5.0))
+    # Same start time on another connector is another session
+    assert index.add_session(CP, session(start, start + timedelta(hours=1), 2.0, connector_id=2))
+    assert index.get_total_energy(CP) == 7.0
+
+
+def test_open_sessions_are_not_stored():
+    index = ChargingSessionIndex()
+    assert not index.add_session(CP, session(datetime(2024, 1, 1, 10, tzinfo=UTC), None, 1.0))
+    assert index.get_total_energy(CP) == 0.0
+    assert index.get_last_start_time(CP) is None
+
+
+def test_get_sessions_range():
+    index = ChargingSessionIndex()
+    starts = [datetime(2024, 1, day, 10, tzinfo=UTC) for day in (3, 1, 2)]
+    added = index.add_sessions(CP, [session(start, start + timedelta(hours=2), float(start.day)) for start in starts])
+    assert len(added) == 3
+    assert index.add_sessions(CP, [session(starts[0], starts[0] + timedelta(hours=2), 3.0)]) == []
+
+    assert [s.start_time.day for s in index.get_sessions(CP)] == [1, 2, 3]
+    # Start inclusive, end exclusive
+    assert [s.start_time.day for s in index.get_sessions(CP, starts[2], starts[0])] == [2]
+    assert index.get_last_start_time(CP) == starts[0]
+    assert index.get_daily_energy(CP) == {date(2024, 1, 1): 1.0, date(2024, 1, 2): 2.0, date(2024, 1, 3): 3.0}
+    assert index.get_sessions("unknown") == []
+
+
+def test_naive_and_aware_sessions_are_deduplicated():
+    index = ChargingSessionIndex()
+    start = datetime(2024, 1, 1, 10)
+    assert index.add_session(CP, session(start, start + timedelta(hours=1), 5.0))
+    assert not index.add_session(CP, session(start.replace(tzinfo=UTC), start.replace(tzinfo=UTC, hour=11), 5.0))
+    cet = timezone(timedelta(hours=1))
+    assert not index.add_session(CP, session(datetime(2024, 1, 1, 11, tzinfo=cet), datetime(2024, 1, 1, 12, tzinfo=cet), 5.0))
+    # Same start time on another connector is another session
+    assert index.add_session(CP, session(start, start + timedelta(hours=1), 2.0, connector_id=2))
+    assert index.get_total_energy(CP) == 7.0
+    assert all(s.start_time.tzinfo is UTC for s in index.get_sessions(CP))
+
+
+def test_naive_bounds_are_utc():
+    index = ChargingSessionIndex()
+    start = datetime(2024, 1, 2, 10, tzinfo=UTC)
+    index.add_session(CP, session(start, start + timedelta(hours=1), 1.0))
+    assert len(index.get_sessions(CP, datetime(2024, 1, 2, 10), datetime(2024, 1, 2, 11))) == 1
+    assert index.get_sessions(CP, datetime(2024, 1, 2, 10, 30)) == []
+
+
+def test_high_water_mark_is_aware():
+    index = ChargingSessionIndex()
+    assert index.get_high_water_mark(CP) is None
+    index.set_high_water_mark(CP, datetime(2024, 1, 1, 10))
+    assert index.get_high_water_mark(CP) == datetime(2024, 1, 1, 10, tzinfo=UTC)
+
+
+def test_hourly_energy_is_spread_over_hours():
+    start = datetime(2024, 1, 1, 10, 30, tzinfo=UTC)
+    energy = hourly_energy([session(start, start + timedelta(hours=2), 8.0)])
+    assert energy == pytest.approx(
+        {
+            datetime(2024, 1, 1, 10, tzinfo=UTC): 2.0,
+            datetime(2024, 1, 1, 11, tzinfo=UTC): 4.0,
+            datetime(2024, 1, 1, 12, tzinfo=UTC): 2.0,
+        }
+    )
+
+
+def test_hourly_energy_mixed_sessions():
+    sessions = [
+        # Naive times are UTC
+        session(datetime(2024, 1, 1, 10, 15), datetime(2024, 1, 1, 10, 45), 1.0),
+        # Zero duration sessions count in their start hour
+        session(datetime(2024, 1, 1, 10, 50, tzinfo=UTC), datetime(2024, 1, 1, 10, 50, tzinfo=UTC), 0.5),
+    ]
+    assert hourly_energy(sessions) == pytest.approx({datetime(2024, 1, 1, 10, tzinfo=UTC): 1.5})
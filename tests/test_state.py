@@ -0,0 +1,67 @@
+from chargeamps.client import ChargePoint, ChargePointConnector, ChargePointConnectorSettings, ChargePointSettings
+from chargeamps.state import ChargePointSnapshot, ChargePointStateStore
+
+CP = "2012345678M"
+
+
+def chargepoint() -> ChargePoint:
+    return ChargePoint(
+        id=CP,
+        name="Garage",
+        password="secret",
+        type="HALO",
+        is_loadbalanced=False,
+        firmware_version="1.2",
+        hardware_version="1.0",
+        connectors=[ChargePointConnector(charge_point_id=CP, connector_id=1, type="Type2")],
+    )
+
+
+def connector_settings(max_current: float) -> ChargePointConnectorSettings:
+    return ChargePointConnectorSettings(
+        charge_point_id=CP,
+        connector_id=1,
+        mode="On",
+        rfid_lock=False,
+        cable_lock=False,
+        max_current=max_current,
+    )
+
+
+def test_empty_snapshot():
+    snapshot = ChargePointSnapshot(charge_point_id=CP)
+    assert snapshot.version == 0
+    assert dict(snapshot.connector_info) == {}
+    assert dict(snapshot.connector_settings) == {}
+    assert ChargePointStateStore().get(CP).info is None
+
+
+def test_updates_replace_snapshot():
+    store = ChargePointStateStore()
+    first = store.set_info(chargepoint())
+    assert first.version == 1
+    assert first.info_fetched is not None
+    assert list(first.connector_info) == [1]
+
+    second = store.set_connector_settings(connector_settings(16))
+    assert second.version == 2
+    assert second.info is first.info
+    # Earlier snapshots are never modified
+    assert dict(first.connector_settings) == {}
+
+    third = store.commit(CP, total_energy=12.5, connector_settings=[connector_settings(10)])
+    assert third.version == 3
+    assert third.total_energy == 12.5
+    assert third.connector_settings[1].max_current == 10
+    assert third.status_fetched is None
+    assert store.get(CP) is third
+
+
+def test_restore_has_no_fetch_times():
+    store = ChargePointStateStore()
+    settings = ChargePointSettings(id=CP, dimmer="Off", down_light=False)
+    snapshot = store.restore(chargepoint(), settings, [connector_settings(16)])
+    assert snapshot.settings == settings
+    assert snapshot.connector_settings[1].max_current == 16
+    assert snapshot.info_fetched is None
+    assert snapshot.settings_fetched is None
@@ -0,0 +1,102 @@
+import asyncio
+from datetime import UTC, datetime, timedelta, timezone
+
+import orjson
+import pytest
+
+from chargeamps.client import ChargePoint, ChargePointConnectorStatus, ChargingSession
+from chargeamps.utils import JsonArraySplitter, as_utc, compile_decoder, iter_json_array
+
+
+def split(data: bytes, chunk_size: int) -> list[bytes]:
+    splitter = JsonArraySplitter()
+    elements = []
+    for i in range(0, len(data), chunk_size):
+        elements.extend(splitter.feed(data[i : i + chunk_size]))
+    assert splitter.done
+    return elements
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+def test_splitter_matches_full_decode(chunk_size):
+    items = [
+        {"id": 1, "name": 'quote " and [brackets], {braces}'},
+        {"nested": [1, [2, 3], {"a": "b"}]},
+        'backslash \\ and escaped \\" quote',
+        42,
+        None,
+        [],
+    ]
+    data = orjson.dumps(items)
+    assert [orjson.loads(element) for element in split(data, chunk_size)] == items
+
+
+def test_splitter_empty_array():
+    assert split(b" [ ] ", 1) == []
+
+
+def test_splitter_rejects_object():
+    with pytest.raises(ValueError):
+        JsonArraySplitter().feed(b'{"a": 1}')
+
+
+def test_iter_json_array():
+    async def chunks():
+        yield b'[{"a": 1}, {"b'
+        yield b'": [2]}]'
+
+    async def consume():
+        return [element async for element in iter_json_array(chunks())]
+
+    assert asyncio.run(consume()) == [{"a": 1}, {"b": [2]}]
+
+
+def test_iter_json_array_truncated():
+    async def chunks():
+        yield b'[{"a": 1}, {"b"'
+
+    async def consume():
+        return [element async for element in iter_json_array(chunks())]
+
+    with pytest.raises(ValueError, match="Truncated"):
+        asyncio.run(consume())
+
+
+def test_compile_decoder_matches_from_dict():
+    chargepoint = {
+        "id": "2012345678M",
+        "name": "Garage",
+        "password": "secret",
+        "type": "HALO",
+        "isLoadbalanced": False,
+        "firmwareVersion": "1.2",
+        "hardwareVersion": None,
+        "connectors": [{"chargePointId": "2012345678M", "connectorId": 1, "type": "Type2"}],
+    }
+    assert compile_decoder(ChargePoint)(chargepoint) == ChargePoint.from_dict(chargepoint)
+
+    status = {
+        "chargePointId": "2012345678M",
+        "connectorId": 1,
+        "totalConsumptionKwh": 3,
+        "status": "Charging",
+        "measurements": [{"phase": "L1", "current": 16, "voltage": 230.5}],
+        "startTime": "2024-01-01T10:00:00",
+    }
+    decoded = compile_decoder(ChargePointConnectorStatus)(status)
+    assert decoded == ChargePointConnectorStatus.from_dict(status)
+    assert isinstance(decoded.total_consumption_kwh, float)
+    assert decoded.end_time is None
+
+
+def test_compile_decoder_is_cached():
+    assert compile_decoder(ChargingSession) is compile_decoder(ChargingSession)
+
+
+def test_as_utc():
+    assert as_utc(None) is None
+    assert as_utc(datetime(2024, 1, 1, 12)) == datetime(2024, 1, 1, 12, tzinfo=UTC)
+    cet = timezone(timedelta(hours=1))
+    converted = as_utc(datetime(2024, 1, 1, 12, tzinfo=cet))
+    assert converted.tzinfo is UTC
+    assert converted.hour == 11
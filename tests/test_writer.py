@@ -0,0 +1,93 @@
+import asyncio
+
+from chargeamps.writer import CoalescingWriter
+
+
+def test_changes_within_window_are_merged():
+    writes = []
+
+    async def write(key, changes):
+        writes.append((key, dict(changes)))
+
+    async def run():
+        writer = CoalescingWriter(write, 0.01)
+        await asyncio.gather(
+            writer.submit("a", mode="On"),
+            writer.submit("a", max_current=10),
+            writer.submit("b", mode="Off"),
+            writer.submit("a", max_current=16),
+        )
+
+    asyncio.run(run())
+    assert sorted(writes) == [("a", {"mode": "On", "max_current": 16}), ("b", {"mode": "Off"})]
+
+
+def test_writes_for_a_key_are_serialized():
+    active = 0
+    overlapping = False
+    writes = []
+
+    async def write(key, changes):
+        nonlocal active, overlapping
+        active += 1
+        overlapping = overlapping or active > 1
+        await asyncio.sleep(0.03)
+        writes.append(dict(changes))
+        active -= 1
+
+    async def run():
+        writer = CoalescingWriter(write, 0.01)
+        first = writer.submit("a", mode="On")
+        await asyncio.sleep(0.02)
+        # The first write is in flight, this one goes into the next write
+        second = writer.submit("a", mode="Off")
+        await asyncio.gather(first, second)
+
+    asyncio.run(run())
+    assert writes == [{"mode": "On"}, {"mode": "Off"}]
+    assert not overlapping
+
+
+def test_failure_is_raised_to_every_submitter():
+    async def write(key, changes):
+        raise RuntimeError("rejected")
+
+    async def run():
+        writer = CoalescingWriter(write, 0.01)
+        return await asyncio.gather(writer.submit("a", mode="On"), writer.submit("a", mode="Off"), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert len(results) == 2
+    for result in results:
+        assert isinstance(result, RuntimeError)
+
+
+def test_single_submit():
+    async def write(key, changes):
+        pass
+
+    async def run():
+        writer = CoalescingWriter(write, 0)
+        await asyncio.wait_for(writer.submit("a", mode="On"), 1)
+
+    asyncio.run(run())
+
+
+def test_cancel_drops_pending_changes():
+    writes = []
+
+    async def write(key, changes):
+        writes.append((key, dict(changes)))
+
+    async def run():
+        writer = CoalescingWriter(write, 0.01)
+        dropped = writer.submit("a", mode="On")
+        kept = writer.submit("b", mode="Off")
+        writer.cancel("a", RuntimeError("removed"))
+        writer.cancel("unknown", RuntimeError("removed"))
+        return await asyncio.gather(dropped, kept, return_exceptions=True)
+
+    dropped, kept = asyncio.run(run())
+    assert isinstance(dropped, RuntimeError)
+    assert kept is None
+    assert writes == [("b", {"mode": "Off"})]